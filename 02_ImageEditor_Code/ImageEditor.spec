@@ -6,29 +6,29 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=['PyQt5.QtCore', 'PyQt5.QtGui', 'PyQt5.QtWidgets', 'cv2', 'numpy', 'image_processor', 'image_processor.pixel_processing', 'image_processor.area_processing', 'image_processor.geometric_processing', 'image_processor.file_operations', 'image_processor.UI.settings_panel'],
+    hiddenimports=['PyQt5.QtCore', 'PyQt5.QtGui', 'PyQt5.QtWidgets', 'cv2', 'numpy', 'image_processor', 'image_processor.pixel_processing', 'image_processor.area_processing', 'image_processor.geometric_processing', 'image_processor.file_operations', 'image_processor.tracing', 'image_processor.conversion_cache', 'image_processor.buffer_pool', 'image_processor.pipeline', 'image_processor.video_processing', 'image_processor.session_store', 'image_processor.render_service', 'image_processor.render_worker', 'image_processor.memory_budget', 'image_processor.clahe', 'image_processor.median', 'image_processor.morphology', 'image_processor.blur', 'image_processor.warp', 'image_processor.UI.settings_panel', 'image_processor.UI.histogram_widget', 'image_processor.UI.memory_view'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    # 레거시 OpenCV UI와 사용하지 않는 GUI 툴킷은 패키지에 넣지 않음
+    excludes=['tkinter', 'image_processor.UI.components', 'image_processor.UI.layout', 'image_processor.UI.renderer', 'image_processor.UI.event_handler', 'image_processor.UI.text_cache'],
     noarchive=False,
     optimize=0,
 )
 pyz = PYZ(a.pure)
 
+# onedir 빌드: onefile은 실행할 때마다 임시 폴더에 압축을 풀어 시작이 수 초 걸림
+# UPX 압축도 실행 시 압축 해제 비용이 있으므로 사용하지 않음
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='ImageEditor',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
+    upx=False,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -36,3 +36,13 @@ exe = EXE(
     codesign_identity=None,
     entitlements_file=None,
 )
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='ImageEditor',
+)
@@ -0,0 +1,5 @@
+"""
+벤치마크 모듈
+편집기 전체 또는 처리 함수의 성능을 측정하는 스크립트 모음
+02_ImageEditor_Code 폴더에서 `python -m benchmarks.<이름>` 으로 실행
+"""
@@ -0,0 +1,81 @@
+"""
+블러 벤치마크
+반경별로 cv2.GaussianBlur(커널 2r+1) 한 번 호출과 블러 엔진(image_processor.blur)의
+처리 시간을 비교하고, 선택된 방식과 평균 오차를 출력
+
+사용법 (02_ImageEditor_Code 폴더에서):
+    python -m benchmarks.blur
+    python -m benchmarks.blur --sizes 1920x1080 --radii 5 20 200 --calibrate
+"""
+
+import argparse
+import json
+import time
+
+import cv2
+import numpy as np
+
+from benchmarks.common import make_synthetic_image, parse_size, summarize
+from image_processor.blur import BlurEngine
+
+
+def _time_ms(func, repeat):
+    """func를 repeat번 실행한 시간 목록 (ms)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def main(argv=None):
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description='블러 벤치마크')
+    parser.add_argument('--sizes', nargs='*', default=['6000x4000'], help='측정할 이미지 크기')
+    parser.add_argument('--radii', type=int, nargs='*', default=[1, 5, 10, 20, 50, 100, 200],
+                        help='블러 반경 (편집기 Blur 슬라이더 값)')
+    parser.add_argument('--gray', action='store_true', help='그레이스케일로 측정')
+    parser.add_argument('--calibrate', action='store_true', help='기본 비용 대신 이 컴퓨터에서 측정한 비용 사용')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수')
+    parser.add_argument('--json', help='결과를 저장할 JSON 경로')
+    args = parser.parse_args(argv)
+
+    engine = BlurEngine()
+    if args.calibrate:
+        # 측정한 비용표로 고르는 엔진 (편집기의 blur_engine은 항상 기본 비용표 사용)
+        engine = BlurEngine(engine.calibrate(channels=1 if args.gray else 3))
+    print('비용 (ns/요소):', {name: np.round(cost, 2).tolist() for name, cost in engine.costs.items()})
+    rows = []
+    print(f"{'size':<12}{'radius':>8}{'method':>9}{'cv2 ms':>10}{'engine ms':>11}{'mean err':>10}")
+    for text in args.sizes:
+        width, height = parse_size(text)
+        image = make_synthetic_image(width, height)
+        if args.gray:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        for radius in args.radii:
+            kernel_size = 2 * radius + 1
+            reference = cv2.GaussianBlur(image, (kernel_size, kernel_size), 0)
+            result = engine.apply(image, radius)
+            error = float(np.abs(result.astype(np.int16) - reference).mean())
+            row = {
+                'size': [width, height],
+                'radius': radius,
+                'method': engine.method(radius, image.shape),
+                'opencv_ms': summarize(_time_ms(
+                    lambda: cv2.GaussianBlur(image, (kernel_size, kernel_size), 0), args.repeat)),
+                'engine_ms': summarize(_time_ms(lambda: engine.apply(image, radius), args.repeat)),
+                'mean_error': error,
+            }
+            rows.append(row)
+            print(f"{text:<12}{radius:>8}{row['method']:>9}{row['opencv_ms']['p50']:>10.1f}"
+                  f"{row['engine_ms']['p50']:>11.1f}{error:>10.3f}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, indent=2)
+    return rows
+
+
+if __name__ == '__main__':
+    main()
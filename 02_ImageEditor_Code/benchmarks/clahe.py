@@ -0,0 +1,107 @@
+"""
+CLAHE 벤치마크
+OpenCV cv2.createCLAHE와 타일 병렬 CLAHE(image_processor.clahe)를 비교하여
+첫 처리, clip limit만 바꾼 재처리(히스토그램 캐시), 컬러 처리 시간과 최대 오차를 측정
+
+사용법 (02_ImageEditor_Code 폴더에서):
+    python -m benchmarks.clahe
+    python -m benchmarks.clahe --sizes 1920x1080 12000x8000 --repeat 3
+"""
+
+import argparse
+import json
+import time
+
+import cv2
+import numpy as np
+
+from benchmarks.common import make_synthetic_image, parse_size, summarize
+from image_processor import pixel_processing
+from image_processor.clahe import TiledCLAHE
+
+
+def _time_ms(func, repeat):
+    """func를 repeat번 실행한 시간 목록 (ms)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def _opencv_color(image, clip_limit, tiles):
+    """이전 방식의 컬러 CLAHE - YUV로 바꿔 Y 채널만 평활화"""
+    yuv = cv2.cvtColor(image, cv2.COLOR_BGR2YUV)
+    clahe = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=(tiles, tiles))
+    yuv[:, :, 0] = clahe.apply(yuv[:, :, 0])
+    return cv2.cvtColor(yuv, cv2.COLOR_YUV2BGR)
+
+
+def run_size(width, height, repeat, workers, clip_limit=2.0, tiles=8):
+    """크기 1개에 대한 측정 결과"""
+    image = make_synthetic_image(width, height)
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    engine = TiledCLAHE(workers=workers)
+    reference = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=(tiles, tiles))
+
+    expected = reference.apply(gray)
+    result = engine.apply(gray, clip_limit, (tiles, tiles), key='bench')
+    max_diff = int(cv2.absdiff(expected, result).max())
+    color_diff = int(cv2.absdiff(_opencv_color(image, clip_limit, tiles),
+                                 pixel_processing.apply_clahe(image, clip_limit, tiles)).max())
+
+    def first():
+        engine.clear()
+        engine.apply(gray, clip_limit, (tiles, tiles), key='bench')
+
+    clips = iter(np.linspace(1.0, 4.0, repeat + 1))
+
+    def clip_change():
+        # 같은 입력, 다른 clip limit - 타일 히스토그램 재사용
+        engine.apply(gray, float(next(clips)), (tiles, tiles), key='bench')
+
+    row = {
+        'size': [width, height],
+        'max_diff': max_diff,
+        'color_max_diff': color_diff,
+        'opencv_gray_ms': summarize(_time_ms(lambda: reference.apply(gray), repeat)),
+        'tiled_gray_ms': summarize(_time_ms(first, repeat)),
+        'clip_change_ms': summarize(_time_ms(clip_change, repeat)),
+        'opencv_color_ms': summarize(_time_ms(lambda: _opencv_color(image, clip_limit, tiles), repeat)),
+        'tiled_color_ms': summarize(_time_ms(
+            lambda: pixel_processing.apply_clahe(image, clip_limit, tiles), repeat)),
+    }
+    engine.clear()
+    return row
+
+
+def main(argv=None):
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description='CLAHE 벤치마크')
+    parser.add_argument('--sizes', nargs='*', default=['1920x1080', '4000x3000', '12000x8000'],
+                        help='측정할 이미지 크기')
+    parser.add_argument('--repeat', type=int, default=3, help='크기별 반복 횟수')
+    parser.add_argument('--workers', type=int, default=None, help='타일 스레드 수 (기본값: CPU 수)')
+    parser.add_argument('--json', help='결과를 저장할 JSON 경로')
+    args = parser.parse_args(argv)
+
+    rows = []
+    print(f"{'size':<12}{'cv2 gray':>10}{'tiled':>10}{'clip only':>11}"
+          f"{'cv2 color':>11}{'tiled':>10}{'max diff':>10}{'color diff':>12}")
+    for text in args.sizes:
+        width, height = parse_size(text)
+        row = run_size(width, height, args.repeat, args.workers)
+        rows.append(row)
+        print(f"{text:<12}{row['opencv_gray_ms']['p50']:>10.1f}{row['tiled_gray_ms']['p50']:>10.1f}"
+              f"{row['clip_change_ms']['p50']:>11.1f}{row['opencv_color_ms']['p50']:>11.1f}"
+              f"{row['tiled_color_ms']['p50']:>10.1f}{row['max_diff']:>10}{row['color_max_diff']:>12}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, indent=2)
+    return rows
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+벤치마크 공통 도구
+합성 이미지 생성, 크기 인자 파싱, 통계 요약, 메모리 측정 함수
+"""
+
+import math
+import os
+import sys
+
+import cv2
+import numpy as np
+
+
+def parse_size(text: str):
+    """'1920x1080' 형식의 문자열을 (width, height)로 변환"""
+    width, height = text.lower().split('x')
+    return int(width), int(height)
+
+
+def make_synthetic_image(width: int, height: int, seed: int = 0):
+    """그라디언트, 도형, 노이즈가 섞인 합성 BGR 이미지 생성
+
+    처리 함수들이 실제 사진과 비슷한 부하를 받도록 경계와 질감을 포함합니다.
+    """
+    rng = np.random.default_rng(seed)
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    image = np.empty((height, width, 3), dtype=np.uint8)
+    image[:, :, 0] = (x * 0.6 + y * 0.4).astype(np.uint8)
+    image[:, :, 1] = (255 - x * 0.5 - y * 0.3).astype(np.uint8)
+    image[:, :, 2] = ((x + y) * 0.5).astype(np.uint8)
+
+    # 도형
+    for _ in range(20):
+        center = (int(rng.integers(0, width)), int(rng.integers(0, height)))
+        radius = int(rng.integers(10, max(11, min(width, height) // 6)))
+        color = tuple(int(c) for c in rng.integers(0, 256, 3))
+        cv2.circle(image, center, radius, color, -1)
+
+    # 노이즈
+    noise = rng.integers(-12, 13, size=image.shape, dtype=np.int16)
+    return np.clip(image.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+
+
+def write_synthetic_images(directory: str, sizes, seed: int = 0):
+    """합성 이미지들을 PNG로 저장하고 경로 목록 반환"""
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+    paths = []
+    for i, (width, height) in enumerate(sizes):
+        path = os.path.join(directory, f"synthetic_{i:02d}_{width}x{height}.png")
+        cv2.imwrite(path, make_synthetic_image(width, height, seed + i))
+        paths.append(path)
+    return paths
+
+
+def percentile(sorted_values, p):
+    """정렬된 값 목록의 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(p / 100.0 * len(sorted_values)) - 1
+    return sorted_values[max(0, min(rank, len(sorted_values) - 1))]
+
+
+def summarize(values):
+    """값 목록의 count/mean/p50/p95/p99/max 요약"""
+    ordered = sorted(values)
+    return {
+        'count': len(ordered),
+        'mean': sum(ordered) / len(ordered) if ordered else 0.0,
+        'p50': percentile(ordered, 50),
+        'p95': percentile(ordered, 95),
+        'p99': percentile(ordered, 99),
+        'max': ordered[-1] if ordered else 0.0,
+    }
+
+
+def format_bytes(num_bytes: float) -> str:
+    """바이트 수를 읽기 쉬운 문자열로 변환"""
+    sign = '-' if num_bytes < 0 else ''
+    value = abs(num_bytes)
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if value < 1024 or unit == 'GB':
+            return f"{sign}{value:.1f} {unit}" if unit != 'B' else f"{sign}{int(value)} B"
+        value /= 1024.0
+
+
+def current_rss() -> int:
+    """현재 프로세스의 상주 메모리(RSS) 바이트 수 (Linux: /proc, 그 외: psutil)"""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        return 0
+
+
+def peak_rss() -> int:
+    """프로세스 시작 이후 최대 RSS 바이트 수"""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS는 바이트, Linux는 KB 단위
+        return peak if sys.platform == 'darwin' else peak * 1024
+    except ImportError:
+        try:
+            import psutil
+            return psutil.Process().memory_info().peak_wset
+        except (ImportError, AttributeError):
+            return 0
@@ -0,0 +1,223 @@
+"""
+GUI 상호작용 재생 벤치마크
+QT_QPA_PLATFORM=offscreen 환경에서 ImageEditor를 띄우고, 기록된 상호작용
+스크립트(슬라이더 드래그, 토글, 되돌리기/앞으로 돌리기, 파일 전환)를
+실제 Qt 시그널 경로로 재생하여 입력-화면 지연 분포와 전체 시간을 측정
+
+사용법 (02_ImageEditor_Code 폴더에서):
+    python -m benchmarks.gui_replay
+    python -m benchmarks.gui_replay --size 4000x3000 --scripts rotation_drag blur_drag
+    python -m benchmarks.gui_replay --script-file my_script.json --json result.json
+    python -m benchmarks.gui_replay --render-worker   # 처리를 렌더 워커 프로세스에서
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+# 디스플레이 서버 없이 실행 (PyQt5 import 전에 설정)
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+
+from benchmarks.common import parse_size, summarize, write_synthetic_images
+
+
+def _drag(key, start, stop, step):
+    """슬라이더 드래그 단계 생성"""
+    return {'op': 'drag', 'key': key, 'values': list(range(start, stop + 1, step))}
+
+
+# 기록된 상호작용 스크립트
+# op: drag(슬라이더 드래그), toggle(토글 버튼), undo/redo(count회), file(파일 전환), reset
+SCRIPTS = {
+    'rotation_drag': [
+        _drag('rotation', 0, 90, 3),
+        _drag('rotation', 90, 0, -5),
+    ],
+    'blur_drag': [
+        _drag('blur', 0, 20, 1),
+        _drag('blur', 20, 0, -2),
+    ],
+    'toggles': [
+        {'op': 'toggle', 'key': 'grayscale'},
+        {'op': 'toggle', 'key': 'flip_h'},
+        {'op': 'toggle', 'key': 'flip_v'},
+        {'op': 'toggle', 'key': 'invert'},
+        {'op': 'toggle', 'key': 'grayscale'},
+        {'op': 'toggle', 'key': 'flip_h'},
+        {'op': 'toggle', 'key': 'flip_v'},
+        {'op': 'toggle', 'key': 'invert'},
+    ],
+    'undo_redo_burst': [
+        _drag('brightness', 100, 160, 6),
+        {'op': 'undo', 'count': 10},
+        {'op': 'redo', 'count': 10},
+        {'op': 'undo', 'count': 5},
+        {'op': 'redo', 'count': 5},
+    ],
+    'file_switch': [
+        {'op': 'file', 'index': 1},
+        {'op': 'file', 'index': 0},
+        {'op': 'file', 'index': 1},
+        {'op': 'file', 'index': 0},
+    ],
+    'mixed': [
+        _drag('contrast', 100, 150, 5),
+        {'op': 'toggle', 'key': 'grayscale'},
+        _drag('blur', 0, 6, 1),
+        _drag('rotation', 0, 45, 5),
+        {'op': 'undo', 'count': 4},
+        {'op': 'reset'},
+    ],
+}
+
+
+class ReplayHarness:
+    """상호작용 재생기 (단일 책임: 스크립트 재생 및 지연 수집)"""
+
+    def __init__(self, app, editor, timeout_s: float = 10.0):
+        self.app = app
+        self.editor = editor
+        self.timeout_s = timeout_s
+        self.monitor = editor.latency_monitor
+        self.sliders = editor.settings_panel.get_sliders()
+        self.buttons = editor.settings_panel.get_toggle_buttons()
+
+    def _wait_for_paint(self, sample_count):
+        """페인트가 완료되어 새 지연 샘플이 기록될 때까지 이벤트 처리"""
+        deadline = time.perf_counter() + self.timeout_s
+        while len(self.monitor.samples) <= sample_count:
+            self.app.processEvents()
+            if time.perf_counter() > deadline:
+                return False
+        return True
+
+    def _run_action(self, action, label=None):
+        """단일 동작 실행 후 페인트 대기 - 성공 여부 반환"""
+        before = len(self.monitor.samples)
+        if label is not None:
+            # SettingsPanel을 거치지 않는 동작은 직접 입력 시점 기록
+            self.monitor.mark_input(label)
+        action()
+        return self._wait_for_paint(before)
+
+    def run_step(self, step):
+        """스크립트 단계 1개 실행"""
+        op = step['op']
+        if op == 'drag':
+            slider = self.sliders[step['key']]
+            slider.setSliderDown(True)
+            for value in step['values']:
+                if value == slider.value():
+                    continue
+                self._run_action(lambda v=value: slider.setSliderPosition(v))
+            # 놓기 (sliderReleased 시그널 발생)
+            slider.setSliderDown(False)
+            self.app.processEvents()
+        elif op == 'toggle':
+            self._run_action(self.buttons[step['key']].click)
+        elif op in ('undo', 'redo'):
+            button = (self.editor.file_settings.get_undo_button() if op == 'undo'
+                      else self.editor.file_settings.get_redo_button())
+            can_do = (self.editor.history_manager.can_undo if op == 'undo'
+                      else self.editor.history_manager.can_redo)
+            for _ in range(step.get('count', 1)):
+                # 불가능할 때 뜨는 모달 메시지 박스를 피하기 위해 미리 확인
+                if not can_do():
+                    break
+                self._run_action(button.click, label=op)
+        elif op == 'file':
+            index = step['index'] % max(1, self.editor.file_list.count())
+            item = self.editor.file_list.item(index)
+            self._run_action(lambda: self.editor.file_list.itemClicked.emit(item), label='file')
+        elif op == 'reset':
+            self._run_action(self.editor.settings_panel.get_reset_button().click)
+        else:
+            raise ValueError(f"알 수 없는 동작: {op}")
+
+    def run_script(self, name, steps):
+        """스크립트 전체 재생 - 지연 통계와 전체 시간 반환"""
+        self.monitor.reset()
+        start = time.perf_counter()
+        for step in steps:
+            self.run_step(step)
+        wall_s = time.perf_counter() - start
+        result = summarize([latency for _, latency in self.monitor.samples])
+        result['script'] = name
+        result['wall_s'] = wall_s
+        result['stalls'] = len(self.monitor.stalls)
+        return result
+
+
+def main(argv=None):
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description='ImageEditor GUI 상호작용 재생 벤치마크')
+    parser.add_argument('--size', default='1920x1080', help='합성 이미지 크기 (예: 4000x3000)')
+    parser.add_argument('--files', type=int, default=2, help='합성 이미지 개수')
+    parser.add_argument('--scripts', nargs='*', default=list(SCRIPTS),
+                        help=f"재생할 내장 스크립트 ({', '.join(SCRIPTS)})")
+    parser.add_argument('--script-file', help='JSON 스크립트 파일 ({이름: [단계, ...]})')
+    parser.add_argument('--repeat', type=int, default=1, help='스크립트 반복 횟수')
+    parser.add_argument('--render-worker', action='store_true',
+                        help='렌더 워커 프로세스에서 처리 (기본: GUI 프로세스에서 처리)')
+    parser.add_argument('--json', help='결과를 저장할 JSON 경로')
+    args = parser.parse_args(argv)
+
+    scripts = {name: SCRIPTS[name] for name in args.scripts}
+    if args.script_file:
+        with open(args.script_file, encoding='utf-8') as f:
+            scripts.update(json.load(f))
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    # main.py의 ImageEditor를 그대로 사용
+    import main as editor_main
+
+    width, height = parse_size(args.size)
+    results = []
+    with tempfile.TemporaryDirectory(prefix='image_editor_bench_') as images_dir:
+        write_synthetic_images(images_dir, [(width, height)] * args.files)
+        editor = editor_main.ImageEditor(images_dir=images_dir)
+        editor.show()
+        if args.render_worker:
+            # 워커 준비(미리 실행)가 끝난 뒤 측정
+            editor.start_render_worker()
+            deadline = time.perf_counter() + 60
+            while not editor.render_worker.ready and time.perf_counter() < deadline:
+                app.processEvents()
+                time.sleep(0.01)
+        editor.scan_image_files()  # 시작 작업(백그라운드 스캔/세션 복원) 대신 바로 스캔
+        editor.load_image(editor.image_files[0])
+        editor.file_list.setCurrentRow(0)
+        app.processEvents()
+        editor.latency_monitor.start(overlay=False)
+
+        harness = ReplayHarness(app, editor)
+        total_start = time.perf_counter()
+        for _ in range(args.repeat):
+            for name, steps in scripts.items():
+                results.append(harness.run_script(name, steps))
+        total_s = time.perf_counter() - total_start
+        editor.latency_monitor.stop()
+        editor.close()
+
+    mode = '렌더 워커' if args.render_worker else 'GUI 프로세스'
+    print(f"이미지 {width}x{height}, 파일 {args.files}개, 반복 {args.repeat}회, 처리: {mode}")
+    print(f"{'script':<18}{'n':>5}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}{'wall(s)':>10}")
+    for r in results:
+        print(f"{r['script']:<18}{r['count']:>5}{r['p50']:>9.1f}{r['p95']:>9.1f}"
+              f"{r['p99']:>9.1f}{r['max']:>9.1f}{r['wall_s']:>10.2f}")
+    print(f"전체 시간: {total_s:.2f} s (지연 단위: ms)")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'size': [width, height], 'total_s': total_s, 'results': results}, f, indent=2)
+    return results
+
+
+if __name__ == '__main__':
+    main()
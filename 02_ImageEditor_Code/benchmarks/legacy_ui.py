@@ -0,0 +1,129 @@
+"""
+레거시 OpenCV UI 렌더링 벤치마크
+매 프레임 새 캔버스에 전체를 다시 그리는 방식(immediate)과
+유지 캔버스에 바뀐 영역만 다시 그리는 방식(retained, UIRenderer.render)의
+프레임당 시간을 장면별로 비교
+
+사용법 (02_ImageEditor_Code 폴더에서):
+    python -m benchmarks.legacy_ui
+    python -m benchmarks.legacy_ui --size 4000x3000 --frames 300
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from benchmarks.common import make_synthetic_image, parse_size, summarize
+from image_processor.UI.constants import UIConstants
+from image_processor.UI.event_handler import EventHandler
+from image_processor.UI.layout import LayoutManager
+from image_processor.UI.renderer import UIRenderer
+
+
+class LegacyScene:
+    """레거시 UI 장면 (레이아웃, 컴포넌트, 표시 상태)"""
+
+    def __init__(self, image):
+        self.layout = LayoutManager()
+        self.tabs = self.layout.create_tabs()
+        self.file_list = self.layout.create_file_list()
+        self.files = [f'image_{i:03d}.png' for i in range(40)]
+        self.file_list.set_files(self.files[:20])
+        self.settings_panel = self.layout.create_settings_panel()
+        self.dropdown_menu = self.layout.create_dropdown_menu('Pixel', self.tabs['Pixel'].x, UIConstants.PADDING)
+        self.events = EventHandler(self.layout, self.tabs, self.file_list,
+                                   self.settings_panel, self.dropdown_menu)
+        self.active_tab = 'Pixel'
+        self.image = image
+        self.file_info = 'File: image_000.png | Extension: .PNG | Size: 1.0 MB'
+
+    def render_immediate(self):
+        """이전 방식: 새 캔버스를 만들고 이미지 축소를 포함해 전부 다시 그림"""
+        renderer = UIRenderer(self.layout)  # 캐시 없이 매번 새로 (이전 동작)
+        canvas = np.full((UIConstants.WINDOW_HEIGHT, UIConstants.WINDOW_WIDTH, 3),
+                         UIConstants.COLOR_BG, dtype=np.uint8)
+        renderer.draw_top_bar(canvas)
+        renderer.draw_info_bar(canvas, self.file_info)
+        renderer.draw_tabs(canvas, self.tabs, self.active_tab)
+        renderer.draw_file_list(canvas, self.file_list)
+        renderer.draw_image(canvas, self.image)
+        renderer.draw_settings_panel(canvas, self.settings_panel, self.active_tab)
+        renderer.draw_dropdown_menu(canvas, self.dropdown_menu)
+        return canvas
+
+    def render_retained(self, renderer):
+        """유지 캔버스에 바뀐 영역만 다시 그림"""
+        return renderer.render(self.tabs, self.active_tab, self.file_list, self.settings_panel,
+                               self.dropdown_menu, self.image, self.file_info)
+
+
+# 장면별 프레임 사이 상태 변화 (scene, frame 번호)
+SCENARIOS = {
+    'idle': lambda scene, i: None,
+    'slider_label': lambda scene, i: scene.events.update_trackbar_labels({'brightness': i % 200}),
+    'file_select': lambda scene, i: setattr(scene.file_list, 'selected_index', i % 20),
+    'file_scroll': lambda scene, i: scene.file_list.set_files(scene.files[i % 20:i % 20 + 20]),
+    'menu_toggle': lambda scene, i: setattr(scene.dropdown_menu, 'is_visible', i % 2 == 0),
+    'button_toggle': lambda scene, i: scene.events.update_button_state('grayscale', i % 2 == 0),
+    'tab_switch': lambda scene, i: setattr(scene, 'active_tab', UIConstants.TABS[i % len(UIConstants.TABS)]),
+}
+
+
+def run_scenario(name, image, frames):
+    """장면 하나를 두 방식으로 실행하여 프레임 시간(ms)과 다시 그린 면적 비율 반환"""
+    update = SCENARIOS[name]
+    result = {}
+    for mode in ('immediate', 'retained'):
+        scene = LegacyScene(image)
+        renderer = UIRenderer(scene.layout)
+        scene.render_retained(renderer)  # 첫 프레임(전체 그리기)은 제외
+        times = []
+        areas = []
+        for i in range(frames):
+            update(scene, i)
+            start = time.perf_counter()
+            if mode == 'immediate':
+                scene.render_immediate()
+            else:
+                scene.render_retained(renderer)
+                areas.append(sum(w * h for _, _, w, h in renderer.last_dirty_rects))
+            times.append((time.perf_counter() - start) * 1000.0)
+        result[mode] = summarize(times)
+        if areas:
+            result['redraw_ratio'] = sum(areas) / len(areas) / (UIConstants.WINDOW_WIDTH * UIConstants.WINDOW_HEIGHT)
+    return result
+
+
+def main(argv=None):
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description='레거시 OpenCV UI 렌더링 벤치마크')
+    parser.add_argument('--size', default='4000x3000', help='표시할 이미지 크기')
+    parser.add_argument('--frames', type=int, default=200, help='장면별 프레임 수')
+    parser.add_argument('--scenarios', nargs='*', default=list(SCENARIOS), choices=list(SCENARIOS))
+    parser.add_argument('--json', help='결과를 저장할 JSON 경로')
+    args = parser.parse_args(argv)
+
+    width, height = parse_size(args.size)
+    image = make_synthetic_image(width, height)
+    report = {'size': [width, height], 'frames': args.frames, 'scenarios': {}}
+
+    print(f"이미지 {width}x{height}, 캔버스 {UIConstants.WINDOW_WIDTH}x{UIConstants.WINDOW_HEIGHT}, "
+          f"장면별 {args.frames} 프레임 (p50 / p95 ms)")
+    print(f"{'장면':<16}{'immediate':>20}{'retained':>20}{'다시 그린 면적':>16}")
+    for name in args.scenarios:
+        result = run_scenario(name, image, args.frames)
+        report['scenarios'][name] = result
+        immediate, retained = result['immediate'], result['retained']
+        print(f"{name:<16}{immediate['p50']:>11.2f} / {immediate['p95']:<6.2f}"
+              f"{retained['p50']:>11.3f} / {retained['p95']:<6.3f}{result['redraw_ratio'] * 100:>13.1f} %")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+if __name__ == '__main__':
+    main()
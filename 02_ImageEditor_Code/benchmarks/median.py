@@ -0,0 +1,74 @@
+"""
+미디언 필터 벤치마크
+커널 크기별로 cv2.medianBlur 한 번 호출과 띠 분할 미디언 필터(image_processor.median)의
+처리 시간을 비교하고 결과가 같은지 확인
+
+사용법 (02_ImageEditor_Code 폴더에서):
+    python -m benchmarks.median
+    python -m benchmarks.median --sizes 4000x3000 --kernels 5 31 101 --workers 8
+"""
+
+import argparse
+import json
+import time
+
+import cv2
+import numpy as np
+
+from benchmarks.common import make_synthetic_image, parse_size, summarize
+from image_processor.median import MedianFilter
+
+
+def _time_ms(func, repeat):
+    """func를 repeat번 실행한 시간 목록 (ms)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def main(argv=None):
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description='미디언 필터 벤치마크')
+    parser.add_argument('--sizes', nargs='*', default=['1920x1080', '4000x3000'], help='측정할 이미지 크기')
+    parser.add_argument('--kernels', type=int, nargs='*', default=[3, 5, 7, 15, 31, 63, 101],
+                        help='커널 크기 (홀수)')
+    parser.add_argument('--gray', action='store_true', help='그레이스케일로 측정 (스캔 문서 등)')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수')
+    parser.add_argument('--workers', type=int, default=None, help='띠 처리 스레드 수 (기본값: CPU 수)')
+    parser.add_argument('--json', help='결과를 저장할 JSON 경로')
+    args = parser.parse_args(argv)
+
+    median = MedianFilter(workers=args.workers)
+    rows = []
+    print(f"스레드 {median.workers}")
+    print(f"{'size':<12}{'kernel':>8}{'bands':>7}{'cv2 ms':>10}{'median ms':>11}{'same':>6}")
+    for text in args.sizes:
+        width, height = parse_size(text)
+        image = make_synthetic_image(width, height)
+        if args.gray:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        for kernel_size in args.kernels:
+            same = bool(np.array_equal(cv2.medianBlur(image, kernel_size), median.apply(image, kernel_size)))
+            row = {
+                'size': [width, height],
+                'kernel': kernel_size,
+                'bands': len(median._bands(image.shape, kernel_size)),
+                'opencv_ms': summarize(_time_ms(lambda: cv2.medianBlur(image, kernel_size), args.repeat)),
+                'median_ms': summarize(_time_ms(lambda: median.apply(image, kernel_size), args.repeat)),
+                'same': same,
+            }
+            rows.append(row)
+            print(f"{text:<12}{kernel_size:>8}{row['bands']:>7}"
+                  f"{row['opencv_ms']['p50']:>10.1f}{row['median_ms']['p50']:>11.1f}{str(same):>6}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, indent=2)
+    return rows
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,307 @@
+"""
+메모리 사용량 벤치마크 및 누수 감지
+1) 처리 함수별/이미지 크기별 할당량 (tracemalloc, NumPy 할당 블록)
+2) ImageEditor와 FileManager를 대상으로 긴 무작위 편집 세션을 실행하여
+   최대/정상 상태 RSS를 추적하고 임계값을 넘는 증가를 누수로 표시
+
+사용법 (02_ImageEditor_Code 폴더에서):
+    python -m benchmarks.memory_session
+    python -m benchmarks.memory_session --mode ops --sizes 1920x1080 6000x4000
+    python -m benchmarks.memory_session --mode session --steps 3000 --threshold-mb 64
+    python -m benchmarks.memory_session --mode session --session-size 4000x3000 --memory-limit-mb 512
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# 디스플레이 서버 없이 실행 (PyQt5 import 전에 설정)
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+import numpy as np
+
+from benchmarks.common import (current_rss, format_bytes, make_synthetic_image,
+                               parse_size, peak_rss, write_synthetic_images)
+from image_processor import pixel_processing, area_processing, geometric_processing, file_operations
+from image_processor.memory_budget import memory_budget
+
+# NumPy 배열 버퍼가 tracemalloc에 보고되는 도메인
+NUMPY_DOMAIN = np.lib.tracemalloc_domain
+
+
+# 측정 대상 처리 함수 (이름, 함수)
+OPERATIONS = [
+    ('grayscale', lambda img: pixel_processing.to_grayscale(img)),
+    ('brightness', lambda img: pixel_processing.apply_brightness(img, 140)),
+    ('contrast', lambda img: pixel_processing.apply_contrast(img, 130)),
+    ('invert', lambda img: pixel_processing.apply_invert(img)),
+    ('threshold', lambda img: pixel_processing.apply_threshold(img, 100)),
+    ('gamma', lambda img: pixel_processing.apply_gamma(img, 1.8)),
+    ('equalize', lambda img: pixel_processing.apply_histogram_equalization(img)),
+    ('blur', lambda img: area_processing.apply_blur(img, 5)),
+    ('canny', lambda img: area_processing.apply_canny(img, 60, 160)),
+    ('median', lambda img: area_processing.apply_median_blur(img, 5)),
+    ('sharpen', lambda img: area_processing.apply_sharpen(img, 1.0)),
+    ('morphology', lambda img: area_processing.apply_morphology(img, 'open', 5)),
+    ('rotation', lambda img: geometric_processing.apply_rotation(img, 30)),
+    ('flip_h', lambda img: geometric_processing.apply_flip_horizontal(img)),
+    ('resize_50', lambda img: geometric_processing.apply_resize(img, scale=0.5)),
+    ('translate', lambda img: geometric_processing.apply_translate(img, 40, 25)),
+]
+
+
+def _numpy_blocks(snapshot):
+    """스냅샷에서 NumPy 도메인의 (블록 수, 바이트) 합계"""
+    traces = snapshot.filter_traces([tracemalloc.DomainFilter(True, NUMPY_DOMAIN)]).traces
+    return len(traces), sum(trace.size for trace in traces)
+
+
+def measure_operation(func, image, repeat: int = 5):
+    """처리 함수 1개의 할당량 측정
+
+    Returns:
+        dict: transient(호출 중 최대 추가 할당), retained(호출 후 남은 할당),
+              numpy_blocks(호출 후 남은 NumPy 블록 수), ms(평균 시간)
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base_current, _ = tracemalloc.get_traced_memory()
+        base_blocks, _ = _numpy_blocks(tracemalloc.take_snapshot())
+        transient = 0
+        results = []
+        start = time.perf_counter()
+        for _ in range(repeat):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            results.append(func(image))
+            _, peak = tracemalloc.get_traced_memory()
+            transient = max(transient, peak - before)
+        elapsed_ms = (time.perf_counter() - start) * 1000 / repeat
+        # 마지막 결과 1개만 유지한 상태로 잔여량 측정
+        last = results[-1]
+        results = None
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+        blocks, _ = _numpy_blocks(tracemalloc.take_snapshot())
+        del last
+    finally:
+        tracemalloc.stop()
+    return {
+        'transient': transient,
+        'retained': current - base_current,
+        'numpy_blocks': blocks - base_blocks,
+        'ms': elapsed_ms,
+    }
+
+
+def run_operations(sizes, repeat):
+    """처리 함수별/이미지 크기별 할당량 표 출력"""
+    rows = []
+    for width, height in sizes:
+        image = make_synthetic_image(width, height)
+        print(f"\n[{width}x{height}] 입력 {format_bytes(image.nbytes)}")
+        print(f"{'operation':<12}{'transient':>12}{'retained':>12}{'np blocks':>11}{'x input':>9}{'ms':>9}")
+        for name, func in OPERATIONS:
+            r = measure_operation(func, image, repeat)
+            r.update({'operation': name, 'size': [width, height], 'input_bytes': image.nbytes})
+            rows.append(r)
+            print(f"{name:<12}{format_bytes(r['transient']):>12}{format_bytes(r['retained']):>12}"
+                  f"{r['numpy_blocks']:>11}{r['transient'] / image.nbytes:>9.2f}{r['ms']:>9.1f}")
+    return rows
+
+
+def _random_step(rng, editor, sliders, buttons):
+    """무작위 편집 동작 1개 실행 - 동작 종류 반환"""
+    roll = rng.random()
+    if roll < 0.70:
+        # 슬라이더 틱 (편집 세션의 대부분)
+        key = rng.choice(list(sliders))
+        slider = sliders[key]
+        value = min(slider.maximum(), max(slider.minimum(),
+                                          slider.value() + rng.randint(-8, 8)))
+        slider.setValue(value)
+        return 'tick'
+    if roll < 0.80:
+        buttons[rng.choice(list(buttons))].click()
+        return 'toggle'
+    if roll < 0.90:
+        if rng.random() < 0.5 and editor.history_manager.can_undo():
+            editor.on_undo_clicked()
+        elif editor.history_manager.can_redo():
+            editor.on_redo_clicked()
+        return 'history'
+    if roll < 0.97:
+        index = rng.randrange(max(1, len(editor.image_files)))
+        editor.load_image(editor.image_files[index])
+        return 'file'
+    editor.on_reset_clicked()
+    return 'reset'
+
+
+def run_session(size, files, steps, sample_every, threshold_mb, seed):
+    """ImageEditor 무작위 편집 세션 실행 및 RSS 증가 감지"""
+    from PyQt5.QtWidgets import QApplication
+    import main as editor_main
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    rng = random.Random(seed)
+    width, height = size
+    samples = []
+    tick_bytes = []
+
+    with tempfile.TemporaryDirectory(prefix='image_editor_mem_') as images_dir:
+        write_synthetic_images(images_dir, [(width, height)] * files, seed)
+        editor = editor_main.ImageEditor(images_dir=images_dir)
+        editor.show()
+        editor.scan_image_files()  # 시작 작업(백그라운드 스캔/세션 복원) 대신 바로 스캔
+        editor.load_image(editor.image_files[0])
+        app.processEvents()
+        sliders = editor.settings_panel.get_sliders()
+        buttons = editor.settings_panel.get_toggle_buttons()
+
+        # 슬라이더 1틱당 할당 바이트는 tracemalloc으로 표본 측정 (비용이 커서 일부만)
+        start_rss = current_rss()
+        start = time.perf_counter()
+        for step in range(steps):
+            measure_tick = step % sample_every == 0
+            if measure_tick:
+                tracemalloc.start()
+                tracemalloc.reset_peak()
+            kind = _random_step(rng, editor, sliders, buttons)
+            app.processEvents()
+            if measure_tick:
+                current, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                if kind == 'tick':
+                    tick_bytes.append(peak)
+                samples.append((step, current_rss()))
+        elapsed = time.perf_counter() - start
+        history_bytes = sum(img.nbytes for img in editor.file_manager.history)
+        history_count = len(editor.file_manager.history)
+        budget_usage = memory_budget.usage()
+        editor.close()
+
+    # 히스토리가 가득 찬 이후(앞 25%를 워밍업으로 제외)를 정상 상태로 간주
+    warm = samples[len(samples) // 4:]
+    steady = [rss for _, rss in warm]
+    growth = steady[-1] - steady[0] if steady else 0
+    slope = _slope(warm)
+    leak = growth > threshold_mb * 1024 * 1024
+
+    print(f"\n[세션] {width}x{height}, 파일 {files}개, {steps} 단계, {elapsed:.1f} s")
+    print(f"시작 RSS {format_bytes(start_rss)} | 최대 RSS {format_bytes(peak_rss())} | "
+          f"정상 상태 RSS {format_bytes(min(steady))} ~ {format_bytes(max(steady))}")
+    print(f"정상 상태 증가 {format_bytes(growth)} (기울기 {format_bytes(slope * 1000)}/1000단계) | "
+          f"히스토리 {format_bytes(history_bytes)} ({history_count}개)")
+    print(f"메모리 예산 {format_bytes(sum(budget_usage.values()))} / {format_bytes(memory_budget.limit_bytes)}, "
+          f"제거 {memory_budget.evictions}회 ({format_bytes(memory_budget.evicted_bytes)}) | "
+          + ', '.join(f"{name} {format_bytes(n)}" for name, n in budget_usage.items()))
+    if tick_bytes:
+        print(f"슬라이더 1틱당 할당(최대 동시 할당) 평균 {format_bytes(sum(tick_bytes) / len(tick_bytes))}, "
+              f"입력 대비 {sum(tick_bytes) / len(tick_bytes) / (width * height * 3):.2f}배")
+    print(f"누수 판정: {'증가 감지 (임계값 ' + str(threshold_mb) + ' MB 초과)' if leak else '정상'}")
+
+    return {
+        'size': [width, height],
+        'steps': steps,
+        'start_rss': start_rss,
+        'peak_rss': peak_rss(),
+        'steady_min': min(steady),
+        'steady_max': max(steady),
+        'growth': growth,
+        'slope_per_step': slope,
+        'bytes_per_tick': sum(tick_bytes) / len(tick_bytes) if tick_bytes else 0,
+        'history_bytes': history_bytes,
+        'history_count': history_count,
+        'budget_usage': budget_usage,
+        'budget_limit': memory_budget.limit_bytes,
+        'evictions': memory_budget.evictions,
+        'leak': leak,
+    }
+
+
+def run_file_manager_session(size, steps, threshold_mb, seed):
+    """FileManager 히스토리 단독 세션 - 추가/되돌리기/앞으로 돌리기 반복 후 증가 감지"""
+    rng = random.Random(seed)
+    width, height = size
+    image = make_synthetic_image(width, height, seed)
+    manager = file_operations.FileManager()
+    memory_budget.register('history', manager)
+    history = file_operations.HistoryManager(manager)
+    rss = []
+    for step in range(steps):
+        roll = rng.random()
+        if roll < 0.7:
+            manager.add_to_history(image)
+        elif roll < 0.85:
+            history.undo()
+        else:
+            history.redo()
+        if step % 50 == 0:
+            rss.append(current_rss())
+    warm = rss[len(rss) // 4:]
+    growth = warm[-1] - warm[0] if warm else 0
+    leak = growth > threshold_mb * 1024 * 1024
+    print(f"\n[FileManager] {steps} 단계, 히스토리 {len(manager.history)}개 "
+          f"({format_bytes(sum(img.nbytes for img in manager.history))}), "
+          f"정상 상태 증가 {format_bytes(growth)} -> {'증가 감지' if leak else '정상'}")
+    return {'steps': steps, 'growth': growth, 'leak': leak}
+
+
+def _slope(samples):
+    """(단계, RSS) 표본의 최소제곱 기울기 (바이트/단계)"""
+    if len(samples) < 2:
+        return 0.0
+    xs = np.array([s for s, _ in samples], dtype=np.float64)
+    ys = np.array([r for _, r in samples], dtype=np.float64)
+    return float(np.polyfit(xs, ys, 1)[0])
+
+
+def main(argv=None):
+    """벤치마크 실행 - 누수가 감지되면 종료 코드 1"""
+    parser = argparse.ArgumentParser(description='메모리 사용량 벤치마크 및 누수 감지')
+    parser.add_argument('--mode', choices=['ops', 'session', 'all'], default='all')
+    parser.add_argument('--sizes', nargs='*', default=['640x480', '1920x1080', '4000x3000'],
+                        help='처리 함수 측정용 이미지 크기')
+    parser.add_argument('--repeat', type=int, default=3, help='처리 함수별 반복 횟수')
+    parser.add_argument('--session-size', default='1920x1080', help='세션용 이미지 크기')
+    parser.add_argument('--files', type=int, default=3, help='세션용 합성 이미지 개수')
+    parser.add_argument('--steps', type=int, default=1500, help='세션 단계 수')
+    parser.add_argument('--sample-every', type=int, default=10, help='RSS/할당 표본 간격 (단계)')
+    parser.add_argument('--threshold-mb', type=float, default=64.0, help='누수 판정 임계값 (MB)')
+    parser.add_argument('--memory-limit-mb', type=float,
+                        help='메모리 예산 한도 (MB, 기본: 시스템 메모리의 25%%)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help='결과를 저장할 JSON 경로')
+    args = parser.parse_args(argv)
+
+    if args.memory_limit_mb is not None:
+        memory_budget.limit_bytes = int(args.memory_limit_mb * 1024 * 1024)
+
+    report = {}
+    if args.mode in ('ops', 'all'):
+        report['operations'] = run_operations([parse_size(s) for s in args.sizes], args.repeat)
+    if args.mode in ('session', 'all'):
+        size = parse_size(args.session_size)
+        report['session'] = run_session(size, args.files, args.steps, args.sample_every,
+                                        args.threshold_mb, args.seed)
+        report['file_manager'] = run_file_manager_session(size, args.steps,
+                                                          args.threshold_mb, args.seed)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    leak = any(report.get(k, {}).get('leak') for k in ('session', 'file_manager'))
+    return 1 if leak else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
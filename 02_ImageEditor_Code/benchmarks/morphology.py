@@ -0,0 +1,90 @@
+"""
+모폴로지 벤치마크
+구조 요소 모양/크기별로 cv2.morphologyEx와 apply_morphology(큰 타원/십자 선분 분해)의
+처리 시간을 비교하고 결과가 같은지 확인
+
+사용법 (02_ImageEditor_Code 폴더에서):
+    python -m benchmarks.morphology
+    python -m benchmarks.morphology --size 1920x1080 --shapes ellipse --kernels 21 51 101 --color
+"""
+
+import argparse
+import json
+import time
+
+import cv2
+import numpy as np
+
+from benchmarks.common import make_synthetic_image, parse_size, summarize
+from image_processor import area_processing
+from image_processor.morphology import SHAPES, morphology_method
+
+
+def _time_ms(func, repeat):
+    """func를 repeat번 실행한 시간 목록 (ms)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def make_mask(width, height, seed=0):
+    """얼룩이 있는 이진 마스크 (0/255)"""
+    gray = cv2.cvtColor(make_synthetic_image(width, height, seed), cv2.COLOR_BGR2GRAY)
+    _, mask = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    return mask
+
+
+def main(argv=None):
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description='모폴로지 벤치마크')
+    parser.add_argument('--size', default='3840x2160', help='이미지 크기')
+    parser.add_argument('--shapes', nargs='*', default=list(SHAPES), help='구조 요소 모양')
+    parser.add_argument('--kernels', type=int, nargs='*', default=[5, 21, 51, 101], help='커널 크기 (홀수)')
+    parser.add_argument('--operation', default='open', help='연산 (open, close, erode, ...)')
+    parser.add_argument('--iterations', type=int, default=1, help='반복 횟수')
+    parser.add_argument('--color', action='store_true', help='마스크 대신 BGR 이미지로 측정')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 측정 횟수')
+    parser.add_argument('--json', help='결과를 저장할 JSON 경로')
+    args = parser.parse_args(argv)
+
+    width, height = parse_size(args.size)
+    image = make_synthetic_image(width, height) if args.color else make_mask(width, height)
+    operation = getattr(cv2, f"MORPH_{args.operation.upper()}")
+    rows = []
+    print(f"{args.size} {'BGR' if args.color else 'mask'}, {args.operation} × {args.iterations}")
+    print(f"{'shape':<9}{'kernel':>8}{'method':>9}{'cv2 ms':>10}{'new ms':>10}{'same':>6}")
+    for shape in args.shapes:
+        for kernel_size in args.kernels:
+            kernel = cv2.getStructuringElement(SHAPES[shape], (kernel_size, kernel_size))
+
+            def reference():
+                return cv2.morphologyEx(image, operation, kernel, iterations=args.iterations)
+
+            def current():
+                return area_processing.apply_morphology(image, args.operation, kernel_size,
+                                                        args.iterations, shape=shape)
+
+            same = bool(np.array_equal(reference(), current()))
+            row = {
+                'shape': shape,
+                'kernel': kernel_size,
+                'method': morphology_method(shape, kernel_size, 3 if args.color else 1),
+                'opencv_ms': summarize(_time_ms(reference, args.repeat)),
+                'morphology_ms': summarize(_time_ms(current, args.repeat)),
+                'same': same,
+            }
+            rows.append(row)
+            print(f"{shape:<9}{kernel_size:>8}{row['method']:>9}{row['opencv_ms']['p50']:>10.1f}"
+                  f"{row['morphology_ms']['p50']:>10.1f}{str(same):>6}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, indent=2)
+    return rows
+
+
+if __name__ == '__main__':
+    main()
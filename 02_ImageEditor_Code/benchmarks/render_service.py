@@ -0,0 +1,141 @@
+"""
+로컬 렌더 서비스 벤치마크
+렌더 서비스를 별도 프로세스로 실행하고 여러 클라이언트 스레드가 동시에 요청하여
+업로드 방식(공유 메모리 / 인코딩된 파일)과 배치 크기별 지연 시간과 처리량을 측정
+
+사용법 (02_ImageEditor_Code 폴더에서):
+    python -m benchmarks.render_service
+    python -m benchmarks.render_service --size 4000x3000 --clients 8 --requests 10
+"""
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import cv2
+
+from benchmarks.common import make_synthetic_image, parse_size, summarize
+from image_processor.render_service import RenderClient
+
+# 02_ImageEditor_Code 폴더 (image_processor 패키지 위치)
+CODE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 요청 레시피 (밝기 + 블러)
+RECIPE = {'trackbar_values': {'brightness': 130, 'blur': 3}}
+
+
+def _free_port():
+    """사용하지 않는 localhost 포트"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_service(port, workers, max_batch):
+    """렌더 서비스 프로세스 실행 후 응답할 때까지 대기"""
+    process = subprocess.Popen([sys.executable, '-m', 'image_processor.render_service',
+                                '--port', str(port), '--workers', str(workers),
+                                '--max-batch', str(max_batch)],
+                               cwd=CODE_DIR, stdout=subprocess.DEVNULL)
+    deadline = time.perf_counter() + 30
+    while time.perf_counter() < deadline:
+        try:
+            client = RenderClient(port=port, timeout=1)
+            client.metrics()
+            client.close()
+            return process
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError('렌더 서비스가 시작되지 않음')
+
+
+def run_clients(port, image, encoded, clients, requests, mode):
+    """클라이언트 스레드들이 동시에 요청하여 (요청 지연 시간 목록 ms, 전체 시간 s) 반환"""
+    latencies = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(clients + 1)
+
+    def worker():
+        client = RenderClient(port=port)
+        try:
+            # 연결과 공유 메모리 준비 (측정 제외)
+            client.metrics()
+            if mode == 'shm':
+                client.render(image, RECIPE)
+            barrier.wait()
+            for _ in range(requests):
+                start = time.perf_counter()
+                if mode == 'shm':
+                    client.render(image, RECIPE)
+                else:
+                    client.render_encoded(encoded, RECIPE)
+                elapsed = (time.perf_counter() - start) * 1000.0
+                with lock:
+                    latencies.append(elapsed)
+        finally:
+            client.close()
+
+    threads = [threading.Thread(target=worker) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return latencies, time.perf_counter() - start
+
+
+def main(argv=None):
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description='로컬 렌더 서비스 벤치마크')
+    parser.add_argument('--size', default='1920x1080', help='요청 이미지 크기')
+    parser.add_argument('--clients', type=int, default=8, help='동시 클라이언트 수')
+    parser.add_argument('--requests', type=int, default=20, help='클라이언트별 요청 수')
+    parser.add_argument('--workers', type=int, default=4, help='서비스 처리 워커 수')
+    parser.add_argument('--batches', type=int, nargs='*', default=[1, 8], help='비교할 max_batch 값')
+    parser.add_argument('--json', help='결과를 저장할 JSON 경로')
+    args = parser.parse_args(argv)
+
+    width, height = parse_size(args.size)
+    image = make_synthetic_image(width, height)
+    encoded = cv2.imencode('.png', image)[1].tobytes()
+    report = {'size': [width, height], 'clients': args.clients, 'requests': args.requests,
+              'workers': args.workers, 'runs': []}
+
+    print(f"이미지 {width}x{height} (PNG {len(encoded) / 1e6:.1f} MB), 클라이언트 {args.clients}, "
+          f"워커 {args.workers}")
+    print(f"{'업로드':<10}{'max_batch':>10}{'p50 ms':>10}{'p95 ms':>10}{'req/s':>10}{'평균 배치':>10}")
+    for max_batch in args.batches:
+        for mode in ('shm', 'encoded'):
+            port = _free_port()
+            process = start_service(port, args.workers, max_batch)
+            try:
+                latencies, seconds = run_clients(port, image, encoded, args.clients,
+                                                 args.requests, mode)
+                client = RenderClient(port=port)
+                metrics = client.metrics()
+                client.close()
+            finally:
+                process.terminate()
+                process.wait()
+            stats = summarize(latencies)
+            throughput = len(latencies) / seconds
+            report['runs'].append({'mode': mode, 'max_batch': max_batch, 'latency_ms': stats,
+                                   'requests_per_s': throughput, 'service': metrics})
+            print(f"{mode:<10}{max_batch:>10}{stats['p50']:>10.1f}{stats['p95']:>10.1f}"
+                  f"{throughput:>10.1f}{metrics['mean_batch_size']:>10.2f}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+if __name__ == '__main__':
+    main()
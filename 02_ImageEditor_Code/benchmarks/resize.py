@@ -0,0 +1,79 @@
+"""
+크기 조절 벤치마크
+축소 크기별로 크기 조절 방식(interpolate/area/pyramid/auto)의 처리 시간과
+INTER_AREA 결과와의 평균 오차(앨리어싱 정도)를 비교
+
+사용법 (02_ImageEditor_Code 폴더에서):
+    python -m benchmarks.resize
+    python -m benchmarks.resize --source 6000x4000 --targets 1920x1080 640x480
+"""
+
+import argparse
+import json
+import time
+
+import cv2
+import numpy as np
+
+from benchmarks.common import make_synthetic_image, parse_size, summarize
+from image_processor.geometric_processing import apply_resize, resize_strategy
+
+STRATEGIES = ('interpolate', 'area', 'pyramid', 'auto')
+
+
+def _time_ms(func, repeat):
+    """func를 repeat번 실행한 시간 목록 (ms)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def fit_size(width, height, box):
+    """box (w, h) 안에 비율을 유지하며 들어가는 크기"""
+    scale = min(box[0] / width, box[1] / height)
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+def main(argv=None):
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description='크기 조절 벤치마크')
+    parser.add_argument('--source', default='12000x8400', help='원본 이미지 크기 (기본 100 MP)')
+    parser.add_argument('--targets', nargs='*', default=['1920x1080', '4000x2800', '640x480'],
+                        help='결과 크기 (원본 비율을 유지하며 이 크기 안에 맞춤)')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수')
+    parser.add_argument('--json', help='결과를 저장할 JSON 경로')
+    args = parser.parse_args(argv)
+
+    width, height = parse_size(args.source)
+    image = make_synthetic_image(width, height)
+    rows = []
+    print(f"원본 {args.source} (interpolate = INTER_LINEAR, 오차 = INTER_AREA 결과와의 평균 차이)")
+    print(f"{'target':<12}{'auto':>9}" + ''.join(f"{name + ' ms':>16}" for name in STRATEGIES))
+    for text in args.targets:
+        size = fit_size(width, height, parse_size(text))
+        reference = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+        row = {'source': [width, height], 'target': list(size),
+               'strategy': resize_strategy((width, height), size)}
+        cells = []
+        for strategy in STRATEGIES:
+            result = apply_resize(image, size[0], size[1], strategy=strategy)
+            error = float(np.abs(result.astype(np.int16) - reference).mean())
+            timing = summarize(_time_ms(lambda: apply_resize(image, size[0], size[1], strategy=strategy),
+                                        args.repeat))
+            row[strategy] = {'ms': timing, 'mean_error': error}
+            cells.append(f"{timing['p50']:>9.1f} ({error:.2f})")
+        rows.append(row)
+        target = f"{size[0]}x{size[1]}"
+        print(f"{target:<12}{row['strategy']:>9}" + ''.join(f"{c:>16}" for c in cells))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, indent=2)
+    return rows
+
+
+if __name__ == '__main__':
+    main()
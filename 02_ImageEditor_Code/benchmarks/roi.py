@@ -0,0 +1,84 @@
+"""
+ROI 편집 벤치마크
+큰 이미지 전체 처리, ROI(+halo)만 처리, ROI 크기 이미지 전체 처리의 시간을 비교
+
+사용법 (02_ImageEditor_Code 폴더에서):
+    python -m benchmarks.roi
+    python -m benchmarks.roi --size 6000x4000 --roi 512x512 --blur 40
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from benchmarks.common import make_synthetic_image, parse_size, summarize
+from image_processor import pipeline
+
+
+def _time_ms(func, repeat):
+    """func를 repeat번 실행한 시간 목록 (ms)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def build_stages(blur, canny):
+    """밝기 + 대비 + 블러 (+ Canny) 단계"""
+    trackbar_values = dict(pipeline.DEFAULT_TRACKBAR_VALUES, brightness=130, contrast=120, blur=blur)
+    if canny:
+        trackbar_values['canny_low'] = 30
+    return pipeline.build_stages(pipeline.DEFAULT_BUTTON_STATES, trackbar_values)
+
+
+def main(argv=None):
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description='ROI 편집 벤치마크')
+    parser.add_argument('--size', default='8192x6144', help='이미지 크기 (기본 50 MP)')
+    parser.add_argument('--roi', default='1024x1024', help='ROI 크기 (이미지 가운데)')
+    parser.add_argument('--blur', type=int, default=20, help='블러 반경')
+    parser.add_argument('--canny', action='store_true', help='Canny 단계 추가')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수')
+    parser.add_argument('--json', help='결과를 저장할 JSON 경로')
+    args = parser.parse_args(argv)
+
+    width, height = parse_size(args.size)
+    roi_w, roi_h = parse_size(args.roi)
+    roi = ((width - roi_w) // 2, (height - roi_h) // 2, roi_w, roi_h)
+    image = make_synthetic_image(width, height)
+    small = make_synthetic_image(roi_w, roi_h)
+    frame = image.copy()
+    stages = build_stages(args.blur, args.canny)
+
+    full = summarize(_time_ms(lambda: pipeline.run_stages(image, stages), args.repeat))
+    region = summarize(_time_ms(lambda: pipeline.run_stages_roi(image, stages, roi, frame), args.repeat))
+    reference = summarize(_time_ms(lambda: pipeline.run_stages(small, stages), args.repeat))
+
+    x, y, w, h = roi
+    expected = pipeline.run_stages(image, stages)[y:y + h, x:x + w]
+    patch = pipeline.run_stages_roi(image, stages, roi, frame)
+    if expected.ndim != patch.ndim:
+        patch = patch[:, :, 0]
+    error = float(np.abs(patch.astype(np.int16) - expected).mean())
+
+    halo = pipeline.roi_halo(stages)
+    print(f"이미지 {args.size}, ROI {args.roi} (halo {halo}), 단계: {[s.name for s in stages]}")
+    print(f"  전체 처리          p50 {full['p50']:9.1f} ms")
+    print(f"  ROI 처리           p50 {region['p50']:9.1f} ms  (전체 처리 결과와의 평균 차이 {error:.3f})")
+    print(f"  ROI 크기 이미지    p50 {reference['p50']:9.1f} ms")
+
+    result = {'size': [width, height], 'roi': list(roi), 'halo': halo,
+              'stages': [s.name for s in stages], 'full_ms': full, 'roi_ms': region,
+              'roi_sized_image_ms': reference, 'mean_error': error}
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+    return result
+
+
+if __name__ == '__main__':
+    main()
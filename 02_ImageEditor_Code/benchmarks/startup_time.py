@@ -0,0 +1,152 @@
+"""
+시작 시간 벤치마크
+새 프로세스로 편집기를 실행하여 import 시간(-X importtime)과
+실행 시점부터 첫 페인트/첫 이미지 표시/전체 해상도 이미지 표시까지의 시간을 측정
+
+매회 세션 없이 한 번(cold), 그 실행이 종료 시 저장한 세션으로 한 번(restore) 실행합니다.
+
+사용법 (02_ImageEditor_Code 폴더에서):
+    python -m benchmarks.startup_time
+    python -m benchmarks.startup_time --size 8000x6000 --files 200 --runs 5
+    python -m benchmarks.startup_time --exe dist/ImageEditor/ImageEditor.exe
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.common import parse_size, write_synthetic_images
+
+# 02_ImageEditor_Code 폴더 (main.py 위치)
+CODE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _child_env():
+    """자식 프로세스 환경 (디스플레이 서버 없이 실행)"""
+    env = dict(os.environ)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    return env
+
+
+def parse_importtime(stderr_text):
+    """-X importtime 출력 파싱
+
+    Returns:
+        (전체 시간 ms, [(측정 모듈이 직접 import한 모듈, 누적 ms), ...] 누적 시간 내림차순)
+    """
+    total_us = 0
+    direct = []
+    for line in stderr_text.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        parts = line[len('import time:'):].split('|')
+        self_us, cumulative_us, name = int(parts[0]), int(parts[1]), parts[2]
+        total_us += self_us
+        # 들여쓰기 1단계(공백 3칸)가 측정 모듈이 직접 import한 모듈
+        if name.startswith('   ') and not name.startswith('    '):
+            direct.append((name.strip(), cumulative_us / 1000.0))
+    direct.sort(key=lambda item: item[1], reverse=True)
+    return total_us / 1000.0, direct
+
+
+def measure_import_time(module='main', runs=3):
+    """모듈 import 시간 측정 (새 프로세스, runs회 중 가장 빠른 결과)"""
+    best = None
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                                cwd=CODE_DIR, env=_child_env(), capture_output=True, text=True)
+        if result.returncode != 0:
+            print(result.stderr)
+            return None
+        parsed = parse_importtime(result.stderr)
+        if best is None or parsed[0] < best[0]:
+            best = parsed
+    return best
+
+
+def measure_first_paint(command, images_dir, timeout_s=60.0):
+    """실행 시점부터 첫 페인트/첫 이미지/전체 해상도 이미지 표시까지의 시간 (초)"""
+    env = _child_env()
+    env['IMAGE_EDITOR_STARTUP_PROBE'] = repr(time.time())
+    try:
+        result = subprocess.run(command + [images_dir], cwd=CODE_DIR, env=env,
+                                capture_output=True, text=True, timeout=timeout_s)
+    except subprocess.TimeoutExpired:
+        print(f"시간 초과: {timeout_s} s")
+        return None
+    for line in result.stdout.splitlines():
+        if line.startswith('STARTUP '):
+            values = dict(item.split('=') for item in line.split()[1:])
+            return {key: float(value) for key, value in values.items()}
+    print(result.stdout[-2000:], result.stderr[-2000:])
+    return None
+
+
+def main(argv=None):
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description='ImageEditor 시작 시간 벤치마크')
+    parser.add_argument('--size', default='1920x1080', help='합성 이미지 크기 (예: 8000x6000)')
+    parser.add_argument('--files', type=int, default=3, help='합성 이미지 개수')
+    parser.add_argument('--runs', type=int, default=3, help='반복 횟수 (중앙값 보고)')
+    parser.add_argument('--exe', help='PyInstaller로 빌드한 실행 파일 (지정하면 main.py 대신 실행)')
+    parser.add_argument('--top', type=int, default=10, help='표시할 직접 import 개수')
+    parser.add_argument('--json', help='결과를 저장할 JSON 경로')
+    args = parser.parse_args(argv)
+
+    command = [os.path.abspath(args.exe)] if args.exe else [sys.executable, 'main.py']
+    width, height = parse_size(args.size)
+    report = {'size': [width, height], 'files': args.files}
+
+    if not args.exe:
+        imports = measure_import_time(runs=args.runs)
+        if imports is not None:
+            total_ms, direct = imports
+            report['import_total_ms'] = total_ms
+            report['import_direct'] = direct[:args.top]
+            print(f"import main 전체: {total_ms:.1f} ms (직접 import 누적 시간)")
+            for name, cumulative_ms in direct[:args.top]:
+                print(f"  {name:<40}{cumulative_ms:>9.1f} ms")
+
+    samples = {'cold': [], 'restore': []}
+    with tempfile.TemporaryDirectory(prefix='image_editor_startup_') as work_dir:
+        # 편집기는 이미지 폴더의 상위 폴더에 세션을 저장 (<work_dir>/session)
+        images_dir = os.path.join(work_dir, 'images')
+        session_dir = os.path.join(work_dir, 'session')
+        os.makedirs(images_dir)
+        write_synthetic_images(images_dir, [(width, height)] * args.files)
+        for _ in range(args.runs):
+            shutil.rmtree(session_dir, ignore_errors=True)
+            for mode in ('cold', 'restore'):
+                sample = measure_first_paint(command, images_dir)
+                if sample is not None:
+                    samples[mode].append(sample)
+
+    if not samples['cold']:
+        print("측정 실패")
+        return report
+    print(f"이미지 {width}x{height}, 파일 {args.files}개, {args.runs}회 실행 (중앙값)")
+    print(f"{'':<10}{'첫 페인트':>12}{'첫 이미지':>12}{'전체 해상도':>12}")
+    for mode, mode_samples in samples.items():
+        if not mode_samples:
+            continue
+        report[mode] = {}
+        for key in ('first_paint', 'first_image', 'full_image'):
+            values = [sample[key] for sample in mode_samples]
+            report[mode][key] = {'median_s': statistics.median(values), 'min_s': min(values), 'max_s': max(values)}
+        print(f"{mode:<10}" + ''.join(f"{report[mode][key]['median_s'] * 1000:>10.0f}ms"
+                                       for key in ('first_paint', 'first_image', 'full_image')))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+워프 엔진 벤치마크
+같은 기하 변환을 반복할 때(동영상, 일괄 처리) 매번 cv2.warpAffine/warpPerspective를 호출하는 것과
+워프 엔진 cache_maps=True(고정소수점 좌표표 remap, 정수 이동은 복사)의 프레임당 시간,
+좌표표 생성 시간(첫 프레임에 한 번)과 직접 변환과의 결과 차이(최대)를 비교
+
+사용법 (02_ImageEditor_Code 폴더에서):
+    python -m benchmarks.warp
+    python -m benchmarks.warp --sizes 1920x1080 --gray
+"""
+
+import argparse
+import json
+import time
+
+import cv2
+import numpy as np
+
+from benchmarks.common import make_synthetic_image, parse_size, summarize
+from image_processor.geometric_processing import get_rotation_matrix
+from image_processor.warp import WarpEngine, build_maps, integer_shift
+
+
+def _time_ms(func, repeat):
+    """func를 repeat번 실행한 시간 목록 (ms)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def transforms(width, height):
+    """(이름, 행렬, 결과 크기, 원근 여부) 목록 - 편집기의 회전/이동과 원근 보정"""
+    rotation, rotated_size = get_rotation_matrix(height, width, 30)
+    shift = np.float64([[1, 0, 40], [0, 1, 25]])
+    corners = np.float32([[0, 0], [width - 1, 0], [width - 1, height - 1], [0, height - 1]])
+    skewed = corners + np.float32([[0.05, 0.03], [-0.08, 0], [0, 0], [0.04, -0.06]]) * [width, height]
+    homography = cv2.getPerspectiveTransform(corners, skewed.astype(np.float32))
+    return [('rotate30', rotation, rotated_size, False),
+            ('translate', shift, (width, height), False),
+            ('perspective', homography, (width, height), True)]
+
+
+def main(argv=None):
+    """벤치마크 실행"""
+    parser = argparse.ArgumentParser(description='워프 엔진 벤치마크')
+    parser.add_argument('--sizes', nargs='*', default=['1920x1080', '6000x4000'], help='이미지 크기 목록')
+    parser.add_argument('--gray', action='store_true', help='그레이스케일 이미지로 측정')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (측정 후 프레임당 시간)')
+    parser.add_argument('--json', help='결과를 저장할 JSON 경로')
+    args = parser.parse_args(argv)
+
+    rows = []
+    print(f"{'size':<12}{'transform':<13}{'method':>8}{'warp ms':>10}{'engine ms':>11}"
+          f"{'maps ms':>9}{'maps MB':>9}{'error':>8}")
+    for text in args.sizes:
+        width, height = parse_size(text)
+        image = make_synthetic_image(width, height)
+        if args.gray:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        for name, matrix, size, perspective in transforms(width, height):
+            warp = cv2.warpPerspective if perspective else cv2.warpAffine
+            direct = lambda: warp(image, matrix, size, flags=cv2.INTER_LINEAR,
+                                  borderMode=cv2.BORDER_CONSTANT, borderValue=(0, 0, 0))
+            engine = WarpEngine()
+            warp_cached = engine.warp_perspective if perspective else engine.warp_affine
+            apply = lambda: warp_cached(image, matrix, size, cache_maps=True)
+            shift = not perspective and integer_shift(matrix) is not None
+            method = 'shift' if shift else 'remap'
+            build_ms = None if shift else summarize(_time_ms(lambda: build_maps(matrix, size), 1))
+            # 첫 호출에서 좌표표를 만든 뒤의 프레임당 시간
+            apply()
+            direct_ms = summarize(_time_ms(direct, args.repeat))
+            engine_ms = summarize(_time_ms(apply, args.repeat))
+            maps_mb = engine.memory_usage() / 1024 ** 2
+            error = int(np.abs(apply().astype(np.int16) - direct()).max())
+            rows.append({'size': [width, height], 'transform': name, 'method': method,
+                         'warp_ms': direct_ms, 'engine_ms': engine_ms, 'build_ms': build_ms,
+                         'maps_mb': maps_mb, 'max_error': error})
+            build = '-' if build_ms is None else f"{build_ms['p50']:.1f}"
+            print(f"{text:<12}{name:<13}{method:>8}{direct_ms['p50']:>10.1f}{engine_ms['p50']:>11.1f}"
+                  f"{build:>9}{maps_mb:>9.1f}{error:>8d}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, indent=2)
+    return rows
+
+
+if __name__ == '__main__':
+    main()
@@ -56,8 +56,10 @@ echo [4/5] EXE 파일 생성 중...
 echo 이 과정은 몇 분 정도 걸릴 수 있습니다...
 echo.
 pyinstaller --name="ImageEditor" ^
-    --onefile ^
+    --onedir ^
     --windowed ^
+    --noupx ^
+    --exclude-module=tkinter ^
     --hidden-import=PyQt5.QtCore ^
     --hidden-import=PyQt5.QtGui ^
     --hidden-import=PyQt5.QtWidgets ^
@@ -68,7 +70,23 @@ pyinstaller --name="ImageEditor" ^
     --hidden-import=image_processor.area_processing ^
     --hidden-import=image_processor.geometric_processing ^
     --hidden-import=image_processor.file_operations ^
+    --hidden-import=image_processor.tracing ^
+    --hidden-import=image_processor.conversion_cache ^
+    --hidden-import=image_processor.buffer_pool ^
+    --hidden-import=image_processor.pipeline ^
+    --hidden-import=image_processor.video_processing ^
+    --hidden-import=image_processor.session_store ^
+    --hidden-import=image_processor.render_service ^
+    --hidden-import=image_processor.render_worker ^
+    --hidden-import=image_processor.memory_budget ^
+    --hidden-import=image_processor.clahe ^
+    --hidden-import=image_processor.median ^
+    --hidden-import=image_processor.morphology ^
+    --hidden-import=image_processor.blur ^
+    --hidden-import=image_processor.warp ^
     --hidden-import=image_processor.UI.settings_panel ^
+    --hidden-import=image_processor.UI.histogram_widget ^
+    --hidden-import=image_processor.UI.memory_view ^
     main.py
 
 if errorlevel 1 (
@@ -89,13 +107,12 @@ echo ====================================
 echo 빌드 성공!
 echo ====================================
 echo.
-echo EXE 파일 위치: dist\ImageEditor.exe
+echo EXE 파일 위치: dist\ImageEditor\ImageEditor.exe
+echo 배포할 때는 dist\ImageEditor 폴더 전체를 복사하세요. (onedir 빌드)
 echo.
-if exist "dist\ImageEditor.exe" (
-    echo 파일 크기 확인 중...
-    for %%A in ("dist\ImageEditor.exe") do echo 파일 크기: %%~zA bytes (%%~zA / 1048576 MB)
-    echo.
-    echo 테스트: dist\ImageEditor.exe 파일을 더블클릭하여 실행해보세요!
+if exist "dist\ImageEditor\ImageEditor.exe" (
+    echo 테스트: dist\ImageEditor\ImageEditor.exe 파일을 더블클릭하여 실행해보세요!
+    echo 시작 시간 측정: python -m benchmarks.startup_time --exe dist\ImageEditor\ImageEditor.exe
 ) else (
     echo 경고: EXE 파일을 찾을 수 없습니다!
 )
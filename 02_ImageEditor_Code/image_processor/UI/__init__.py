@@ -2,39 +2,44 @@
 UI 모듈
 SOLID 원칙에 따라 UI 관련 기능을 모듈화
 PyQt5 기반으로 재구성
+
+하위 모듈은 처음 사용할 때 불러옵니다 (PEP 562).
+레거시 OpenCV 기반 모듈(components, layout, renderer, event_handler, text_cache)은
+Qt 앱에서 사용하지 않으므로 패키지 이름으로 내보내지 않습니다.
+필요하면 `from image_processor.UI.renderer import UIRenderer`처럼 하위 모듈에서 직접 불러옵니다.
 """
 
-from .constants import UIConstants
-from .settings_panel import SettingsPanel, PixelSettings, AreaSettings, GeometricSettings
-from .widgets import FileListWidget, ImageDisplayWidget, TopBarWidget, InfoBarWidget
-from .layout_manager import LayoutManager
-
-# 레거시 모듈 (OpenCV 기반 - 참고용)
-from .components import Button, Tab, FileList, SettingsPanel as LegacySettingsPanel, DropdownMenu
-from .layout import LayoutManager as LegacyLayoutManager
-from .renderer import UIRenderer
-from .event_handler import EventHandler
-
-__all__ = [
-    # PyQt5 기반 모듈
-    'UIConstants',
-    'SettingsPanel',
-    'PixelSettings',
-    'AreaSettings',
-    'GeometricSettings',
-    'FileListWidget',
-    'ImageDisplayWidget',
-    'TopBarWidget',
-    'InfoBarWidget',
-    'LayoutManager',
-    # 레거시 모듈 (OpenCV 기반)
-    'Button',
-    'Tab',
-    'FileList',
-    'LegacySettingsPanel',
-    'DropdownMenu',
-    'LegacyLayoutManager',
-    'UIRenderer',
-    'EventHandler'
-]
+import importlib
+
+# 공개 이름 -> (하위 모듈, 모듈 내 이름)
+_LAZY_ATTRIBUTES = {
+    'UIConstants': ('constants', 'UIConstants'),
+    'SettingsPanel': ('settings_panel', 'SettingsPanel'),
+    'PixelSettings': ('settings_panel', 'PixelSettings'),
+    'AreaSettings': ('settings_panel', 'AreaSettings'),
+    'GeometricSettings': ('settings_panel', 'GeometricSettings'),
+    'FileListWidget': ('widgets', 'FileListWidget'),
+    'ImageDisplayWidget': ('widgets', 'ImageDisplayWidget'),
+    'TopBarWidget': ('widgets', 'TopBarWidget'),
+    'InfoBarWidget': ('widgets', 'InfoBarWidget'),
+    'LayoutManager': ('layout_manager', 'LayoutManager'),
+    'LatencyMonitor': ('latency_monitor', 'LatencyMonitor'),
+    'HistogramWidget': ('histogram_widget', 'HistogramWidget'),
+    'MemoryView': ('memory_view', 'MemoryView'),
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    """처음 접근할 때 하위 모듈을 불러와 이름 반환"""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), attribute)
+    globals()[name] = value  # 다음 접근부터는 일반 속성으로 조회
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
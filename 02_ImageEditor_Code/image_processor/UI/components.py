@@ -1,16 +1,91 @@
 """
 UI 컴포넌트 클래스들
 각 UI 요소를 독립적인 클래스로 구현 (Single Responsibility)
+
+컴포넌트는 상태가 바뀌면 스스로 dirty 표시를 하고, 렌더러는 pop_dirty_rects()로
+다시 그릴 영역(x, y, w, h)만 받아 그 부분만 다시 그립니다 (retained 캔버스).
+draw()의 origin은 캔버스 좌표 (0, 0)에 해당하는 화면 좌표이며, 렌더러가
+캔버스 일부(view)에만 그릴 때 사용합니다.
 """
 
 import cv2
 import numpy as np
 from .constants import UIConstants
+from .text_cache import draw_text, text_size as text_size_of
+
+
+def intersect_rects(a, b):
+    """두 영역의 교집합 (없으면 None)"""
+    x0, y0 = max(a[0], b[0]), max(a[1], b[1])
+    x1, y1 = min(a[0] + a[2], b[0] + b[2]), min(a[1] + a[3], b[1] + b[3])
+    if x1 <= x0 or y1 <= y0:
+        return None
+    return (x0, y0, x1 - x0, y1 - y0)
+
+
+def union_rects(a, b):
+    """두 영역을 모두 포함하는 가장 작은 영역"""
+    x0, y0 = min(a[0], b[0]), min(a[1], b[1])
+    x1, y1 = max(a[0] + a[2], b[0] + b[2]), max(a[1] + a[3], b[1] + b[3])
+    return (x0, y0, x1 - x0, y1 - y0)
+
+
+def text_rect(text, x, y, font_scale, thickness):
+    """cv2.putText로 (x, y)에 그린 글자의 영역 (기준선 아래 포함)"""
+    (text_w, text_h), baseline = text_size_of(text, font_scale, thickness)
+    return (x - thickness, y - text_h - thickness, text_w + thickness * 2, text_h + baseline + thickness * 2)
 
 
-class Button:
+class Component:
+    """컴포넌트 기반 클래스 (단일 책임: 화면 영역과 다시 그리기 필요 여부 관리)
+    
+    STATE_ATTRIBUTES에 있는 속성에 다른 값을 대입하면 자동으로 dirty가 됩니다.
+    리스트 등을 제자리에서 수정한 경우에는 mark_dirty()를 직접 호출해야 합니다.
+    """
+    
+    STATE_ATTRIBUTES = ('x', 'y', 'width', 'height')
+    
+    def __setattr__(self, name, value):
+        if name in self.STATE_ATTRIBUTES:
+            changed = getattr(self, name, None) != value
+            object.__setattr__(self, name, value)
+            if changed:
+                self.mark_dirty()
+        else:
+            object.__setattr__(self, name, value)
+    
+    def mark_dirty(self):
+        """다음 렌더에서 다시 그리도록 표시"""
+        object.__setattr__(self, '_dirty', True)
+    
+    def bounds(self):
+        """그리는 영역 (x, y, w, h) - 테두리 선 포함, 그리지 않으면 None"""
+        return (self.x, self.y, self.width + 1, self.height + 1)
+    
+    def pop_dirty_rects(self):
+        """다시 그릴 영역 목록 반환 후 dirty 해제
+        
+        이전에 그린 영역과 현재 영역을 모두 반환하므로 이동하거나 숨긴 경우에도
+        이전 자리가 지워집니다.
+        """
+        if not getattr(self, '_dirty', True):
+            return []
+        rects = [rect for rect in (getattr(self, '_drawn_bounds', None), self.bounds()) if rect is not None]
+        object.__setattr__(self, '_drawn_bounds', self.bounds())
+        object.__setattr__(self, '_dirty', False)
+        return rects
+    
+    def contains(self, x, y):
+        """포인트가 컴포넌트 영역 내에 있는지 확인"""
+        return (self.x <= x <= self.x + self.width and
+                self.y <= y <= self.y + self.height)
+
+
+class Button(Component):
     """버튼 컴포넌트"""
     
+    STATE_ATTRIBUTES = Component.STATE_ATTRIBUTES + ('text', 'color', 'active_color', 'is_active')
+    
     def __init__(self, x, y, width, height, text, color=None, active_color=None):
         self.x = x
         self.y = y
@@ -21,36 +96,33 @@ class Button:
         self.active_color = active_color or UIConstants.COLOR_BTN_ACTIVE
         self.is_active = False
     
-    def contains(self, x, y):
-        """포인트가 버튼 영역 내에 있는지 확인"""
-        return (self.x <= x <= self.x + self.width and 
-                self.y <= y <= self.y + self.height)
-    
-    def draw(self, canvas):
+    def draw(self, canvas, origin=(0, 0)):
         """버튼 그리기"""
+        x, y = self.x - origin[0], self.y - origin[1]
         color = self.active_color if self.is_active else self.color
-        cv2.rectangle(canvas, (self.x, self.y), 
-                     (self.x + self.width, self.y + self.height), 
+        cv2.rectangle(canvas, (x, y),
+                     (x + self.width, y + self.height),
                      color, -1)
-        cv2.rectangle(canvas, (self.x, self.y), 
-                     (self.x + self.width, self.y + self.height), 
+        cv2.rectangle(canvas, (x, y),
+                     (x + self.width, y + self.height),
                      UIConstants.COLOR_BORDER, 1)
         
         # 텍스트 중앙 정렬
-        text_size = cv2.getTextSize(self.text, cv2.FONT_HERSHEY_SIMPLEX, 
-                                   UIConstants.FONT_SCALE_MEDIUM, 
-                                   UIConstants.FONT_THICKNESS)[0]
-        text_x = self.x + (self.width - text_size[0]) // 2
-        text_y = self.y + (self.height + text_size[1]) // 2
+        text_size = text_size_of(self.text, UIConstants.FONT_SCALE_MEDIUM,
+                                 UIConstants.FONT_THICKNESS)[0]
+        text_x = x + (self.width - text_size[0]) // 2
+        text_y = y + (self.height + text_size[1]) // 2
         
-        cv2.putText(canvas, self.text, (text_x, text_y),
-                   cv2.FONT_HERSHEY_SIMPLEX, UIConstants.FONT_SCALE_MEDIUM,
-                   UIConstants.COLOR_TEXT, UIConstants.FONT_THICKNESS)
+        draw_text(canvas, self.text, (text_x, text_y),
+                  UIConstants.FONT_SCALE_MEDIUM, UIConstants.COLOR_TEXT, UIConstants.FONT_THICKNESS,
+                  background=color)
 
 
-class Tab:
+class Tab(Component):
     """탭 컴포넌트"""
     
+    STATE_ATTRIBUTES = Component.STATE_ATTRIBUTES + ('text', 'is_active')
+    
     def __init__(self, x, y, width, height, text):
         self.x = x
         self.y = y
@@ -59,34 +131,42 @@ class Tab:
         self.text = text
         self.is_active = False
     
-    def contains(self, x, y):
-        """포인트가 탭 영역 내에 있는지 확인"""
-        return (self.x <= x <= self.x + self.width and 
-                self.y <= y <= self.y + self.height)
+    def _text_origin(self, x, y):
+        """텍스트 중앙 정렬 위치"""
+        text_size = text_size_of(self.text, UIConstants.FONT_SCALE_LARGE,
+                                 UIConstants.FONT_THICKNESS_BOLD)[0]
+        return x + (self.width - text_size[0]) // 2, y + (self.height + text_size[1]) // 2
+    
+    def bounds(self):
+        """탭 영역 + 탭보다 넓은 글자 + 아래쪽 하이라이트 선(두께 3, 양 끝이 2픽셀 더 나감)"""
+        text_x, text_y = self._text_origin(self.x, self.y)
+        rect = union_rects((self.x - 2, self.y, self.width + 5, self.height + 3),
+                           text_rect(self.text, text_x, text_y,
+                                     UIConstants.FONT_SCALE_LARGE, UIConstants.FONT_THICKNESS_BOLD))
+        return rect
     
-    def draw(self, canvas):
+    def draw(self, canvas, origin=(0, 0)):
         """탭 그리기"""
+        x, y = self.x - origin[0], self.y - origin[1]
         # 텍스트 그리기
-        text_size = cv2.getTextSize(self.text, cv2.FONT_HERSHEY_SIMPLEX,
-                                   UIConstants.FONT_SCALE_LARGE,
-                                   UIConstants.FONT_THICKNESS_BOLD)[0]
-        text_x = self.x + (self.width - text_size[0]) // 2
-        text_y = self.y + (self.height + text_size[1]) // 2
+        text_x, text_y = self._text_origin(x, y)
         
-        cv2.putText(canvas, self.text, (text_x, text_y),
-                   cv2.FONT_HERSHEY_SIMPLEX, UIConstants.FONT_SCALE_LARGE,
-                   UIConstants.COLOR_TEXT, UIConstants.FONT_THICKNESS_BOLD)
+        draw_text(canvas, self.text, (text_x, text_y),
+                  UIConstants.FONT_SCALE_LARGE, UIConstants.COLOR_TEXT, UIConstants.FONT_THICKNESS_BOLD,
+                  background=UIConstants.COLOR_PANEL)
         
         # 활성 탭 하이라이트
         if self.is_active:
-            cv2.line(canvas, (self.x, self.y + self.height),
-                    (self.x + self.width, self.y + self.height),
+            cv2.line(canvas, (x, y + self.height),
+                    (x + self.width, y + self.height),
                     UIConstants.COLOR_HIGHLIGHT, 3)
 
 
-class FileList:
+class FileList(Component):
     """파일 리스트 컴포넌트"""
     
+    STATE_ATTRIBUTES = Component.STATE_ATTRIBUTES + ('files', 'selected_index')
+    
     def __init__(self, x, y, width, height):
         self.x = x
         self.y = y
@@ -97,7 +177,7 @@ class FileList:
     
     def set_files(self, files):
         """파일 리스트 설정"""
-        self.files = files
+        self.files = list(files)
     
     def get_clicked_index(self, x, y):
         """클릭된 파일 인덱스 반환"""
@@ -110,30 +190,26 @@ class FileList:
             return clicked_index
         return -1
     
-    def contains(self, x, y):
-        """포인트가 파일 리스트 영역 내에 있는지 확인"""
-        return (self.x <= x <= self.x + self.width and 
-                self.y <= y <= self.y + self.height)
-    
-    def draw(self, canvas):
+    def draw(self, canvas, origin=(0, 0)):
         """파일 리스트 그리기"""
+        x, y = self.x - origin[0], self.y - origin[1]
         # 패널 배경
-        cv2.rectangle(canvas, (self.x, self.y),
-                     (self.x + self.width, self.y + self.height),
+        cv2.rectangle(canvas, (x, y),
+                     (x + self.width, y + self.height),
                      UIConstants.COLOR_PANEL, -1)
         
         # 제목
-        cv2.putText(canvas, 'Image Files', (self.x + UIConstants.PADDING, self.y + 20),
-                   cv2.FONT_HERSHEY_SIMPLEX, UIConstants.FONT_SCALE_LARGE,
-                   UIConstants.COLOR_TEXT, UIConstants.FONT_THICKNESS)
+        draw_text(canvas, 'Image Files', (x + UIConstants.PADDING, y + 20),
+                  UIConstants.FONT_SCALE_LARGE, UIConstants.COLOR_TEXT, UIConstants.FONT_THICKNESS,
+                  background=UIConstants.COLOR_PANEL)
         
         # 구분선
-        cv2.line(canvas, (self.x, self.y + 30),
-                (self.x + self.width, self.y + 30),
+        cv2.line(canvas, (x, y + 30),
+                (x + self.width, y + 30),
                 UIConstants.COLOR_BORDER, 1)
         
         # 파일 리스트
-        list_y_start = self.y + 35
+        list_y_start = y + 35
         max_visible = (self.height - 35) // UIConstants.FILE_ITEM_HEIGHT
         
         # 중복 방지: 파일 리스트를 한 번만 그리기
@@ -143,9 +219,11 @@ class FileList:
             file_y = list_y_start + i * UIConstants.FILE_ITEM_HEIGHT
             
             # 선택된 파일 하이라이트
+            background = UIConstants.COLOR_PANEL
             if i == self.selected_index:
-                cv2.rectangle(canvas, (self.x + UIConstants.SPACING, file_y - 20),
-                            (self.x + self.width - UIConstants.SPACING, file_y + 5),
+                background = UIConstants.COLOR_FILE_SELECTED
+                cv2.rectangle(canvas, (x + UIConstants.SPACING, file_y - 20),
+                            (x + self.width - UIConstants.SPACING, file_y + 5),
                             UIConstants.COLOR_FILE_SELECTED, -1)
             
             # 파일명 표시 (긴 파일명은 잘라내기)
@@ -153,64 +231,96 @@ class FileList:
             if len(display_name) > 25:
                 display_name = display_name[:22] + '...'
             
-            cv2.putText(canvas, display_name,
-                       (self.x + UIConstants.PADDING, file_y),
-                       cv2.FONT_HERSHEY_SIMPLEX, UIConstants.FONT_SCALE_SMALL,
-                       UIConstants.COLOR_TEXT, UIConstants.FONT_THICKNESS)
+            # 첫 항목의 글자는 위쪽 구분선과 겹치므로 스프라이트 복사 대신 직접 그림
+            draw_text(canvas, display_name, (x + UIConstants.PADDING, file_y),
+                      UIConstants.FONT_SCALE_SMALL, UIConstants.COLOR_TEXT, UIConstants.FONT_THICKNESS,
+                      background=background if i > 0 else None)
         
         # 파일이 없을 때 메시지
         if len(self.files) == 0:
             msg_y = list_y_start + 20
-            cv2.putText(canvas, 'No image files', 
-                       (self.x + UIConstants.PADDING, msg_y),
-                       cv2.FONT_HERSHEY_SIMPLEX, UIConstants.FONT_SCALE_MEDIUM,
-                       UIConstants.COLOR_TEXT_DIM, UIConstants.FONT_THICKNESS)
-            cv2.putText(canvas, 'found in current', 
-                       (self.x + UIConstants.PADDING, msg_y + 25),
-                       cv2.FONT_HERSHEY_SIMPLEX, UIConstants.FONT_SCALE_MEDIUM,
-                       UIConstants.COLOR_TEXT_DIM, UIConstants.FONT_THICKNESS)
-            cv2.putText(canvas, 'directory', 
-                       (self.x + UIConstants.PADDING, msg_y + 50),
-                       cv2.FONT_HERSHEY_SIMPLEX, UIConstants.FONT_SCALE_MEDIUM,
-                       UIConstants.COLOR_TEXT_DIM, UIConstants.FONT_THICKNESS)
+            draw_text(canvas, 'No image files', (x + UIConstants.PADDING, msg_y),
+                      UIConstants.FONT_SCALE_MEDIUM, UIConstants.COLOR_TEXT_DIM, UIConstants.FONT_THICKNESS,
+                      background=UIConstants.COLOR_PANEL)
+            draw_text(canvas, 'found in current', (x + UIConstants.PADDING, msg_y + 25),
+                      UIConstants.FONT_SCALE_MEDIUM, UIConstants.COLOR_TEXT_DIM, UIConstants.FONT_THICKNESS,
+                      background=UIConstants.COLOR_PANEL)
+            draw_text(canvas, 'directory', (x + UIConstants.PADDING, msg_y + 50),
+                      UIConstants.FONT_SCALE_MEDIUM, UIConstants.COLOR_TEXT_DIM, UIConstants.FONT_THICKNESS,
+                      background=UIConstants.COLOR_PANEL)
 
 
-class DropdownMenu:
+class DropdownMenu(Component):
     """드롭다운 메뉴 컴포넌트"""
     
+    STATE_ATTRIBUTES = ('x', 'y', 'items', 'is_visible')
+    
+    MENU_WIDTH = 300
+    
     def __init__(self, x, y, items):
         self.x = x
         self.y = y
         self.items = items
         self.is_visible = False
     
-    def draw(self, canvas):
+    @property
+    def width(self):
+        return self.MENU_WIDTH
+    
+    @property
+    def height(self):
+        return len(self.items) * 25 + 10
+    
+    def bounds(self):
+        """메뉴 영역 (테두리 두께 2 포함), 숨겨져 있으면 None"""
+        if not self.is_visible or not self.items:
+            return None
+        return (self.x - 1, self.y - 1, self.width + 3, self.height + 3)
+    
+    def draw(self, canvas, origin=(0, 0)):
         """드롭다운 메뉴 그리기 (최상위 레이어)"""
         if not self.is_visible or not self.items:
             return
         
-        menu_height = len(self.items) * 25 + 10
-        menu_width = 300
+        x, y = self.x - origin[0], self.y - origin[1]
+        menu_height = self.height
+        menu_width = self.width
         
         # 메뉴 배경 (반투명 효과를 위해 약간 밝게)
-        cv2.rectangle(canvas, (self.x, self.y),
-                     (self.x + menu_width, self.y + menu_height),
+        cv2.rectangle(canvas, (x, y),
+                     (x + menu_width, y + menu_height),
                      UIConstants.COLOR_MENU_BG, -1)
-        cv2.rectangle(canvas, (self.x, self.y),
-                     (self.x + menu_width, self.y + menu_height),
+        cv2.rectangle(canvas, (x, y),
+                     (x + menu_width, y + menu_height),
                      UIConstants.COLOR_HIGHLIGHT, 2)
         
         # 메뉴 항목
-        y_offset = self.y + 20
+        y_offset = y + 20
         for item in self.items:
-            cv2.putText(canvas, f"  {item}", (self.x + UIConstants.PADDING, y_offset),
-                       cv2.FONT_HERSHEY_SIMPLEX, UIConstants.FONT_SCALE_SMALL,
-                       UIConstants.COLOR_TEXT, UIConstants.FONT_THICKNESS)
+            draw_text(canvas, f"  {item}", (x + UIConstants.PADDING, y_offset),
+                      UIConstants.FONT_SCALE_SMALL, UIConstants.COLOR_TEXT, UIConstants.FONT_THICKNESS,
+                      background=UIConstants.COLOR_MENU_BG)
             y_offset += 25
 
 
-class SettingsPanel:
-    """설정 패널 컴포넌트"""
+class SettingsPanel(Component):
+    """설정 패널 컴포넌트
+    
+    탭이 바뀌면 패널 전체를, 버튼 상태나 트랙바 라벨 글자가 바뀌면 그 부분만 다시 그립니다.
+    """
+    
+    STATE_ATTRIBUTES = Component.STATE_ATTRIBUTES + ('current_tab',)
+    
+    # 탭별로 표시하는 버튼과 트랙바 라벨 (RESET 버튼은 항상 표시)
+    TAB_BUTTONS = {
+        'Pixel': ['grayscale', 'invert'],
+        'Geometric': ['flip_h', 'flip_v'],
+    }
+    TAB_LABELS = {
+        'Pixel': ['brightness', 'contrast', 'threshold'],
+        'Area': ['blur', 'canny_low', 'canny_high', 'sharpen'],
+        'Geometric': ['rotation', 'resize_w', 'resize_h'],
+    }
     
     def __init__(self, x, y, width, height):
         self.x = x
@@ -219,10 +329,13 @@ class SettingsPanel:
         self.height = height
         self.buttons = {}
         self.trackbar_labels = {}
+        self.current_tab = None
+        self._drawn_labels = {}  # 마지막으로 그린 라벨 {키: (글자, 영역)}
     
     def add_button(self, key, button):
         """버튼 추가"""
         self.buttons[key] = button
+        self.mark_dirty()
     
     def add_trackbar_label(self, key, x, y, text_getter):
         """트랙바 라벨 추가"""
@@ -231,65 +344,65 @@ class SettingsPanel:
             'y': y,
             'text_getter': text_getter
         }
+        self.mark_dirty()
+    
+    def _visible_buttons(self, current_tab):
+        keys = self.TAB_BUTTONS.get(current_tab, []) + ['reset']
+        return [self.buttons[key] for key in keys if key in self.buttons]
+    
+    def _visible_labels(self, current_tab):
+        """현재 탭의 라벨 {키: (글자, 영역)}"""
+        labels = {}
+        for key in self.TAB_LABELS.get(current_tab, []):
+            if key in self.trackbar_labels:
+                label_info = self.trackbar_labels[key]
+                text = label_info['text_getter']()
+                labels[key] = (text, text_rect(text, label_info['x'], label_info['y'],
+                                               UIConstants.FONT_SCALE_MEDIUM, UIConstants.FONT_THICKNESS))
+        return labels
     
-    def draw(self, canvas, current_tab):
+    def pop_dirty_rects(self):
+        """패널 전체(위치/탭 변경) 또는 바뀐 버튼/라벨 영역"""
+        if getattr(self, '_dirty', True):
+            rects = super().pop_dirty_rects()
+            for button in self.buttons.values():
+                button.pop_dirty_rects()
+            self._drawn_labels = self._visible_labels(self.current_tab)
+            return rects
+        
+        rects = []
+        for button in self._visible_buttons(self.current_tab):
+            rects.extend(button.pop_dirty_rects())
+        labels = self._visible_labels(self.current_tab)
+        for key, (text, rect) in labels.items():
+            drawn = self._drawn_labels.get(key)
+            if drawn is None or drawn[0] != text:
+                rects.append(rect if drawn is None else union_rects(rect, drawn[1]))
+        self._drawn_labels = labels
+        return rects
+    
+    def draw(self, canvas, current_tab=None, origin=(0, 0)):
         """설정 패널 그리기 (현재 탭에 맞게)"""
+        if current_tab is not None:
+            self.current_tab = current_tab
+        x, y = self.x - origin[0], self.y - origin[1]
         # 패널 배경
-        cv2.rectangle(canvas, (self.x, self.y),
-                     (self.x + self.width, self.y + self.height),
+        cv2.rectangle(canvas, (x, y),
+                     (x + self.width, y + self.height),
                      UIConstants.COLOR_PANEL, -1)
         
         # 제목
-        cv2.putText(canvas, 'Detailed Settings',
-                   (self.x + UIConstants.PADDING, self.y + 15),
-                   cv2.FONT_HERSHEY_SIMPLEX, UIConstants.FONT_SCALE_LARGE,
-                   UIConstants.COLOR_TEXT, UIConstants.FONT_THICKNESS)
-        
-        # 현재 탭에 맞는 버튼만 그리기
-        if current_tab == 'Pixel':
-            # Pixel 탭 버튼
-            if 'grayscale' in self.buttons:
-                self.buttons['grayscale'].draw(canvas)
-            if 'invert' in self.buttons:
-                self.buttons['invert'].draw(canvas)
-            # Pixel 탭 트랙바 라벨
-            for key in ['brightness', 'contrast', 'threshold']:
-                if key in self.trackbar_labels:
-                    label_info = self.trackbar_labels[key]
-                    text = label_info['text_getter']()
-                    cv2.putText(canvas, text,
-                               (label_info['x'], label_info['y']),
-                               cv2.FONT_HERSHEY_SIMPLEX, UIConstants.FONT_SCALE_MEDIUM,
-                               UIConstants.COLOR_TEXT, UIConstants.FONT_THICKNESS)
+        draw_text(canvas, 'Detailed Settings', (x + UIConstants.PADDING, y + 15),
+                  UIConstants.FONT_SCALE_LARGE, UIConstants.COLOR_TEXT, UIConstants.FONT_THICKNESS,
+                  background=UIConstants.COLOR_PANEL)
         
-        elif current_tab == 'Area':
-            # Area 탭 트랙바 라벨만
-            for key in ['blur', 'canny_low', 'canny_high', 'sharpen']:
-                if key in self.trackbar_labels:
-                    label_info = self.trackbar_labels[key]
-                    text = label_info['text_getter']()
-                    cv2.putText(canvas, text,
-                               (label_info['x'], label_info['y']),
-                               cv2.FONT_HERSHEY_SIMPLEX, UIConstants.FONT_SCALE_MEDIUM,
-                               UIConstants.COLOR_TEXT, UIConstants.FONT_THICKNESS)
-        
-        elif current_tab == 'Geometric':
-            # Geometric 탭 버튼
-            if 'flip_h' in self.buttons:
-                self.buttons['flip_h'].draw(canvas)
-            if 'flip_v' in self.buttons:
-                self.buttons['flip_v'].draw(canvas)
-            # Geometric 탭 트랙바 라벨
-            for key in ['rotation', 'resize_w', 'resize_h']:
-                if key in self.trackbar_labels:
-                    label_info = self.trackbar_labels[key]
-                    text = label_info['text_getter']()
-                    cv2.putText(canvas, text,
-                               (label_info['x'], label_info['y']),
-                               cv2.FONT_HERSHEY_SIMPLEX, UIConstants.FONT_SCALE_MEDIUM,
-                               UIConstants.COLOR_TEXT, UIConstants.FONT_THICKNESS)
-        
-        # RESET 버튼은 항상 표시
-        if 'reset' in self.buttons:
-            self.buttons['reset'].draw(canvas)
-
+        # 현재 탭에 맞는 버튼과 트랙바 라벨만 그리기 (RESET 버튼은 항상 표시)
+        for button in self._visible_buttons(self.current_tab):
+            button.draw(canvas, origin)
+        for key in self.TAB_LABELS.get(self.current_tab, []):
+            if key in self.trackbar_labels:
+                label_info = self.trackbar_labels[key]
+                text = label_info['text_getter']()
+                draw_text(canvas, text, (label_info['x'] - origin[0], label_info['y'] - origin[1]),
+                          UIConstants.FONT_SCALE_MEDIUM, UIConstants.COLOR_TEXT, UIConstants.FONT_THICKNESS,
+                          background=UIConstants.COLOR_PANEL)
@@ -0,0 +1,105 @@
+"""
+히스토그램 위젯 모듈
+처리 결과의 채널별/휘도 히스토그램을 표시
+"""
+
+import numpy as np
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtCore import Qt, QPointF
+from PyQt5.QtGui import QPainter, QColor, QPolygonF
+
+from image_processor import pixel_processing
+from image_processor.tracing import tracer
+
+
+class HistogramWidget(QWidget):
+    """히스토그램 위젯 (단일 책임: 처리 결과의 분포 표시)
+
+    set_image()는 이미지 참조만 저장하고, 실제 계산은 다음 paintEvent에서
+    표본(proxy)으로 한 번만 수행합니다. 드래그 중 여러 입력이 한 프레임에 모여도
+    마지막 결과만 계산되며, 같은 결과를 다시 그릴 때는 계산하지 않습니다.
+    """
+
+    # 채널별 선 색상 (휘도는 흰색 영역으로 표시)
+    CHANNEL_COLORS = {
+        'b': QColor(80, 140, 255, 200),
+        'g': QColor(80, 220, 120, 200),
+        'r': QColor(255, 90, 90, 200),
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._image = None
+        self._cached_for = None   # 히스토그램을 계산한 이미지 객체
+        self._histograms = None
+        self.setFixedHeight(120)
+        self.setStyleSheet("background-color: #1e1e1e;")
+
+    def set_image(self, image):
+        """표시할 이미지 설정 (계산은 다음 페인트 시점으로 미룸)
+
+        처리 버퍼는 재사용될 수 있으므로 같은 객체라도 새 결과로 보고 캐시를 비웁니다.
+        """
+        self._image = image
+        self._cached_for = None
+        self.update()
+
+    def set_histograms(self, histograms):
+        """이미 계산된 히스토그램 설정 (렌더 워커가 결과와 함께 계산한 경우)"""
+        self._image = None
+        self._cached_for = None
+        self._histograms = histograms
+        self.update()
+
+    def clear(self):
+        """히스토그램 지우기"""
+        self._image = None
+        self._cached_for = None
+        self._histograms = None
+        self.update()
+
+    def histograms(self):
+        """현재 이미지의 히스토그램 (결과 객체별 캐시)"""
+        if self._image is None:
+            return self._histograms  # set_histograms()로 설정한 값 (없으면 None)
+        if self._cached_for is not self._image:
+            with tracer.span('histogram', 'display'):
+                self._histograms = pixel_processing.calc_histograms(self._image)
+            self._cached_for = self._image
+        return self._histograms
+
+    def paintEvent(self, event):
+        """그리기 이벤트"""
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor(30, 30, 30))
+
+        histograms = self.histograms()
+        if histograms is None:
+            return
+
+        painter.setRenderHint(QPainter.Antialiasing)
+        w, h = self.width(), self.height()
+        # 단색 배경 등의 뾰족한 빈이 나머지를 가리지 않도록 제곱근 눈금 사용
+        # 모든 채널 공통 최대값으로 정규화 (채널 간 비교 가능)
+        scaled = {name: np.sqrt(hist) for name, hist in histograms.items()}
+        peak = max(float(hist.max()) for hist in scaled.values()) or 1.0
+
+        def polygon(hist):
+            points = QPolygonF()
+            points.append(QPointF(0, h))
+            for i, count in enumerate(hist):
+                points.append(QPointF(i * (w - 1) / 255.0, h - count / peak * (h - 4)))
+            points.append(QPointF(w - 1, h))
+            return points
+
+        # 휘도 (채워진 영역)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(200, 200, 200, 90))
+        painter.drawPolygon(polygon(scaled['luma']))
+
+        # 채널별 선
+        painter.setBrush(Qt.NoBrush)
+        for name, color in self.CHANNEL_COLORS.items():
+            if name in scaled:
+                painter.setPen(color)
+                painter.drawPolyline(polygon(scaled[name]))
@@ -0,0 +1,154 @@
+"""
+입력-화면 지연 모니터 모듈
+슬라이더/버튼 입력 시점부터 해당 결과의 paintEvent 완료까지의 지연과
+Qt 이벤트 루프 정체(stall)를 측정
+"""
+
+import csv
+import math
+import os
+import time
+from collections import deque
+
+from PyQt5.QtCore import QObject, QTimer
+
+
+def percentile(sorted_values, p):
+    """정렬된 값 목록의 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(p / 100.0 * len(sorted_values)) - 1
+    return sorted_values[max(0, min(rank, len(sorted_values) - 1))]
+
+
+class LatencyMonitor(QObject):
+    """입력-화면 지연 모니터 (단일 책임: 입력~페인트 완료 지연 및 이벤트 루프 정체 측정)
+
+    mark_input()은 SettingsPanel의 입력 시그널에서, mark_painted()는
+    ImageDisplayWidget.paintEvent 끝에서 호출됩니다. 한 번의 페인트 이전에
+    쌓인 입력들은 모두 그 페인트로 완료된 것으로 기록됩니다.
+    """
+
+    def __init__(self, parent=None, heartbeat_ms: int = 16,
+                 stall_threshold_ms: float = 50.0, max_samples: int = 5000):
+        super().__init__(parent)
+        self.enabled: bool = False
+        self.overlay_enabled: bool = False
+        self.samples = deque(maxlen=max_samples)  # (입력 이름, 지연 ms)
+        self.stalls = deque(maxlen=max_samples)  # 정체 시간 ms
+        self.stall_threshold_ms = stall_threshold_ms
+        self._pending = []  # 페인트를 기다리는 (입력 이름, 시각 ns)
+        self._last_beat_ns = None
+        self._csv_file = None
+        self._csv_writer = None
+
+        # 이벤트 루프 정체 감지용 하트비트 타이머
+        self._heartbeat = QTimer(self)
+        self._heartbeat.setInterval(heartbeat_ms)
+        self._heartbeat.timeout.connect(self._on_heartbeat)
+
+    def start(self, csv_path: str = None, overlay: bool = True):
+        """측정 시작
+
+        Args:
+            csv_path: CSV 로그 경로 (None이면 로그를 남기지 않음)
+            overlay: 화면 오버레이 표시 여부
+        """
+        self.enabled = True
+        self.overlay_enabled = overlay
+        self._pending = []
+        self._last_beat_ns = time.perf_counter_ns()
+        self._heartbeat.start()
+        if csv_path:
+            self._open_csv(csv_path)
+
+    def stop(self):
+        """측정 중지"""
+        self.enabled = False
+        self.overlay_enabled = False
+        self._pending = []
+        self._heartbeat.stop()
+        self._close_csv()
+
+    def reset(self):
+        """기록 초기화"""
+        self.samples.clear()
+        self.stalls.clear()
+        self._pending = []
+
+    def mark_input(self, source: str):
+        """입력 이벤트 시점 기록"""
+        if not self.enabled:
+            return
+        self._pending.append((source, time.perf_counter_ns()))
+
+    def mark_painted(self):
+        """페인트 완료 시점 기록 - 대기 중인 입력들의 지연 확정"""
+        if not self.enabled or not self._pending:
+            return
+        now = time.perf_counter_ns()
+        for source, start in self._pending:
+            latency_ms = (now - start) / 1e6
+            self.samples.append((source, latency_ms))
+            self._write_csv('input', source, latency_ms)
+        self._pending = []
+
+    def _on_heartbeat(self):
+        """하트비트 - 예상 간격보다 늦게 호출되면 정체로 기록"""
+        now = time.perf_counter_ns()
+        if self._last_beat_ns is not None:
+            gap_ms = (now - self._last_beat_ns) / 1e6
+            stall_ms = gap_ms - self._heartbeat.interval()
+            if stall_ms >= self.stall_threshold_ms:
+                self.stalls.append(stall_ms)
+                self._write_csv('stall', 'event_loop', stall_ms)
+        self._last_beat_ns = now
+
+    def percentiles(self):
+        """지연 p50/p95/p99 (ms) 반환"""
+        values = sorted(latency for _, latency in self.samples)
+        return {
+            'p50': percentile(values, 50),
+            'p95': percentile(values, 95),
+            'p99': percentile(values, 99),
+            'count': len(values),
+        }
+
+    def summary_text(self) -> str:
+        """오버레이/상태바용 요약 문자열"""
+        stats = self.percentiles()
+        text = (f"Latency p50 {stats['p50']:.1f} | p95 {stats['p95']:.1f} | "
+                f"p99 {stats['p99']:.1f} ms (n={stats['count']})")
+        if self.stalls:
+            text += f" | Stalls {len(self.stalls)} (max {max(self.stalls):.0f} ms)"
+        return text
+
+    def _open_csv(self, csv_path):
+        """CSV 로그 열기"""
+        self._close_csv()
+        try:
+            directory = os.path.dirname(csv_path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            is_new = not os.path.exists(csv_path)
+            self._csv_file = open(csv_path, 'a', newline='', encoding='utf-8')
+            self._csv_writer = csv.writer(self._csv_file)
+            if is_new:
+                self._csv_writer.writerow(['time', 'kind', 'source', 'ms'])
+        except Exception as e:
+            print(f"지연 로그 열기 오류: {e}")
+            self._csv_file = None
+            self._csv_writer = None
+
+    def _write_csv(self, kind, source, value_ms):
+        """CSV 로그 1줄 기록"""
+        if self._csv_writer is None:
+            return
+        self._csv_writer.writerow([f"{time.time():.3f}", kind, source, f"{value_ms:.3f}"])
+
+    def _close_csv(self):
+        """CSV 로그 닫기"""
+        if self._csv_file is not None:
+            self._csv_file.close()
+        self._csv_file = None
+        self._csv_writer = None
@@ -0,0 +1,47 @@
+"""
+메모리 사용량 보기 모듈
+메모리 예산에 등록된 하위 시스템별 사용량을 주기적으로 표시 (디버그용)
+"""
+
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import QLabel, QVBoxLayout, QWidget
+
+from image_processor.memory_budget import memory_budget
+
+
+class MemoryView(QWidget):
+    """메모리 사용량 보기 (단일 책임: 하위 시스템별 사용량과 제거 횟수 표시)
+
+    창이 보이는 동안만 interval_ms마다 다시 읽습니다.
+    """
+
+    def __init__(self, parent=None, budget=None, interval_ms: int = 1000):
+        super().__init__(parent, Qt.Window)
+        self.budget = budget or memory_budget
+        self.setWindowTitle('Memory Usage')
+        self.setStyleSheet("background-color: #1e1e1e; color: #dcdcdc;")
+        layout = QVBoxLayout(self)
+        self.label = QLabel()
+        font = QFont('Monospace')
+        font.setStyleHint(QFont.TypeWriter)
+        self.label.setFont(font)
+        self.label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        layout.addWidget(self.label)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.refresh)
+
+    def refresh(self):
+        """사용량 다시 읽기"""
+        self.label.setText(self.budget.format_report())
+
+    def showEvent(self, event):
+        self.refresh()
+        self._timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self._timer.stop()
+        super().hideEvent(event)
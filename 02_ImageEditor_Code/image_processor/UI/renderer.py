@@ -1,36 +1,145 @@
 """
 UI 렌더러
 모든 UI 요소를 그리는 책임을 가짐 (Single Responsibility)
+
+캔버스는 한 번만 만들고 유지합니다 (retained). render()는 컴포넌트가 보고한
+dirty 영역만 배경부터 다시 그리고, 화면 배율로 줄인 이미지는 이미지가 바뀔 때까지 캐시합니다.
 """
 
 import cv2
 import numpy as np
 from .constants import UIConstants
+from .text_cache import draw_text
+from .components import intersect_rects, union_rects
+from ..geometric_processing import apply_resize
 
 
 class UIRenderer:
     """UI 렌더러 클래스"""
     
+    # dirty 영역 합이 캔버스의 이 비율을 넘으면 영역 하나로 합쳐 한 번에 다시 그림
+    FULL_REDRAW_RATIO = 0.6
+    
     def __init__(self, layout_manager):
         self.layout = layout_manager
+        self.canvas = None  # 유지 캔버스 (create_canvas에서 한 번 생성)
+        self._pending = []  # invalidate()로 요청된 영역
+        self._file_info = None  # 마지막으로 그린 정보 바 글자
+        self._image = None  # 마지막으로 그린 원본 이미지 (객체 기준 비교)
+        self._scaled_image = None  # 화면 배율로 줄인 BGR 이미지 캐시
+        self.last_dirty_rects = []  # 마지막 render()에서 다시 그린 영역 (측정용)
     
     def create_canvas(self):
-        """새 캔버스 생성"""
-        return np.full((UIConstants.WINDOW_HEIGHT, UIConstants.WINDOW_WIDTH, 3),
-                      UIConstants.COLOR_BG, dtype=np.uint8)
+        """유지 캔버스 반환 (처음 호출할 때만 생성, 이후에는 같은 캔버스 재사용)"""
+        if self.canvas is None:
+            self.canvas = np.full((UIConstants.WINDOW_HEIGHT, UIConstants.WINDOW_WIDTH, 3),
+                                  UIConstants.COLOR_BG, dtype=np.uint8)
+            self.invalidate()
+        return self.canvas
+    
+    def invalidate(self, rect=None):
+        """다음 render()에서 다시 그릴 영역 추가 (None이면 캔버스 전체)"""
+        self._pending.append(rect or (0, 0, UIConstants.WINDOW_WIDTH, UIConstants.WINDOW_HEIGHT))
+    
+    def invalidate_image(self):
+        """이미지를 제자리에서 수정한 경우 호출 - 화면 배율 이미지를 다시 만듦"""
+        self._image = None
+        self._scaled_image = None
+    
+    def render(self, tabs, active_tab, file_list, settings_panel, dropdown_menu,
+               image=None, file_info=''):
+        """바뀐 영역만 다시 그린 유지 캔버스 반환
+        
+        Args:
+            tabs: {탭 이름: Tab}
+            active_tab: 활성 탭 이름
+            file_list: FileList
+            settings_panel: SettingsPanel
+            dropdown_menu: DropdownMenu
+            image: 표시할 이미지 (같은 객체를 제자리에서 수정했다면 invalidate_image() 호출)
+            file_info: 정보 바 글자
+        
+        Returns:
+            numpy.ndarray: 캔버스 (다음 render()에서 다시 사용되므로 보관하려면 복사)
+        """
+        canvas = self.create_canvas()
+        
+        for tab_name, tab in tabs.items():
+            tab.is_active = (tab_name == active_tab)
+        settings_panel.current_tab = active_tab
+        
+        # 컴포넌트와 렌더러가 관리하는 영역(정보 바, 이미지)에서 dirty 영역 수집
+        rects, self._pending = self._pending, []
+        if file_info != self._file_info:
+            self._file_info = file_info
+            rects.append(self.layout.info_bar_rect)
+        if image is not self._image or (image is not None and self._scaled_image is None):
+            self._set_image(image)
+            rects.append(self.layout.image_area_rect)
+        for component in list(tabs.values()) + [file_list, settings_panel, dropdown_menu]:
+            rects.extend(component.pop_dirty_rects())
+        
+        self.last_dirty_rects = self._merge_rects(rects)
+        for rect in self.last_dirty_rects:
+            x, y, w, h = rect
+            view = canvas[y:y + h, x:x + w]
+            origin = (x, y)
+            view[:] = UIConstants.COLOR_BG
+            # 아래 레이어부터 그림 (영역 밖은 view 경계에서 잘림)
+            if intersect_rects(rect, self.layout.top_bar_rect):
+                self.draw_top_bar(view, origin)
+            if intersect_rects(rect, self.layout.info_bar_rect):
+                self.draw_info_bar(view, self._file_info, origin)
+            for tab in tabs.values():
+                if intersect_rects(rect, tab.bounds()):
+                    tab.draw(view, origin)
+            if intersect_rects(rect, file_list.bounds()):
+                file_list.draw(view, origin)
+            if intersect_rects(rect, self.layout.image_area_rect):
+                self._draw_scaled_image(view, origin)
+            if intersect_rects(rect, settings_panel.bounds()):
+                settings_panel.draw(view, active_tab, origin)
+            menu_bounds = dropdown_menu.bounds()
+            if menu_bounds is not None and intersect_rects(rect, menu_bounds):
+                dropdown_menu.draw(view, origin)
+        return canvas
+    
+    def _merge_rects(self, rects):
+        """캔버스 안으로 자르고 겹치는 영역을 합침"""
+        canvas_rect = (0, 0, UIConstants.WINDOW_WIDTH, UIConstants.WINDOW_HEIGHT)
+        merged = []
+        for rect in rects:
+            rect = intersect_rects(rect, canvas_rect)
+            if rect is None:
+                continue
+            # 겹치는 영역을 모두 흡수 (합친 결과가 다른 영역과 새로 겹칠 수 있으므로 반복)
+            overlapping = [other for other in merged if intersect_rects(rect, other)]
+            while overlapping:
+                for other in overlapping:
+                    merged.remove(other)
+                    rect = union_rects(rect, other)
+                overlapping = [other for other in merged if intersect_rects(rect, other)]
+            merged.append(rect)
+        
+        area = sum(w * h for _, _, w, h in merged)
+        if area > canvas_rect[2] * canvas_rect[3] * self.FULL_REDRAW_RATIO:
+            return [canvas_rect]
+        return merged
     
-    def draw_top_bar(self, canvas):
+    def draw_top_bar(self, canvas, origin=(0, 0)):
         """상단 바 그리기"""
         x, y, w, h = self.layout.top_bar_rect
+        x, y = x - origin[0], y - origin[1]
         cv2.rectangle(canvas, (x, y), (x + w, y + h), UIConstants.COLOR_PANEL, -1)
     
-    def draw_info_bar(self, canvas, file_info):
+    def draw_info_bar(self, canvas, file_info, origin=(0, 0)):
         """정보 바 그리기"""
         x, y, w, h = self.layout.info_bar_rect
+        x, y = x - origin[0], y - origin[1]
         cv2.rectangle(canvas, (x, y), (x + w, y + h), UIConstants.COLOR_PANEL_DARK, -1)
-        cv2.putText(canvas, file_info, (x + UIConstants.PADDING, y + 20),
-                   cv2.FONT_HERSHEY_SIMPLEX, UIConstants.FONT_SCALE_MEDIUM,
-                   UIConstants.COLOR_TEXT, UIConstants.FONT_THICKNESS)
+        draw_text(canvas, file_info or '', (x + UIConstants.PADDING, y + 20),
+                  UIConstants.FONT_SCALE_MEDIUM, UIConstants.COLOR_TEXT, UIConstants.FONT_THICKNESS,
+                  background=UIConstants.COLOR_PANEL_DARK)
     
     def draw_tabs(self, canvas, tabs, active_tab):
         """탭들 그리기"""
@@ -51,27 +160,47 @@ class UIRenderer:
         settings_panel.draw(canvas, current_tab)
     
     def draw_image(self, canvas, image):
-        """이미지 그리기"""
+        """이미지 그리기 (화면 배율 이미지는 이미지가 바뀔 때만 다시 만듦)"""
+        if image is None:
+            return
+        if image is not self._image or self._scaled_image is None:
+            self._set_image(image)
+        self._draw_scaled_image(canvas)
+    
+    def _set_image(self, image):
+        """표시할 이미지 변경 - 이미지 영역에 맞게 줄이고 BGR로 변환하여 캐시"""
+        self._image = image
         if image is None:
+            self._scaled_image = None
             return
         
-        x, y, w, h = self.layout.image_area_rect
+        _, _, w, h = self.layout.image_area_rect
         
         # 이미지 크기 조정
         img_h, img_w = image.shape[:2]
         scale = min(w / img_w, h / img_h)
         
         if scale < 1.0:
-            display_img = cv2.resize(image, None, fx=scale, fy=scale,
-                                    interpolation=cv2.INTER_AREA)
+            # 큰 축소는 절반 줄이기를 반복한 뒤 마지막 배율만 INTER_AREA (resize_strategy)
+            display_img = apply_resize(image, max(1, round(img_w * scale)), max(1, round(img_h * scale)))
         else:
             display_img = image.copy()
         
         # 그레이스케일을 컬러로 변환
         if len(display_img.shape) == 2:
             display_img = cv2.cvtColor(display_img, cv2.COLOR_GRAY2BGR)
-        
-        # 캔버스에 붙여넣기
-        disp_h, disp_w = display_img.shape[:2]
-        canvas[y:y + disp_h, x:x + disp_w] = display_img
-
+        self._scaled_image = display_img
+    
+    def _draw_scaled_image(self, canvas, origin=(0, 0)):
+        """캐시된 화면 배율 이미지를 캔버스에 붙여넣기 (캔버스 밖은 잘라냄)"""
+        if self._scaled_image is None:
+            return
+        x, y, _, _ = self.layout.image_area_rect
+        disp_h, disp_w = self._scaled_image.shape[:2]
+        canvas_h, canvas_w = canvas.shape[:2]
+        clip = intersect_rects((x - origin[0], y - origin[1], disp_w, disp_h), (0, 0, canvas_w, canvas_h))
+        if clip is None:
+            return
+        cx, cy, cw, ch = clip
+        sx, sy = cx - (x - origin[0]), cy - (y - origin[1])
+        canvas[cy:cy + ch, cx:cx + cw] = self._scaled_image[sy:sy + ch, sx:sx + cw]
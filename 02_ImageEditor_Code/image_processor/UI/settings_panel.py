@@ -125,6 +125,42 @@ class SettingsPanel(QWidget):
         """File 설정 위젯 반환"""
         return self.file_settings
 
+    def get_sliders(self):
+        """모든 슬라이더를 {키: 슬라이더} 형태로 반환 (trackbar_values 키와 동일)"""
+        return {
+            'brightness': self.pixel_settings.get_brightness_slider(),
+            'contrast': self.pixel_settings.get_contrast_slider(),
+            'threshold': self.pixel_settings.get_threshold_slider(),
+            'clahe': self.pixel_settings.get_clahe_slider(),
+            'blur': self.area_settings.get_blur_slider(),
+            'canny_low': self.area_settings.get_canny_low_slider(),
+            'canny_high': self.area_settings.get_canny_high_slider(),
+            'sharpen': self.area_settings.get_sharpen_slider(),
+            'rotation': self.geometric_settings.get_rotation_slider(),
+            'resize_w': self.geometric_settings.get_resize_w_slider(),
+            'resize_h': self.geometric_settings.get_resize_h_slider()
+        }
+
+    def get_toggle_buttons(self):
+        """모든 토글 버튼을 {키: 버튼} 형태로 반환 (button_states 키와 동일)"""
+        return {
+            'grayscale': self.pixel_settings.get_grayscale_button(),
+            'invert': self.pixel_settings.get_invert_button(),
+            'flip_h': self.geometric_settings.get_flip_h_button(),
+            'flip_v': self.geometric_settings.get_flip_v_button()
+        }
+
+    def attach_latency_monitor(self, monitor):
+        """입력-화면 지연 모니터 연결
+
+        편집기의 처리 슬롯보다 먼저 연결해야 입력 시점이 처리 전에 기록됩니다.
+        """
+        for key, slider in self.get_sliders().items():
+            slider.valueChanged.connect(lambda val, k=key: monitor.mark_input(k))
+        for key, btn in self.get_toggle_buttons().items():
+            btn.clicked.connect(lambda checked, k=key: monitor.mark_input(k))
+        self.reset_btn.clicked.connect(lambda checked: monitor.mark_input('reset'))
+
 
 class PixelSettings(QWidget):
     """Pixel 처리 설정 위젯 (단일 책임: Pixel 처리 관련 컨트롤)"""
@@ -166,6 +202,10 @@ class PixelSettings(QWidget):
         # Threshold 슬라이더 (1줄)
         self.threshold_group = self._create_slider_group_row('Threshold', 0, 255, 127)
         layout.addLayout(self.threshold_group)
+        
+        # CLAHE 슬라이더 (1줄) - 지역 히스토그램 평활화 대비 제한 × 10 (0이면 끔)
+        self.clahe_group = self._create_slider_group_row('CLAHE', 0, 40, 0)
+        layout.addLayout(self.clahe_group)
     
     def _create_toggle_button(self, text, width, height):
         """토글 버튼 생성"""
@@ -242,6 +282,10 @@ class PixelSettings(QWidget):
     def get_threshold_slider(self):
         """Threshold 슬라이더 반환"""
         return self.threshold_group.slider
+    
+    def get_clahe_slider(self):
+        """CLAHE 슬라이더 반환"""
+        return self.clahe_group.slider
 
 
 class AreaSettings(QWidget):
@@ -257,8 +301,8 @@ class AreaSettings(QWidget):
         layout.setSpacing(5)
         layout.setContentsMargins(0, 0, 0, 0)
         
-        # Blur 슬라이더 (1줄)
-        self.blur_group = self._create_slider_group_row('Blur', 0, 20, 0)
+        # Blur 슬라이더 (1줄) - 블러 반경 (큰 반경도 피라미드 방식으로 빠르게 처리)
+        self.blur_group = self._create_slider_group_row('Blur', 0, 200, 0)
         layout.addLayout(self.blur_group)
         
         # Canny Low 슬라이더 (1줄)
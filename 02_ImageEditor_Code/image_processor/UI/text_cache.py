@@ -0,0 +1,134 @@
+"""
+글자 스프라이트 캐시
+레거시 OpenCV UI의 글자를 한 번만 래스터화하여 보관하고
+이후에는 NumPy 슬라이싱(메모리 복사)으로 캔버스에 붙여넣음
+"""
+
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+import cv2
+import numpy as np
+
+from ..memory_budget import memory_budget
+
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+
+@lru_cache(maxsize=1024)
+def text_size(text, font_scale, thickness):
+    """cv2.getTextSize 결과 ((w, h), baseline) - 같은 인자는 한 번만 계산"""
+    return cv2.getTextSize(text, FONT, font_scale, thickness)
+
+
+class TextSpriteCache:
+    """글자 스프라이트 캐시 (단일 책임: 글자 래스터화 결과 보관, LRU 제거)
+    
+    키는 (글자, 글꼴 배율, 두께, 글자 색, 배경색)입니다. 스프라이트는 배경색으로 채운
+    블록에 cv2.putText로 그린 결과이므로, 글자 영역 아래가 실제로 그 배경색일 때
+    putText와 화소 단위로 같습니다 (OpenCV 5의 putText는 안티에일리어싱으로 배경과 섞음).
+    """
+    
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._sprites = OrderedDict()  # 키 -> (기준점에서 블록 왼쪽 위까지의 (dx, dy), 블록)
+        self.hits = 0
+        self.misses = 0
+        self.last_used = 0.0  # 마지막 조회 시각 (메모리 예산의 최근 사용 기준)
+    
+    def get(self, text, font_scale, color, thickness, background):
+        """스프라이트 반환 (없으면 래스터화하여 저장, 오래 쓰지 않은 항목부터 제거)"""
+        key = (text, font_scale, thickness, tuple(color), tuple(background))
+        self.last_used = time.monotonic()
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+        self.misses += 1
+        sprite = self._rasterize(text, font_scale, color, thickness, background)
+        self._sprites[key] = sprite
+        while len(self._sprites) > self.max_entries:
+            self._sprites.popitem(last=False)
+        return sprite
+    
+    @staticmethod
+    def _rasterize(text, font_scale, color, thickness, background):
+        """여유 있는 블록에 그린 뒤 글자가 닿은 영역만 잘라 보관"""
+        (text_w, text_h), baseline = text_size(text, font_scale, thickness)
+        pad = thickness * 2 + 2
+        org = (pad, pad + text_h)
+        size = (text_h + baseline + pad * 2, text_w + pad * 2)
+        # 글자가 닿는 화소 찾기 (흰 글자를 검은 바탕에)
+        coverage = np.zeros(size, dtype=np.uint8)
+        cv2.putText(coverage, text, org, FONT, font_scale, 255, thickness)
+        ys, xs = np.nonzero(coverage)
+        if len(ys) == 0:
+            # 공백만 있는 글자 - 그릴 화소 없음
+            return (0, 0), np.zeros((0, 0, 3), dtype=np.uint8)
+        y0, y1, x0, x1 = ys.min(), ys.max() + 1, xs.min(), xs.max() + 1
+        block = np.empty(size + (3,), dtype=np.uint8)
+        block[:] = background
+        cv2.putText(block, text, org, FONT, font_scale, color, thickness)
+        return (int(x0 - org[0]), int(y0 - org[1])), np.ascontiguousarray(block[y0:y1, x0:x1])
+    
+    def draw(self, canvas, text, org, font_scale, color, thickness, background):
+        """배경색 위에 cv2.putText로 그린 것과 같은 결과를 복사로 그림
+        
+        캔버스 밖으로 나가는 부분은 잘라냅니다 (캔버스 일부 view에 그릴 때).
+        """
+        (dx, dy), block = self.get(text, font_scale, color, thickness, background)
+        h, w = block.shape[:2]
+        x, y = org[0] + dx, org[1] + dy
+        canvas_h, canvas_w = canvas.shape[:2]
+        cx0, cy0 = max(x, 0), max(y, 0)
+        cx1, cy1 = min(x + w, canvas_w), min(y + h, canvas_h)
+        if cx1 <= cx0 or cy1 <= cy0:
+            return
+        canvas[cy0:cy1, cx0:cx1] = block[cy0 - y:cy1 - y, cx0 - x:cx1 - x]
+    
+    def clear(self):
+        """캐시 비우기"""
+        self._sprites.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self):
+        return len(self._sprites)
+    
+    @property
+    def nbytes(self):
+        """보관 중인 스프라이트 메모리 (바이트)"""
+        return sum(block.nbytes for _, block in self._sprites.values())
+    
+    def memory_usage(self):
+        """메모리 예산 보고용 바이트 수"""
+        return self.nbytes
+    
+    def memory_candidates(self):
+        """제거 후보 - 캐시 전체 1개 (다시 래스터화하면 되므로 비용이 작음)"""
+        return [('all', self.nbytes, self.last_used, 0.001)] if self._sprites else []
+    
+    def evict_memory(self, key):
+        """캐시 비우기"""
+        freed = self.nbytes
+        self._sprites.clear()
+        return freed
+
+
+# 레거시 UI 컴포넌트가 함께 사용하는 캐시
+text_cache = TextSpriteCache()
+memory_budget.register('text_sprites', text_cache)
+
+
+def draw_text(canvas, text, org, font_scale, color, thickness=1, background=None):
+    """글자 그리기 (cv2.putText 대체)
+    
+    background: 글자 영역 아래의 단색 배경 (BGR). 지정하면 캐시된 스프라이트를 복사하고,
+                None이면(배경이 단색이 아니거나 다른 요소와 겹치는 경우) cv2.putText로 그림
+    """
+    if background is None:
+        cv2.putText(canvas, text, org, FONT, font_scale, color, thickness)
+    else:
+        text_cache.draw(canvas, text, org, font_scale, color, thickness, background)
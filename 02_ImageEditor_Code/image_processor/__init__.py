@@ -1,12 +1,22 @@
 """
 이미지 처리 모듈
 OpenCV와 NumPy만을 사용한 순수 이미지 처리 함수들
+
+하위 모듈은 처음 사용할 때 불러옵니다 (PEP 562).
+`from image_processor import pipeline`처럼 필요한 모듈만 불러오면 됩니다.
 """
 
-from . import pixel_processing
-from . import area_processing
-from . import geometric_processing
-from . import file_operations
+import importlib
+
+__all__ = ['pixel_processing', 'area_processing', 'geometric_processing', 'file_operations', 'tracing', 'conversion_cache', 'buffer_pool', 'pipeline', 'video_processing', 'session_store', 'render_service', 'render_worker', 'memory_budget', 'clahe', 'median', 'morphology', 'blur', 'warp']
+
+
+def __getattr__(name):
+    """처음 접근할 때 하위 모듈 불러오기"""
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f'.{name}', __name__)
 
-__all__ = ['pixel_processing', 'area_processing', 'geometric_processing', 'file_operations']
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,45 +1,56 @@
 """
 영역 처리 (Area Processing) 모듈
 주변 픽셀을 고려한 필터링 기반 이미지 처리 함수들
+
+모든 처리 함수는 선택 인자 dst=(출력 버퍼)를 받습니다. 결과가 dst에 쓰이지 않을 수
+있으므로(효과 없음, 크기 불일치 등) 항상 반환값을 사용해야 합니다.
 """
 
 import cv2
 import numpy as np
 
+from . import morphology
+from .blur import blur_engine
+from .conversion_cache import convert, expand_gray
+from .median import median_filter
+
 
-def apply_blur(img, value):
+def apply_blur(img, value, dst=None, method=None, levels=None):
     """가우시안 블러 적용
-    value: 블러 강도 (0 ~ 20, 홀수만 유효)
+    value: 블러 반경 (0 ~ 200, 커널 크기 value * 2 + 1의 가우시안)
+    반경에 따라 직접/상자 블러/피라미드 방식 중 비용이 가장 작은 것을 고름 (blur.py)
+    method, levels: 전체 이미지 기준으로 정한 방식과 피라미드 단계 수 (ROI 처리용, 선택)
     """
     if value <= 0:
         return img
     
-    # 홀수로 변환
-    kernel_size = value * 2 + 1
-    return cv2.GaussianBlur(img, (kernel_size, kernel_size), 0)
+    return blur_engine.apply(img, value, dst=dst, method=method, levels=levels)
 
 
-def apply_canny(img, low_threshold, high_threshold):
+def apply_canny(img, low_threshold, high_threshold, cache=None, dst=None, keep_channels=False):
     """캐니 엣지 검출
     low_threshold: 낮은 임계값
     high_threshold: 높은 임계값
+    cache: ConversionCache (같은 버퍼의 변환 결과 재사용, 선택)
+    keep_channels: True이면 컬러 입력의 결과를 BGR 3채널로 확장 (기본은 1채널 유지)
     """
     if len(img.shape) == 3:
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        gray = convert(img, 'gray', cache)
     else:
         gray = img
     
-    edges = cv2.Canny(gray, low_threshold, high_threshold)
+    if keep_channels and len(img.shape) == 3:
+        edges = cv2.Canny(gray, low_threshold, high_threshold)
+        return expand_gray(edges, cache, dst)
     
-    # 원본이 컬러였으면 컬러로 변환
-    if len(img.shape) == 3:
-        return cv2.cvtColor(edges, cv2.COLOR_GRAY2BGR)
-    return edges
+    # 엣지 결과는 1채널로 유지
+    return cv2.Canny(gray, low_threshold, high_threshold, edges=dst)
 
 
-def apply_median_blur(img, kernel_size):
+def apply_median_blur(img, kernel_size, dst=None):
     """미디언 블러 적용
     kernel_size: 커널 크기 (홀수, 3 이상)
+    cv2.medianBlur와 같은 결과이며, 큰 이미지는 띠로 나누어 병렬 처리 (median.py)
     """
     if kernel_size < 3:
         return img
@@ -48,10 +59,10 @@ def apply_median_blur(img, kernel_size):
     if kernel_size % 2 == 0:
         kernel_size += 1
     
-    return cv2.medianBlur(img, kernel_size)
+    return median_filter.apply(img, kernel_size, dst=dst)
 
 
-def apply_sharpen(img, strength=1.0):
+def apply_sharpen(img, strength=1.0, dst=None):
     """샤프닝 적용
     strength: 샤프닝 강도 (0.0 ~ 3.0)
     """
@@ -66,19 +77,32 @@ def apply_sharpen(img, strength=1.0):
     # 커널 정규화
     kernel[1, 1] = 8 * strength + 1
     
-    # 필터 적용
-    sharpened = cv2.filter2D(img, -1, kernel)
-    
-    # 범위 제한
-    return np.clip(sharpened, 0, 255).astype(np.uint8)
+    # 필터 적용 (입력과 같은 uint8 깊이로 출력하므로 0 ~ 255 포화가 이미 적용됨)
+    return cv2.filter2D(img, -1, kernel, dst=dst)
+
 
+# cv2.morphologyEx 연산 이름 -> 연산 코드
+MORPHOLOGY_OPERATIONS = {
+    'open': cv2.MORPH_OPEN,
+    'close': cv2.MORPH_CLOSE,
+    'gradient': cv2.MORPH_GRADIENT,
+    'tophat': cv2.MORPH_TOPHAT,
+    'blackhat': cv2.MORPH_BLACKHAT,
+}
 
-def apply_morphology(img, operation='open', kernel_size=5, iterations=1):
+
+def apply_morphology(img, operation='open', kernel_size=5, iterations=1, dst=None, shape='rect'):
     """모폴로지 연산
     operation: 'erode', 'dilate', 'open', 'close', 'gradient', 'tophat', 'blackhat'
     kernel_size: 커널 크기 (홀수)
     iterations: 반복 횟수
+    shape: 구조 요소 모양 ('rect', 'ellipse', 'cross')
+    큰 타원/십자는 선분 분해로 처리 (morphology.py)
     """
+    if shape not in morphology.SHAPES:
+        print(f"알 수 없는 구조 요소 모양: {shape}")
+        return img
+    
     if kernel_size < 3:
         kernel_size = 3
     
@@ -86,24 +110,42 @@ def apply_morphology(img, operation='open', kernel_size=5, iterations=1):
     if kernel_size % 2 == 0:
         kernel_size += 1
     
-    # 구조 요소 생성
-    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (kernel_size, kernel_size))
+    if morphology.morphology_method(shape, kernel_size, img.shape[2] if img.ndim == 3 else 1) == 'opencv':
+        # 구조 요소 생성
+        kernel = cv2.getStructuringElement(morphology.SHAPES[shape], (kernel_size, kernel_size))
+        
+        # 연산 수행
+        if operation == 'erode':
+            return cv2.erode(img, kernel, iterations=iterations, dst=dst)
+        elif operation == 'dilate':
+            return cv2.dilate(img, kernel, iterations=iterations, dst=dst)
+        elif operation in MORPHOLOGY_OPERATIONS:
+            return cv2.morphologyEx(img, MORPHOLOGY_OPERATIONS[operation], kernel,
+                                    iterations=iterations, dst=dst)
+        else:
+            return img
+    
+    # 큰 타원/십자: 선분 분해한 침식/팽창을 cv2.morphologyEx와 같은 순서로 조합
+    def erode(src, out=None):
+        return morphology.erode(src, kernel_size, shape, iterations, dst=out)
+    
+    def dilate(src, out=None):
+        return morphology.dilate(src, kernel_size, shape, iterations, dst=out)
     
-    # 연산 수행
     if operation == 'erode':
-        return cv2.erode(img, kernel, iterations=iterations)
+        return erode(img, dst)
     elif operation == 'dilate':
-        return cv2.dilate(img, kernel, iterations=iterations)
+        return dilate(img, dst)
     elif operation == 'open':
-        return cv2.morphologyEx(img, cv2.MORPH_OPEN, kernel, iterations=iterations)
+        return dilate(erode(img), dst)
     elif operation == 'close':
-        return cv2.morphologyEx(img, cv2.MORPH_CLOSE, kernel, iterations=iterations)
+        return erode(dilate(img), dst)
     elif operation == 'gradient':
-        return cv2.morphologyEx(img, cv2.MORPH_GRADIENT, kernel, iterations=iterations)
+        return cv2.subtract(dilate(img), erode(img), dst=dst)
     elif operation == 'tophat':
-        return cv2.morphologyEx(img, cv2.MORPH_TOPHAT, kernel, iterations=iterations)
+        return cv2.subtract(img, dilate(erode(img)), dst=dst)
     elif operation == 'blackhat':
-        return cv2.morphologyEx(img, cv2.MORPH_BLACKHAT, kernel, iterations=iterations)
+        return cv2.subtract(erode(dilate(img)), img, dst=dst)
     else:
         return img
 
@@ -0,0 +1,216 @@
+"""
+블러 (Blur) 모듈
+반경에 따라 가우시안 블러 방식을 골라 큰 반경도 작은 반경과 비슷한 시간에 처리
+
+- direct: cv2.GaussianBlur - 커널 크기에 비례하는 비용 (작은 반경, 이전 결과와 같음)
+- box: 상자 블러 3회 - 누적 합으로 처리하므로 반경과 관계없이 화소당 비용이 일정 (중간 반경)
+- pyramid: pyrDown으로 줄이고 남은 만큼 블러한 뒤 pyrUp - 처리 화소가 1/4씩 줄어듦 (큰 반경)
+방식은 고정된 비용표(DEFAULT_COSTS)로 예측한 시간이 가장 작은 것을 고릅니다.
+방식과 피라미드 단계 수는 반경과 전체 이미지 크기로만 정해지므로, ROI, 렌더 워커, GUI 프로세스의
+처리가 같은 결과를 냅니다 (ROI는 전체 이미지 기준으로 정한 방식을 넘겨받음, pipeline.frame_stages).
+"""
+
+import math
+import time
+
+import cv2
+import numpy as np
+
+# 상자 블러 3회로 근사할 최소 시그마 (그보다 작으면 상자 폭이 너무 작아 오차가 큼)
+BOX_MIN_SIGMA = 3.0
+# 피라미드 가장 작은 단계에서 남길 최소 시그마 (그보다 작게 남으면 pyrUp 보간 오차가 큼)
+PYRAMID_MIN_SIGMA = 2.0
+# 피라미드 가장 작은 단계의 최소 변 길이 (화소)
+PYRAMID_MIN_SIDE = 16
+# 비용 측정에 사용하는 직접 방식의 커널 크기
+COST_KERNELS = (5, 21, 61, 121)
+# 요소(화소 × 채널)당 처리 시간 (ns) - 3840×2160 BGR, 1코어에서 측정한 기본값
+# direct는 COST_KERNELS별 값 (사이는 보간), pyramid는 남은 블러를 뺀 pyrDown/pyrUp 비용
+DEFAULT_COSTS = {
+    'direct': (1.2, 2.3, 8.4, 29.1),
+    'box': 2.4,
+    'pyramid': 1.0,
+}
+
+
+def gaussian_sigma(radius: int) -> float:
+    """반경(커널 크기 2r+1)에 대한 시그마 - cv2.GaussianBlur에 시그마 0을 넘긴 것과 같음"""
+    return 0.3 * ((2 * radius + 1 - 1) * 0.5 - 1) + 0.8
+
+
+def box_sizes(sigma: float, passes: int = 3):
+    """시그마 가우시안을 근사하는 상자 블러 폭 목록 (홀수, 분산의 합이 sigma²에 가장 가까움)"""
+    ideal = math.sqrt(12 * sigma * sigma / passes + 1)
+    lower = int(ideal)
+    if lower % 2 == 0:
+        lower -= 1
+    upper = lower + 2
+    # 폭 w 상자의 분산은 (w² - 1) / 12
+    count = round((12 * sigma * sigma - passes * lower * lower - 4 * passes * lower - 3 * passes)
+                  / (-4 * lower - 4))
+    return [lower if i < count else upper for i in range(passes)]
+
+
+def pyramid_levels(sigma: float, shape) -> int:
+    """피라미드 단계 수 - 남은 시그마가 PYRAMID_MIN_SIGMA 이상인 가장 깊은 단계
+
+    pyrDown/pyrUp은 각 단계에서 원본 좌표 기준 분산 4^i씩을 더하므로
+    L단계 후 남은 분산은 (sigma² - 2(4^L - 1)/3) / 4^L (줄어든 좌표 기준)입니다.
+    """
+    levels = 0
+    side = min(shape[:2])
+    while side >= 2 * PYRAMID_MIN_SIDE and _residual_sigma(sigma, levels + 1) >= PYRAMID_MIN_SIGMA:
+        levels += 1
+        side = (side + 1) // 2
+    return levels
+
+
+def blur_halo(radius: int) -> int:
+    """반경 radius 블러 결과에 영향을 주는 최대 거리 (화소, ROI 처리용)
+
+    direct/box는 반경 이내입니다. pyramid는 단계마다 격자가 달라지므로 2^(L+1)을 더합니다.
+    """
+    if radius <= 0:
+        return 0
+    levels = pyramid_levels(gaussian_sigma(radius), (1 << 30, 1 << 30))
+    return radius + (2 << levels)
+
+
+def _residual_sigma(sigma, levels):
+    """피라미드 levels단계 후 줄어든 이미지에 남은 시그마 (음수 분산이면 0)"""
+    variance = (sigma * sigma - 2 * (4 ** levels - 1) / 3) / 4 ** levels
+    return math.sqrt(max(variance, 0.0))
+
+
+def _gaussian(img, sigma, dst=None):
+    """시그마 가우시안 블러 (커널은 ±3시그마)"""
+    size = 2 * math.ceil(3 * sigma) + 1
+    return cv2.GaussianBlur(img, (size, size), sigma, dst=dst)
+
+
+def _box(img, sigma, dst=None):
+    """상자 블러 3회 (경계는 cv2.GaussianBlur와 같은 BORDER_REFLECT_101)"""
+    sizes = box_sizes(sigma)
+    result = img
+    for i, size in enumerate(sizes):
+        out = dst if i == len(sizes) - 1 else None
+        result = cv2.blur(result, (size, size), dst=out)
+    return result
+
+
+def _pyramid(img, sigma, levels, dst=None):
+    """pyrDown levels회 → 남은 시그마만큼 블러 → pyrUp levels회"""
+    sizes = []
+    result = img
+    for _ in range(levels):
+        sizes.append((result.shape[1], result.shape[0]))
+        result = cv2.pyrDown(result)
+    residual = _residual_sigma(sigma, levels)
+    if residual > 0:
+        result = _gaussian(result, residual)
+    for i, size in enumerate(reversed(sizes)):
+        out = dst if i == levels - 1 else None
+        result = cv2.pyrUp(result, dst=out, dstsize=size)
+    return result
+
+
+class BlurEngine:
+    """블러 엔진 (단일 책임: 반경별 블러 방식 선택, 방식별 비용 측정)"""
+
+    def __init__(self, costs: dict = None):
+        """
+        Args:
+            costs: 요소당 처리 시간 (ns), DEFAULT_COSTS 형식 (기본값: DEFAULT_COSTS)
+        """
+        self.costs = dict(costs or DEFAULT_COSTS)
+
+    def _direct_cost(self, kernel_size):
+        """직접 방식의 요소당 비용 (측정한 커널 크기 사이는 보간, 밖은 마지막 기울기로 연장)"""
+        costs = self.costs['direct']
+        if kernel_size <= COST_KERNELS[-1]:
+            return float(np.interp(kernel_size, COST_KERNELS, costs))
+        slope = (costs[-1] - costs[-2]) / (COST_KERNELS[-1] - COST_KERNELS[-2])
+        return costs[-1] + slope * (kernel_size - COST_KERNELS[-1])
+
+    def estimate(self, radius: int, shape) -> dict:
+        """사용 가능한 방식별 예상 요소당 비용 (ns) - {방식: 비용}"""
+        sigma = gaussian_sigma(radius)
+        estimates = {'direct': self._direct_cost(2 * radius + 1)}
+        if sigma >= BOX_MIN_SIGMA:
+            estimates['box'] = self.costs['box']
+        levels = pyramid_levels(sigma, shape)
+        if levels > 0:
+            residual = _residual_sigma(sigma, levels)
+            estimates['pyramid'] = (self.costs['pyramid'] +
+                                    self._direct_cost(2 * math.ceil(3 * residual) + 1) / 4 ** levels)
+        return estimates
+
+    def method(self, radius: int, shape) -> str:
+        """반경과 이미지 shape에 따른 블러 방식 ('direct', 'box', 'pyramid')"""
+        estimates = self.estimate(radius, shape)
+        # 비용이 같으면 direct 우선 (dict 순서)
+        return min(estimates, key=estimates.get)
+
+    def plan(self, radius: int, shape):
+        """반경과 전체 이미지 shape에 따른 (방식, 피라미드 단계 수) - pyramid가 아니면 단계 수 0"""
+        method = self.method(radius, shape)
+        if method != 'pyramid':
+            return method, 0
+        return method, max(1, pyramid_levels(gaussian_sigma(radius), shape))
+
+    def apply(self, img, radius: int, dst=None, method: str = None, levels: int = None):
+        """가우시안 블러 적용
+
+        Args:
+            img: BGR 또는 그레이스케일 이미지
+            radius: 블러 반경 (커널 크기 2r+1에 해당하는 시그마 사용)
+            dst: 출력 버퍼 (선택, 사용되지 않을 수 있으므로 반환값을 사용)
+            method: 방식 지정 (기본값: img 크기 기준으로 비용이 가장 작은 방식)
+            levels: pyramid 단계 수 (method와 함께 plan()으로 정한 값, 기본값: img 크기 기준)
+        """
+        if radius <= 0:
+            return img
+        if method is None:
+            method, levels = self.plan(radius, img.shape)
+        sigma = gaussian_sigma(radius)
+        if method == 'box':
+            return _box(img, sigma, dst)
+        if method == 'pyramid':
+            return _pyramid(img, sigma, levels or max(1, pyramid_levels(sigma, img.shape)), dst)
+        kernel_size = 2 * radius + 1
+        return cv2.GaussianBlur(img, (kernel_size, kernel_size), 0, dst=dst)
+
+    def calibrate(self, size: int = 512, channels: int = 3, repeat: int = 2) -> dict:
+        """이 컴퓨터에서 방식별 요소당 비용 측정 (보고용, self.costs는 바꾸지 않음)
+
+        방식 선택은 항상 생성할 때 받은 비용표를 사용하므로, 측정 잡음이나 컴퓨터에 따라
+        결과가 달라지지 않습니다. 측정한 비용으로 고르려면 BlurEngine(costs)를 새로 만드세요.
+        size × size 무작위 이미지로 측정합니다 (3채널 기준 수십 ms).
+        Returns:
+            측정한 비용 (DEFAULT_COSTS 형식)
+        """
+        sample = np.empty((size, size, channels) if channels > 1 else (size, size), dtype=np.uint8)
+        cv2.randu(sample, 0, 256)
+        elements = sample.size
+
+        def measure(func):
+            best = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                func()
+                best = min(best, time.perf_counter() - start)
+            return best * 1e9 / elements
+
+        direct = tuple(measure(lambda k=k: cv2.GaussianBlur(sample, (k, k), 0)) for k in COST_KERNELS)
+        box = measure(lambda: _box(sample, 10.0))
+        sigma = 16.0
+        levels = max(1, pyramid_levels(sigma, sample.shape))
+        residual = _residual_sigma(sigma, levels)
+        measured = BlurEngine({'direct': direct, 'box': box, 'pyramid': 0.0})
+        pyramid = measure(lambda: _pyramid(sample, sigma, levels))
+        residual_cost = measured._direct_cost(2 * math.ceil(3 * residual) + 1) / 4 ** levels
+        return {'direct': direct, 'box': box, 'pyramid': max(pyramid - residual_cost, 0.0)}
+
+
+# 프로세스 전체에서 공유하는 블러 엔진
+blur_engine = BlurEngine()
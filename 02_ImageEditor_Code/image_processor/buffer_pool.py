@@ -0,0 +1,142 @@
+"""
+버퍼 풀 (Buffer Pool) 모듈
+처리 단계의 출력 버퍼를 shape/dtype 기준으로 재사용하여
+슬라이더 드래그 중 큰 배열의 반복 할당(할당자 부담, 페이지 폴트)을 제거
+"""
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+
+from .memory_budget import memory_budget
+
+# 제거한 버퍼를 다시 할당할 때의 비용 추정 (첫 접근 페이지 폴트 포함, 바이트/초)
+REFILL_BYTES_PER_SECOND = 4e9
+
+
+class BufferPool:
+    """버퍼 풀 (단일 책임: 처리용 출력 버퍼 대여/반환)
+
+    acquire()는 같은 shape/dtype의 반환된 버퍼를 우선 재사용하고, 없으면
+    용량이 비슷한(필요 크기 이상, max_slack배 이하) 버퍼의 앞부분을 원하는
+    shape의 view로 빌려줍니다. 새 버퍼는 headroom만큼 여유 있게 할당합니다. 회전처럼 출력 크기가 매번 조금씩 바뀌는
+    드래그에서도 새 할당이 생기지 않게 하기 위함입니다.
+
+    풀이 빌려준 버퍼(또는 그 view)만 release()로 반환되며, 다른 배열은 무시됩니다.
+    여러 스레드에서 함께 사용할 수 있습니다.
+
+    메모리 예산(memory_budget)의 하위 시스템으로 등록하면 여유 버퍼가 제거 후보가 됩니다.
+    다시 할당하면 되므로 다른 하위 시스템보다 먼저 제거됩니다.
+    """
+
+    def __init__(self, max_free: int = 8, max_slack: float = 1.5, headroom: float = 1.25):
+        """
+        Args:
+            max_free: 보관할 최대 여유 버퍼 수 (초과 시 가장 오래된 것부터 해제)
+            max_slack: 용량이 다른 버퍼를 재사용할 때 허용하는 최대 용량 비율
+            headroom: 새로 할당할 때의 여유 용량 비율 (출력이 조금씩 커지는 드래그 대비)
+        """
+        self.max_free = max_free
+        self.max_slack = max_slack
+        self.headroom = headroom
+        # id(소유 버퍼) -> 소유 버퍼 (풀이 만든 1차원 배열, 대여 후 버려진 버퍼는 자동 해제)
+        self._owned = weakref.WeakValueDictionary()
+        self._free = OrderedDict()    # id(소유 버퍼) -> 소유 버퍼 (반환된 순서)
+        self._released_at = {}        # id(여유 버퍼) -> 반환 시각
+        self._lock = threading.Lock()
+        self.allocations = 0
+        self.reuses = 0
+
+    def acquire(self, shape, dtype=np.uint8):
+        """shape/dtype의 출력 버퍼 대여 (내용은 초기화되지 않음)"""
+        shape = tuple(int(n) for n in shape)
+        dtype = np.dtype(dtype)
+        size = int(np.prod(shape))
+        allocated = False
+        with self._lock:
+            base = self._take_free(size, dtype)
+            if base is None:
+                base = np.empty(int(size * self.headroom) or 1, dtype=dtype)
+                self._owned[id(base)] = base
+                self.allocations += 1
+                allocated = True
+            else:
+                self.reuses += 1
+        if allocated:
+            memory_budget.enforce()
+        return base[:size].reshape(shape)
+
+    def release(self, buf):
+        """대여한 버퍼 반환 (풀이 빌려주지 않은 배열은 무시)"""
+        if buf is None:
+            return
+        base = buf if buf.base is None else buf.base
+        with self._lock:
+            if self._owned.get(id(base)) is not base or id(base) in self._free:
+                return
+            self._free[id(base)] = base
+            self._released_at[id(base)] = time.monotonic()
+            while len(self._free) > self.max_free:
+                _, dropped = self._free.popitem(last=False)
+                del self._owned[id(dropped)]
+                self._released_at.pop(id(dropped), None)
+
+    def owns(self, buf) -> bool:
+        """풀이 빌려준 버퍼인지 여부"""
+        if buf is None:
+            return False
+        base = buf if buf.base is None else buf.base
+        return self._owned.get(id(base)) is base
+
+    def clear(self):
+        """여유 버퍼 모두 해제 (대여 중인 버퍼는 반환 시 무시됨)"""
+        with self._lock:
+            self._free.clear()
+            self._owned.clear()
+            self._released_at.clear()
+
+    def free_bytes(self) -> int:
+        """보관 중인 여유 버퍼의 총 바이트 수"""
+        with self._lock:
+            return sum(base.nbytes for base in self._free.values())
+
+    def memory_usage(self) -> int:
+        """풀이 만든 버퍼(대여 중 + 여유)의 총 바이트 수 (메모리 예산 보고용)"""
+        with self._lock:
+            return sum(base.nbytes for base in list(self._owned.values()))
+
+    def memory_candidates(self):
+        """제거할 수 있는 여유 버퍼 (대여 중인 버퍼는 제외)"""
+        with self._lock:
+            return [(key, base.nbytes, self._released_at.get(key, 0.0),
+                     base.nbytes / REFILL_BYTES_PER_SECOND)
+                    for key, base in self._free.items()]
+
+    def evict_memory(self, key) -> int:
+        """여유 버퍼 해제"""
+        with self._lock:
+            base = self._free.pop(key, None)
+            if base is None:
+                return 0
+            self._owned.pop(key, None)
+            self._released_at.pop(key, None)
+            return base.nbytes
+
+    def _take_free(self, size, dtype):
+        """재사용할 여유 버퍼 선택 (정확히 같은 크기 우선, 다음은 가장 작은 충분한 버퍼)"""
+        best = None
+        for key, base in self._free.items():
+            if base.dtype != dtype or base.size < size or base.size > size * self.max_slack:
+                continue
+            if base.size == size:
+                best = key
+                break
+            if best is None or base.size < self._free[best].size:
+                best = key
+        if best is None:
+            return None
+        self._released_at.pop(best, None)
+        return self._free.pop(best)
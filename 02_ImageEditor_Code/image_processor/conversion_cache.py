@@ -0,0 +1,100 @@
+"""
+변환 캐시 (Conversion Cache) 모듈
+한 번의 처리 실행(렌더) 동안 같은 버퍼에서 파생된 표현(gray, YUV, 표시용 RGB)을
+버퍼 객체 기준으로 저장하여 색 공간 변환을 한 번만 수행
+"""
+
+import cv2
+
+
+# 지원하는 파생 표현과 BGR 원본으로부터의 변환 코드
+CONVERSIONS = {
+    'gray': cv2.COLOR_BGR2GRAY,
+    'yuv': cv2.COLOR_BGR2YUV,
+    'rgb': cv2.COLOR_BGR2RGB,
+}
+
+
+class ConversionCache:
+    """변환 캐시 (단일 책임: 처리 실행 1회 동안 버퍼별 파생 표현 보관)
+
+    키는 원본 버퍼의 id()이며, 같은 id가 다른 객체에 재사용되지 않도록
+    원본 참조를 함께 보관합니다. 처리 실행마다 새로 만들어 사용하고
+    반환된 파생 표현은 수정하지 않아야 합니다.
+    """
+
+    def __init__(self):
+        self._entries = {}  # id(원본) -> (원본, {종류: 파생 표현})
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, img, kind):
+        """저장된 파생 표현 반환 (없으면 None)"""
+        entry = self._entries.get(id(img))
+        if entry is None or entry[0] is not img:
+            return None
+        return entry[1].get(kind)
+
+    def put(self, img, kind, value):
+        """파생 표현 저장 후 그대로 반환"""
+        entry = self._entries.get(id(img))
+        if entry is None or entry[0] is not img:
+            entry = (img, {})
+            self._entries[id(img)] = entry
+        entry[1][kind] = value
+        return value
+
+    def discard(self, buf):
+        """버퍼와 관련된 항목 제거 (버퍼를 재사용하기 전에 호출)
+
+        buf가 원본인 항목과, 다른 원본의 파생 표현으로 저장된 buf를 모두 지웁니다.
+        """
+        entry = self._entries.get(id(buf))
+        if entry is not None and entry[0] is buf:
+            del self._entries[id(buf)]
+        for _, kinds in self._entries.values():
+            for kind in [k for k, value in kinds.items() if value is buf]:
+                del kinds[kind]
+
+    def clear(self):
+        """캐시 비우기"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return sum(len(kinds) for _, kinds in self._entries.values())
+
+
+def convert(img, kind, cache=None, dst=None):
+    """BGR 이미지의 파생 표현 반환 (cache가 있으면 재사용)
+
+    Args:
+        img: BGR 이미지 (3채널)
+        kind: 'gray', 'yuv', 'rgb'
+        cache: ConversionCache (None이면 항상 변환)
+        dst: 변환 결과를 쓸 출력 버퍼 (선택, 캐시 적중 시에는 사용하지 않음)
+    """
+    if cache is not None:
+        value = cache.get(img, kind)
+        if value is not None:
+            cache.hits += 1
+            return value
+        cache.misses += 1
+    value = cv2.cvtColor(img, CONVERSIONS[kind], dst=dst)
+    if cache is not None:
+        cache.put(img, kind, value)
+    return value
+
+
+def expand_gray(gray, cache=None, dst=None):
+    """1채널 결과를 BGR 3채널로 확장
+
+    확장된 결과의 gray와 표시용 RGB(세 채널이 같으므로 자기 자신)를
+    캐시에 미리 넣어 다음 단계와 화면 표시에서 다시 변환하지 않게 합니다.
+    """
+    bgr = cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR, dst=dst)
+    if cache is not None:
+        cache.put(bgr, 'gray', gray)
+        cache.put(bgr, 'rgb', bgr)
+    return bgr
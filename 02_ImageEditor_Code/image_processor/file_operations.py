@@ -5,18 +5,30 @@ SOLID 원칙에 따라 파일 관련 작업을 모듈화
 
 import cv2
 import os
+import time
 import numpy as np
 from typing import Optional, Tuple
+from .memory_budget import memory_budget
+from .tracing import tracer
 
 
 class FileManager:
-    """파일 관리자 클래스 (단일 책임: 파일 저장/로드 관리)"""
+    """파일 관리자 클래스 (단일 책임: 파일 저장/로드 관리)
+    
+    히스토리는 메모리 예산(memory_budget)의 하위 시스템으로 등록할 수 있습니다.
+    예산을 넘으면 현재 항목을 제외한 오래된 되돌리기 단계부터 제거됩니다.
+    """
+    
+    # 히스토리 항목은 다시 만들 수 없으므로 캐시보다 나중에 제거되도록 큰 비용으로 보고
+    # (바이트당 비용(초)이 같으므로 히스토리 안에서는 오래 쓰지 않은 항목부터 제거됨)
+    HISTORY_EVICTION_COST_PER_BYTE = 1e-6
     
     def __init__(self):
         self.current_file_path: Optional[str] = None
         self.history: list = []  # 되돌리기/앞으로 돌리기를 위한 히스토리
         self.history_index: int = -1
         self.max_history_size: int = 50
+        self._history_used: dict = {}  # id(항목) -> 마지막 사용 시각 (추가/되돌리기)
     
     def set_current_file(self, file_path: str):
         """현재 파일 경로 설정"""
@@ -26,20 +38,36 @@ class FileManager:
         """현재 파일 경로 반환"""
         return self.current_file_path
     
+    def reset_history(self, image):
+        """히스토리를 이미지 1개(복사본)로 초기화 (새 이미지를 열 때)"""
+        self.history = [image.copy()]
+        self.history_index = 0
+        self._history_used = {id(self.history[0]): time.monotonic()}
+        memory_budget.enforce()
+    
     def add_to_history(self, image):
         """히스토리에 이미지 추가"""
         # 현재 인덱스 이후의 히스토리 제거 (새로운 작업 시)
         if self.history_index < len(self.history) - 1:
             self.history = self.history[:self.history_index + 1]
         
-        # 히스토리에 추가
-        self.history.append(image.copy())
-        self.history_index += 1
-        
-        # 히스토리 크기 제한
-        if len(self.history) > self.max_history_size:
-            self.history.pop(0)
+        # 히스토리 크기 제한 (가득 찼으면 가장 오래된 항목 제거)
+        recycled = None
+        if len(self.history) >= self.max_history_size:
+            recycled = self.history.pop(0)
             self.history_index -= 1
+        
+        # 히스토리에 추가 (제거된 항목과 크기가 같으면 그 버퍼에 복사하여 재할당 방지)
+        if (recycled is not None and recycled.shape == image.shape
+                and recycled.dtype == image.dtype):
+            np.copyto(recycled, image)
+            self.history.append(recycled)
+        else:
+            self.history.append(image.copy())
+        self.history_index += 1
+        self._history_used = {id(entry): self._history_used.get(id(entry), 0.0) for entry in self.history}
+        self._history_used[id(self.history[-1])] = time.monotonic()
+        memory_budget.enforce()
     
     def can_undo(self) -> bool:
         """되돌리기 가능 여부"""
@@ -53,6 +81,7 @@ class FileManager:
         """되돌리기 이미지 반환"""
         if self.can_undo():
             self.history_index -= 1
+            self._history_used[id(self.history[self.history_index])] = time.monotonic()
             return self.history[self.history_index].copy()
         return None
     
@@ -60,20 +89,44 @@ class FileManager:
         """앞으로 돌리기 이미지 반환"""
         if self.can_redo():
             self.history_index += 1
+            self._history_used[id(self.history[self.history_index])] = time.monotonic()
             return self.history[self.history_index].copy()
         return None
+    
+    def memory_usage(self) -> int:
+        """히스토리가 보관 중인 바이트 수 (메모리 예산 보고용)"""
+        return sum(entry.nbytes for entry in self.history)
+    
+    def memory_candidates(self):
+        """제거할 수 있는 히스토리 항목 (현재 항목 제외)"""
+        return [(id(entry), entry.nbytes, self._history_used.get(id(entry), 0.0),
+                 entry.nbytes * self.HISTORY_EVICTION_COST_PER_BYTE)
+                for index, entry in enumerate(self.history) if index != self.history_index]
+    
+    def evict_memory(self, key) -> int:
+        """히스토리 항목 제거 - 되돌리기/앞으로 돌리기 단계가 그만큼 줄어듦"""
+        for index, entry in enumerate(self.history):
+            if id(entry) == key and index != self.history_index:
+                del self.history[index]
+                if index < self.history_index:
+                    self.history_index -= 1
+                self._history_used.pop(key, None)
+                return entry.nbytes
+        return 0
 
 
 class FileSaver:
     """파일 저장 클래스 (단일 책임: 파일 저장)"""
     
     @staticmethod
-    def save(image, file_path: str) -> bool:
+    def save(image, file_path: str, expand_gray: bool = False) -> bool:
         """이미지 저장
         
         Args:
             image: 저장할 이미지 (numpy array)
             file_path: 저장 경로
+            expand_gray: True이면 1채널(gray/이진) 이미지를 BGR 3채널로 확장하여 저장
+                (기본은 1채널 그대로 저장)
             
         Returns:
             bool: 저장 성공 여부
@@ -84,20 +137,25 @@ class FileSaver:
             if directory and not os.path.exists(directory):
                 os.makedirs(directory)
             
+            if expand_gray and len(image.shape) == 2:
+                image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+            
             # 이미지 저장
-            success = cv2.imwrite(file_path, image)
+            with tracer.span('imwrite', 'io'):
+                success = cv2.imwrite(file_path, image)
             return success
         except Exception as e:
             print(f"파일 저장 오류: {e}")
             return False
     
     @staticmethod
-    def save_as(image, default_path: str = None) -> Optional[str]:
+    def save_as(image, default_path: str = None, expand_gray: bool = False) -> Optional[str]:
         """다른 이름으로 저장
         
         Args:
             image: 저장할 이미지
             default_path: 기본 경로 (선택)
+            expand_gray: True이면 1채널 이미지를 BGR 3채널로 확장하여 저장
             
         Returns:
             Optional[str]: 저장된 파일 경로, 취소 시 None
@@ -112,14 +170,41 @@ class FileSaver:
         )
         
         if file_path:
-            if FileSaver.save(image, file_path):
+            if FileSaver.save(image, file_path, expand_gray):
                 return file_path
         return None
 
 
 class FileLoader:
     """파일 로드 클래스 (단일 책임: 파일 로드)"""
-    
+
+    # 파일 목록에 표시할 이미지 확장자 (소문자)
+    IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.gif', '.tiff')
+
+    @staticmethod
+    def list_images(images_dir: str) -> list:
+        """폴더 안의 이미지 파일 경로 목록 (이름순)
+
+        폴더를 한 번만 읽어 확장자(대소문자 무시)로 거릅니다.
+        숨김 파일과 하위 폴더는 제외합니다.
+
+        Args:
+            images_dir: 검색할 폴더
+
+        Returns:
+            list: 이미지 파일 경로 목록, 폴더를 읽지 못하면 빈 목록
+        """
+        try:
+            with os.scandir(images_dir) as entries:
+                return sorted(
+                    entry.path for entry in entries
+                    if not entry.name.startswith('.') and entry.is_file()
+                    and os.path.splitext(entry.name)[1].lower() in FileLoader.IMAGE_EXTENSIONS
+                )
+        except OSError as e:
+            print(f"폴더 읽기 오류: {e}")
+            return []
+
     @staticmethod
     def load(file_path: str):
         """이미지 파일 로드
@@ -131,7 +216,8 @@ class FileLoader:
             Optional[numpy.ndarray]: 로드된 이미지, 실패 시 None
         """
         try:
-            image = cv2.imread(file_path)
+            with tracer.span('imread', 'io'):
+                image = cv2.imread(file_path)
             if image is None:
                 print(f"이미지 로드 실패: {file_path}")
             return image
@@ -1,20 +1,26 @@
 """
 기하학 처리 (Geometric Processing) 모듈
 이미지의 형태나 배치를 기하학적으로 변환하는 함수들
+
+모든 처리 함수는 선택 인자 dst=(출력 버퍼)를 받습니다. 결과가 dst에 쓰이지 않을 수
+있으므로(효과 없음, 크기 불일치 등) 항상 반환값을 사용해야 합니다.
 """
 
 import cv2
 import numpy as np
 
+from .warp import warp_engine
 
-def apply_rotation(img, angle):
-    """이미지 회전
-    angle: 회전 각도 (0 ~ 360)
-    """
-    if angle == 0:
-        return img
-    
-    h, w = img.shape[:2]
+# 축소 배율(원본/결과)이 정수에 이 비율 이내로 가까우면 정수 배율로 봄
+INTEGER_FACTOR_TOLERANCE = 0.01
+# 이 정수 배율까지는 INTER_AREA 한 번 (OpenCV의 정수 배율 경로, 그보다 크면 절반 줄이기가 더 빠름)
+AREA_MAX_INTEGER_FACTOR = 3
+# 축소 배율이 이 값 이상이면 절반 줄이기를 반복한 뒤 마지막에 조금 줄임
+PYRAMID_MIN_FACTOR = 2.0
+
+
+def get_rotation_matrix(h, w, angle):
+    """캔버스 확장을 포함한 회전 행렬(2x3)과 회전된 이미지 크기 (new_w, new_h)"""
     center = (w // 2, h // 2)
     
     # 회전 행렬 생성
@@ -29,32 +35,91 @@ def apply_rotation(img, angle):
     # 회전 행렬 조정 (중심 이동)
     rotation_matrix[0, 2] += (new_w / 2) - center[0]
     rotation_matrix[1, 2] += (new_h / 2) - center[1]
+    return rotation_matrix, (new_w, new_h)
+
+
+def rotated_size(h, w, angle):
+    """apply_rotation 결과의 크기 (new_h, new_w)"""
+    if angle == 0:
+        return h, w
+    _, (new_w, new_h) = get_rotation_matrix(h, w, angle)
+    return new_h, new_w
+
+
+def apply_rotation(img, angle, dst=None, cache_maps=False):
+    """이미지 회전
+    angle: 회전 각도 (0 ~ 360)
+    cache_maps: True면 좌표표를 캐시하여 remap (같은 크기, 각도를 반복하는 동영상, 일괄 처리)
+    """
+    if angle == 0:
+        return img
+    
+    h, w = img.shape[:2]
+    rotation_matrix, new_size = get_rotation_matrix(h, w, angle)
     
     # 이미지 회전
-    rotated = cv2.warpAffine(img, rotation_matrix, (new_w, new_h),
-                             flags=cv2.INTER_LINEAR,
-                             borderMode=cv2.BORDER_CONSTANT,
-                             borderValue=(0, 0, 0))
+    rotated = warp_engine.warp_affine(img, rotation_matrix, new_size, dst=dst, cache_maps=cache_maps)
     
     return rotated
 
 
-def apply_flip_horizontal(img):
+def apply_flip_horizontal(img, dst=None):
     """좌우 대칭 (수평 뒤집기)"""
-    return cv2.flip(img, 1)
+    return cv2.flip(img, 1, dst=dst)
 
 
-def apply_flip_vertical(img):
+def apply_flip_vertical(img, dst=None):
     """상하 대칭 (수직 뒤집기)"""
-    return cv2.flip(img, 0)
+    return cv2.flip(img, 0, dst=dst)
+
 
+def resize_strategy(src_size, dst_size):
+    """크기 조절 방식 ('interpolate', 'area', 'pyramid')
 
-def apply_resize(img, width=None, height=None, scale=None, interpolation=cv2.INTER_LINEAR):
+    src_size, dst_size: (너비, 높이)
+    - interpolate: 확대 (또는 한 축이라도 커짐) - 지정한 보간 방법
+    - area: 작은 축소, 정수에 가까운 배율 - INTER_AREA 한 번 (앨리어싱 없음)
+    - pyramid: 큰 축소 - 절반 줄이기를 반복한 뒤 INTER_AREA로 마지막 배율(1 ~ 2배)만 줄임
+    """
+    factor_x = src_size[0] / max(1, dst_size[0])
+    factor_y = src_size[1] / max(1, dst_size[1])
+    factor = min(factor_x, factor_y)
+    if factor <= 1.0:
+        return 'interpolate'
+    if factor < PYRAMID_MIN_FACTOR:
+        return 'area'
+    integer = round(factor)
+    if (integer <= AREA_MAX_INTEGER_FACTOR and
+            abs(factor_x - integer) <= INTEGER_FACTOR_TOLERANCE * integer and
+            abs(factor_y - integer) <= INTEGER_FACTOR_TOLERANCE * integer):
+        return 'area'
+    return 'pyramid'
+
+
+def _pyramid_resize(img, size, dst=None):
+    """절반 줄이기를 반복한 뒤 INTER_AREA로 size (w, h)까지 줄임
+
+    짝수 크기는 2×2 평균(INTER_AREA 정수 배율 경로), 홀수 크기는 pyrDown으로 절반 줄입니다.
+    (홀수 크기를 INTER_AREA로 절반 줄이면 정수 배율이 아니라 몇 배 느린 일반 경로를 사용)
+    """
+    result = img
+    while result.shape[1] >= 2 * size[0] and result.shape[0] >= 2 * size[1]:
+        h, w = result.shape[:2]
+        if w % 2 == 0 and h % 2 == 0:
+            result = cv2.resize(result, (w // 2, h // 2), interpolation=cv2.INTER_AREA)
+        else:
+            result = cv2.pyrDown(result)
+    return cv2.resize(result, size, dst=dst, interpolation=cv2.INTER_AREA)
+
+
+def apply_resize(img, width=None, height=None, scale=None, interpolation=None,
+                 dst=None, strategy='auto'):
     """크기 조절
     width: 목표 너비 (픽셀)
     height: 목표 높이 (픽셀)
     scale: 스케일 팩터 (width, height가 None일 때 사용)
-    interpolation: 보간 방법
+    interpolation: 보간 방법 (None이면 cv2.INTER_LINEAR, 지정하면 'auto'에서도 그대로 사용)
+    strategy: 'auto'(interpolation이 None일 때만 resize_strategy로 선택), 'interpolate', 'area', 'pyramid'
     """
     h, w = img.shape[:2]
     
@@ -75,13 +140,23 @@ def apply_resize(img, width=None, height=None, scale=None, interpolation=cv2.INT
     else:
         return img
     
-    return cv2.resize(img, new_size, interpolation=interpolation)
+    if strategy == 'auto':
+        # 호출자가 보간 방법을 지정했으면 그 방법을 따른다
+        strategy = resize_strategy((w, h), new_size) if interpolation is None else 'interpolate'
+    if strategy == 'pyramid':
+        return _pyramid_resize(img, new_size, dst)
+    if strategy == 'area':
+        interpolation = cv2.INTER_AREA
+    elif interpolation is None:
+        interpolation = cv2.INTER_LINEAR
+    return cv2.resize(img, new_size, dst=dst, interpolation=interpolation)
 
 
-def apply_translate(img, tx, ty):
+def apply_translate(img, tx, ty, dst=None, cache_maps=False):
     """이미지 이동
     tx: x축 이동량 (픽셀, 양수: 오른쪽, 음수: 왼쪽)
     ty: y축 이동량 (픽셀, 양수: 아래, 음수: 위)
+    cache_maps: True면 소수 이동의 좌표표를 캐시하여 remap (정수 이동은 항상 복사)
     """
     if tx == 0 and ty == 0:
         return img
@@ -93,19 +168,17 @@ def apply_translate(img, tx, ty):
                     [0, 1, ty]])
     
     # 이동 적용
-    translated = cv2.warpAffine(img, M, (w, h),
-                                flags=cv2.INTER_LINEAR,
-                                borderMode=cv2.BORDER_CONSTANT,
-                                borderValue=(0, 0, 0))
+    translated = warp_engine.warp_affine(img, M, (w, h), dst=dst, cache_maps=cache_maps)
     
     return translated
 
 
-def apply_crop(img, x, y, width, height):
+def apply_crop(img, x, y, width, height, dst=None, copy=True):
     """이미지 자르기
     x, y: 시작 좌표 (픽셀)
     width: 자를 너비 (픽셀)
     height: 자를 높이 (픽셀)
+    copy: False면 복사하지 않고 view 반환 (원본과 메모리를 공유하므로 결과를 수정하면 원본도 바뀜)
     """
     h, w = img.shape[:2]
     
@@ -115,13 +188,20 @@ def apply_crop(img, x, y, width, height):
     width = max(1, min(width, w - x))
     height = max(1, min(height, h - y))
     
-    return img[y:y+height, x:x+width].copy()
+    cropped = img[y:y+height, x:x+width]
+    if not copy:
+        return cropped
+    if dst is not None and dst.shape == cropped.shape and dst.dtype == cropped.dtype:
+        np.copyto(dst, cropped)
+        return dst
+    return cropped.copy()
 
 
-def apply_affine_transform(img, src_points, dst_points):
+def apply_affine_transform(img, src_points, dst_points, dst=None, cache_maps=False):
     """어파인 변환
     src_points: 원본 이미지의 3개 점 좌표 (numpy array, shape: (3, 2))
     dst_points: 변환 후 이미지의 3개 점 좌표 (numpy array, shape: (3, 2))
+    cache_maps: True면 좌표표를 캐시하여 remap (같은 변환을 반복하는 경우)
     """
     if src_points.shape != (3, 2) or dst_points.shape != (3, 2):
         raise ValueError("src_points and dst_points must be (3, 2) arrays")
@@ -133,10 +213,31 @@ def apply_affine_transform(img, src_points, dst_points):
     h, w = img.shape[:2]
     
     # 변환 적용
-    transformed = cv2.warpAffine(img, M, (w, h),
-                                 flags=cv2.INTER_LINEAR,
-                                 borderMode=cv2.BORDER_CONSTANT,
-                                 borderValue=(0, 0, 0))
+    transformed = warp_engine.warp_affine(img, M, (w, h), dst=dst, cache_maps=cache_maps)
+    
+    return transformed
+
+
+def apply_perspective_transform(img, src_points, dst_points, dst=None, size=None,
+                                cache_maps=False):
+    """원근 변환 (homography)
+    src_points: 원본 이미지의 4개 점 좌표 (numpy array, shape: (4, 2))
+    dst_points: 변환 후 이미지의 4개 점 좌표 (numpy array, shape: (4, 2))
+    size: 결과 크기 (w, h) - None이면 원본 크기
+    cache_maps: True면 좌표표를 캐시하여 remap (같은 변환을 반복하는 경우)
+    """
+    if src_points.shape != (4, 2) or dst_points.shape != (4, 2):
+        raise ValueError("src_points and dst_points must be (4, 2) arrays")
+    
+    # 원근 변환 행렬 계산
+    M = cv2.getPerspectiveTransform(src_points.astype(np.float32),
+                                    dst_points.astype(np.float32))
+    
+    h, w = img.shape[:2]
+    
+    # 변환 적용
+    transformed = warp_engine.warp_perspective(img, M, size or (w, h), dst=dst,
+                                               cache_maps=cache_maps)
     
     return transformed
 
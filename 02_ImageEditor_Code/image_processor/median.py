@@ -0,0 +1,84 @@
+"""
+미디언 필터 모듈
+큰 이미지를 가로 띠(band)로 나누어 띠마다 cv2.medianBlur를 스레드에서 실행
+
+미디언 계산 자체는 모두 cv2.medianBlur가 합니다. OpenCV는 커널 크기에 따라 내부 방식을 고르므로
+(커널 3, 5: 정렬 네트워크, 7 이상: 열 히스토그램을 밀어 가며 갱신하는 8비트 히스토그램 방식)
+띠 높이만 그에 맞게 정합니다.
+띠는 위아래로 커널 반지름만큼 겹쳐 읽으므로 결과는 한 번에 처리한 것과 같습니다.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+
+# cv2.medianBlur가 정렬 네트워크를 쓰는 최대 커널 크기 (그보다 크면 히스토그램 방식)
+SORT_MAX_KERNEL = 5
+# 이보다 작은 이미지는 스레드로 나누지 않음 (화소 수)
+PARALLEL_MIN_PIXELS = 1 << 21
+# 히스토그램 방식의 띠 최소 화소 수 (커널 상한, 화소 수)
+# OpenCV는 작은 이미지에 중간 크기 커널이면 O(커널 반지름) 방식(Huang)으로 바꾸는데,
+# 띠로 나누면 이 방식이 선택되어 오히려 느려지므로 띠를 그보다 크게 유지
+HISTOGRAM_MIN_BAND_PIXELS = ((9, 4 << 20), (15, 1 << 20))
+# 띠 높이는 커널 크기의 이 배수 이상 (겹쳐 읽는 행의 비율 제한)
+BAND_KERNEL_RATIO = 8
+
+
+class MedianFilter:
+    """미디언 필터 (단일 책임: cv2.medianBlur의 띠 분할 병렬 처리)"""
+
+    def __init__(self, workers: int = None):
+        """
+        Args:
+            workers: 띠 처리 스레드 수 (기본값: CPU 수, 최대 8)
+        """
+        self.workers = workers or min(8, os.cpu_count() or 2)
+        self._executor = None
+
+    def _bands(self, shape, kernel_size):
+        """띠 목록 [(y0, y1)] - 나누지 않으면 띠 1개"""
+        h, w = shape[:2]
+        if self.workers <= 1 or h * w < PARALLEL_MIN_PIXELS:
+            return [(0, h)]
+        min_rows = BAND_KERNEL_RATIO * kernel_size
+        if kernel_size > SORT_MAX_KERNEL:
+            for max_kernel, min_pixels in HISTOGRAM_MIN_BAND_PIXELS:
+                if kernel_size <= max_kernel:
+                    min_rows = max(min_rows, -(-min_pixels // w))
+                    break
+        count = max(1, min(self.workers, h // max(1, min_rows)))
+        step = -(-h // count)
+        return [(y0, min(h, y0 + step)) for y0 in range(0, h, step)]
+
+    def apply(self, img, kernel_size: int, dst=None):
+        """미디언 필터 적용 (경계는 cv2.medianBlur와 같이 BORDER_REPLICATE)
+
+        Args:
+            img: 8비트 BGR 또는 그레이스케일 이미지
+            kernel_size: 커널 크기 (홀수, 3 이상)
+            dst: 출력 버퍼 (선택)
+        """
+        bands = self._bands(img.shape, kernel_size)
+        if len(bands) == 1:
+            return cv2.medianBlur(img, kernel_size, dst=dst)
+        if dst is None or dst.shape != img.shape or dst.dtype != img.dtype:
+            dst = np.empty_like(img)
+        radius = kernel_size // 2
+        h = img.shape[0]
+
+        def band(rows):
+            y0, y1 = rows
+            top, bottom = max(0, y0 - radius), min(h, y1 + radius)
+            result = cv2.medianBlur(img[top:bottom], kernel_size)
+            dst[y0:y1] = result[y0 - top:y1 - top]
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix='median')
+        list(self._executor.map(band, bands))
+        return dst
+
+
+# 프로세스 전체에서 함께 사용하는 미디언 필터 (스레드 풀 공유)
+median_filter = MedianFilter()
@@ -0,0 +1,239 @@
+"""
+메모리 예산 (Memory Budget) 모듈
+큰 배열을 보관하는 하위 시스템(히스토리, 버퍼 풀, 화면 표시, 렌더 워커 등)의 사용량을 모으고,
+전체 한도를 넘거나 시스템 메모리가 부족하면 하위 시스템을 가로질러 비용과 최근 사용 순으로 제거
+
+메모리가 적은 PC(8 GB)에서 스왑이 일어나기 전에 다시 만들기 쉬운 캐시와
+오래된 되돌리기 단계부터 버려 성능이 완만하게 떨어지도록 합니다.
+"""
+
+import os
+import sys
+import threading
+import time
+import weakref
+
+# 한도를 정하지 않았고 시스템 메모리도 알 수 없을 때의 한도
+DEFAULT_LIMIT_BYTES = 2 * 1024 ** 3
+# 기본 한도: 시스템 메모리의 이 비율
+DEFAULT_LIMIT_FRACTION = 0.25
+
+
+def _meminfo():
+    """Linux /proc/meminfo의 (MemTotal, MemAvailable) 바이트 수"""
+    values = {}
+    with open('/proc/meminfo') as f:
+        for line in f:
+            key, _, rest = line.partition(':')
+            if key in ('MemTotal', 'MemAvailable'):
+                values[key] = int(rest.split()[0]) * 1024
+    return values['MemTotal'], values['MemAvailable']
+
+
+def _windows_memory_status():
+    """Windows GlobalMemoryStatusEx의 (전체, 사용 가능) 바이트 수"""
+    import ctypes
+    
+    class MEMORYSTATUSEX(ctypes.Structure):
+        _fields_ = [('dwLength', ctypes.c_ulong), ('dwMemoryLoad', ctypes.c_ulong),
+                    ('ullTotalPhys', ctypes.c_ulonglong), ('ullAvailPhys', ctypes.c_ulonglong),
+                    ('ullTotalPageFile', ctypes.c_ulonglong), ('ullAvailPageFile', ctypes.c_ulonglong),
+                    ('ullTotalVirtual', ctypes.c_ulonglong), ('ullAvailVirtual', ctypes.c_ulonglong),
+                    ('ullAvailExtendedVirtual', ctypes.c_ulonglong)]
+    
+    status = MEMORYSTATUSEX()
+    status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+    if not ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+        raise OSError('GlobalMemoryStatusEx 실패')
+    return status.ullTotalPhys, status.ullAvailPhys
+
+
+def system_memory():
+    """시스템 (전체, 사용 가능) 메모리 바이트 수 - 알 수 없으면 (None, None)
+    
+    Linux는 /proc, Windows는 GlobalMemoryStatusEx, 그 외에는 psutil(설치된 경우)을 사용합니다.
+    """
+    try:
+        if sys.platform.startswith('linux'):
+            return _meminfo()
+        if sys.platform == 'win32':
+            return _windows_memory_status()
+    except (OSError, KeyError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+        memory = psutil.virtual_memory()
+        return memory.total, memory.available
+    except ImportError:
+        return None, None
+
+
+def format_bytes(num_bytes: float) -> str:
+    """바이트 수를 읽기 쉬운 문자열로 변환"""
+    value = float(num_bytes)
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if abs(value) < 1024 or unit == 'GB':
+            return f"{value:.1f} {unit}" if unit != 'B' else f"{int(value)} B"
+        value /= 1024.0
+
+
+class MemoryBudget:
+    """메모리 예산 관리자 (단일 책임: 하위 시스템별 사용량 집계, 한도 초과 시 하위 시스템 간 제거)
+    
+    하위 시스템은 register()로 등록하는 객체이며 다음 메서드를 가집니다.
+    - memory_usage(): 현재 보관 중인 바이트 수
+    - memory_candidates(): 제거할 수 있는 항목 목록
+      [(키, 바이트 수, 마지막 사용 시각(time.monotonic()), 다시 만드는 비용(초))].
+      제거할 수 없는 하위 시스템(현재 화면 등)은 빈 목록을 반환하고 사용량만 보고합니다.
+    - evict_memory(키): 항목을 제거하고 해제한 바이트 수 반환
+    
+    제거는 비용 / 바이트 수 / (1 + 경과 시간(초))가 작은 항목부터 합니다.
+    다시 만들기 싸고, 크고, 오래 쓰지 않은 항목이 먼저 제거됩니다.
+    등록은 약한 참조이므로 하위 시스템이 사라지면 자동으로 빠집니다.
+    """
+    
+    def __init__(self, limit_bytes=None, reserve_bytes=None, pressure_interval: float = 0.5):
+        """
+        Args:
+            limit_bytes: 등록된 하위 시스템 전체 한도 (None이면 IMAGE_EDITOR_MEMORY_LIMIT_MB 환경 변수,
+                없으면 시스템 메모리의 25%)
+            reserve_bytes: 시스템의 사용 가능 메모리가 이보다 적으면 메모리 부족으로 보고 그만큼 제거
+                (None이면 시스템 메모리의 10%, 최소 512 MB)
+            pressure_interval: 시스템 사용 가능 메모리를 다시 읽는 최소 간격 (초)
+        """
+        total, _ = system_memory()
+        if limit_bytes is None:
+            env_limit = os.environ.get('IMAGE_EDITOR_MEMORY_LIMIT_MB')
+            if env_limit:
+                limit_bytes = int(float(env_limit) * 1024 ** 2)
+            elif total:
+                limit_bytes = int(total * DEFAULT_LIMIT_FRACTION)
+            else:
+                limit_bytes = DEFAULT_LIMIT_BYTES
+        if reserve_bytes is None:
+            reserve_bytes = max(512 * 1024 ** 2, int(total * 0.1)) if total else 512 * 1024 ** 2
+        self.limit_bytes = limit_bytes
+        self.reserve_bytes = reserve_bytes
+        self.pressure_interval = pressure_interval
+        self.evictions = 0
+        self.evicted_bytes = 0
+        self.last_available = None  # 마지막으로 읽은 시스템 사용 가능 메모리
+        self._consumers = {}  # 이름 -> weakref
+        self._last_pressure_check = 0.0
+        self._lock = threading.RLock()
+        self._enforcing = False
+    
+    def register(self, name, consumer):
+        """하위 시스템 등록 (같은 이름이면 교체)"""
+        with self._lock:
+            self._consumers[name] = weakref.ref(consumer)
+    
+    def unregister(self, name):
+        """하위 시스템 등록 해제"""
+        with self._lock:
+            self._consumers.pop(name, None)
+    
+    def _alive(self):
+        """살아 있는 (이름, 하위 시스템) 목록 (사라진 하위 시스템은 등록 해제)"""
+        consumers = []
+        for name, ref in list(self._consumers.items()):
+            consumer = ref()
+            if consumer is None:
+                del self._consumers[name]
+            else:
+                consumers.append((name, consumer))
+        return consumers
+    
+    def usage(self) -> dict:
+        """하위 시스템별 사용 바이트 수"""
+        with self._lock:
+            return {name: int(consumer.memory_usage()) for name, consumer in self._alive()}
+    
+    def total_usage(self) -> int:
+        """등록된 하위 시스템 전체 사용 바이트 수"""
+        return sum(self.usage().values())
+    
+    def _pressure_shortfall(self, force=False):
+        """시스템 메모리 부족분 (바이트) - 간격 안에 다시 호출하면 0"""
+        now = time.monotonic()
+        if not force and now - self._last_pressure_check < self.pressure_interval:
+            return 0
+        self._last_pressure_check = now
+        _, available = system_memory()
+        self.last_available = available
+        if available is None:
+            return 0
+        return max(0, self.reserve_bytes - available)
+    
+    def enforce(self, force_pressure_check=False) -> int:
+        """한도를 넘었거나 시스템 메모리가 부족하면 제거 - 해제한 바이트 수 반환
+        
+        하위 시스템이 큰 항목을 추가한 뒤 호출합니다. 제거 중(evict_memory 안)의 호출은 무시됩니다.
+        """
+        with self._lock:
+            if self._enforcing:
+                return 0
+            self._enforcing = True
+            try:
+                consumers = self._alive()
+                total = sum(consumer.memory_usage() for _, consumer in consumers)
+                needed = max(total - self.limit_bytes, self._pressure_shortfall(force_pressure_check))
+                if needed <= 0:
+                    return 0
+                return self._evict(consumers, needed)
+            finally:
+                self._enforcing = False
+    
+    def _evict(self, consumers, needed):
+        """우선순위가 낮은 항목부터 needed 바이트 이상 제거"""
+        now = time.monotonic()
+        candidates = []
+        for name, consumer in consumers:
+            for key, nbytes, last_used, cost in consumer.memory_candidates():
+                priority = cost / max(nbytes, 1) / (1.0 + max(0.0, now - last_used))
+                candidates.append((priority, name, key, consumer))
+        candidates.sort(key=lambda item: item[0])
+        freed = 0
+        for _, name, key, consumer in candidates:
+            if freed >= needed:
+                break
+            released = consumer.evict_memory(key)
+            if released:
+                freed += released
+                self.evictions += 1
+                self.evicted_bytes += released
+        return freed
+    
+    def report(self) -> dict:
+        """디버그 보기용 사용량 보고"""
+        usage = self.usage()
+        total, available = system_memory()
+        return {
+            'subsystems': usage,
+            'total': sum(usage.values()),
+            'limit': self.limit_bytes,
+            'reserve': self.reserve_bytes,
+            'system_total': total,
+            'system_available': available,
+            'evictions': self.evictions,
+            'evicted_bytes': self.evicted_bytes,
+        }
+    
+    def format_report(self) -> str:
+        """사용량 보고를 여러 줄 문자열로 반환"""
+        report = self.report()
+        lines = [f"Total {format_bytes(report['total'])} / limit {format_bytes(report['limit'])}"]
+        if report['system_available'] is not None:
+            lines.append(f"System available {format_bytes(report['system_available'])} "
+                         f"/ {format_bytes(report['system_total'])} "
+                         f"(reserve {format_bytes(report['reserve'])})")
+        lines.append('')
+        for name, nbytes in sorted(report['subsystems'].items(), key=lambda item: -item[1]):
+            lines.append(f"{name:<16}{format_bytes(nbytes):>12}")
+        lines.append('')
+        lines.append(f"Evictions {report['evictions']} ({format_bytes(report['evicted_bytes'])})")
+        return '\n'.join(lines)
+
+
+# 프로세스 전체에서 함께 사용하는 예산 관리자
+memory_budget = MemoryBudget()
@@ -0,0 +1,116 @@
+"""
+모폴로지 (Morphology) 모듈
+큰 구조 요소의 침식/팽창을 가로 선분(chord) 분해로 빠르게 처리
+
+- 사각형: OpenCV가 가로/세로 1차원 연산으로 나누고 반복(iterations)도 큰 사각형 하나로
+  합쳐 처리하므로 그대로 사용합니다.
+- 타원, 십자: 구조 요소를 중심이 같은 사각형들의 합집합으로 분해하고, 작은 1차원 침식과
+  최솟값만으로 처리합니다. 결과는 cv2.erode/cv2.dilate와 화소 단위로 같습니다.
+"""
+
+from functools import lru_cache
+
+import cv2
+
+# 모양 이름 -> OpenCV 구조 요소 모양
+SHAPES = {
+    'rect': cv2.MORPH_RECT,
+    'ellipse': cv2.MORPH_ELLIPSE,
+    'cross': cv2.MORPH_CROSS,
+}
+# 이 크기 이상의 커널은 선분 분해로 처리 - (1채널, 컬러)
+# (그보다 작으면 OpenCV가 더 빠름, 4K 기준 측정)
+DECOMPOSE_MIN_KERNEL = {
+    'ellipse': (25, 35),
+    'cross': (101, 101),
+}
+
+
+@lru_cache(maxsize=64)
+def chord_decomposition(shape: str, kernel_size: int):
+    """구조 요소를 중심이 같은 사각형들로 분해 - ((가로 반지름, 세로 반지름), ...)
+
+    가로 반지름이 큰 것부터 정렬되며 세로 반지름은 커집니다. 이 사각형들의 합집합이 구조 요소입니다.
+    (타원/십자/사각형처럼 각 행이 가운데 정렬된 선분이고 위아래로 갈수록 좁아지는 모양)
+    """
+    kernel = cv2.getStructuringElement(SHAPES[shape], (kernel_size, kernel_size))
+    radius = kernel_size // 2
+    half_widths = [(int(kernel[radius + dy].sum()) - 1) // 2 for dy in range(radius + 1)]
+    chords = []
+    for half_width in sorted(set(half_widths), reverse=True):
+        half_height = max(dy for dy, w in enumerate(half_widths) if w >= half_width)
+        chords.append((half_width, half_height))
+    return tuple(chords)
+
+
+def morphology_method(shape: str, kernel_size: int, channels: int = 1) -> str:
+    """모양, 커널 크기, 채널 수에 따른 처리 방식 ('opencv' 또는 'chords')"""
+    thresholds = DECOMPOSE_MIN_KERNEL.get(shape)
+    if thresholds is not None and kernel_size >= thresholds[0 if channels == 1 else 1]:
+        return 'chords'
+    return 'opencv'
+
+
+def _channels(img):
+    """채널 수"""
+    return img.shape[2] if img.ndim == 3 else 1
+
+
+def _line(func, img, half_width, half_height):
+    """가로 또는 세로 1차원 침식/팽창 (반지름 0이면 그대로)"""
+    if half_width == 0 and half_height == 0:
+        return img
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (2 * half_width + 1, 2 * half_height + 1))
+    return func(img, kernel)
+
+
+def _chords(img, chords, func, combine):
+    """선분 분해 1회 - 결과 = combine_j(세로_j(가로_j(img)))
+
+    가로 반지름이 작은 사각형부터 가로 연산을 이어서 넓히고(가로 반지름 차이만큼),
+    세로 연산은 다음 사각형과의 높이 차이만큼만 적용한 뒤 합칩니다.
+    가로/세로 연산 모두 작은 커널이므로 큰 구조 요소도 빠릅니다.
+    """
+    widths = [w for w, _ in chords]
+    heights = [h for _, h in chords]
+    row = _line(func, img, widths[-1], 0)
+    merged = row
+    for j in range(len(chords) - 2, -1, -1):
+        row = _line(func, row, widths[j] - widths[j + 1], 0)
+        merged = combine(row, _line(func, merged, 0, heights[j + 1] - heights[j]))
+    return _line(func, merged, 0, heights[0])
+
+
+def _apply(img, kernel_size, shape, iterations, func, combine, dst):
+    """침식/팽창 공통 처리"""
+    if shape not in SHAPES:
+        print(f"알 수 없는 구조 요소 모양: {shape}")
+        return img
+    if iterations < 1:
+        return img
+    if morphology_method(shape, kernel_size, _channels(img)) == 'opencv':
+        kernel = cv2.getStructuringElement(SHAPES[shape], (kernel_size, kernel_size))
+        return func(img, kernel, iterations=iterations, dst=dst)
+    chords = chord_decomposition(shape, kernel_size)
+    result = img
+    for _ in range(iterations):
+        result = _chords(result, chords, func, combine)
+    return result
+
+
+def erode(img, kernel_size: int, shape: str = 'rect', iterations: int = 1, dst=None):
+    """침식 (경계 밖은 무시 - cv2.erode 기본값과 같음)
+
+    Args:
+        img: BGR 또는 그레이스케일 이미지
+        kernel_size: 구조 요소 크기 (홀수)
+        shape: 'rect', 'ellipse', 'cross'
+        iterations: 반복 횟수
+        dst: 출력 버퍼 (선택, 사용되지 않을 수 있으므로 반환값을 사용)
+    """
+    return _apply(img, kernel_size, shape, iterations, cv2.erode, cv2.min, dst)
+
+
+def dilate(img, kernel_size: int, shape: str = 'rect', iterations: int = 1, dst=None):
+    """팽창 (경계 밖은 무시 - cv2.dilate 기본값과 같음), 인자는 erode()와 같음"""
+    return _apply(img, kernel_size, shape, iterations, cv2.dilate, cv2.max, dst)
@@ -0,0 +1,481 @@
+"""
+처리 파이프라인 모듈
+편집기 상태(button_states, trackbar_values)를 처리 단계 목록으로 구성하고 실행
+빠른 미리보기 모드에서는 비용 모델에 따라 단계 순서를 재배치
+"""
+
+import math
+
+import cv2
+import numpy as np
+
+from . import pixel_processing, area_processing, geometric_processing
+from .blur import blur_engine, blur_halo
+from .buffer_pool import BufferPool
+from .conversion_cache import ConversionCache
+from .tracing import tracer
+
+
+# 단계 종류
+POINT = 'point'          # 화소 단위 연산 (크기 조절과 교환 가능)
+AREA = 'area'            # 주변 화소 사용 (커널을 배율에 맞추면 크기 조절과 근사 교환)
+FLIP = 'flip'            # 대칭 (크기 조절과 정확히 교환)
+ROTATION = 'rotation'    # 회전 (가로/세로 배율이 같을 때만 크기 조절과 교환)
+RESIZE = 'resize'        # 크기 조절
+
+# 기본값 (이 값이면 단계가 생략됨)
+DEFAULT_TRACKBAR_VALUES = {
+    'brightness': 100,
+    'contrast': 100,
+    'threshold': 127,
+    'clahe': 0,        # 지역 히스토그램 평활화 대비 제한 × 10 (0이면 끔)
+    'blur': 0,
+    'canny_low': 50,
+    'canny_high': 150,
+    'sharpen': 0,
+    'rotation': 0,
+    'resize_w': 100,
+    'resize_h': 100
+}
+
+# 결과가 1채널(gray/이진)인 단계 - 이후 단계와 히스토리, 화면 표시도 1채널로 처리
+SINGLE_CHANNEL_STAGES = ('grayscale', 'canny', 'threshold')
+
+# ROI 처리
+CANNY_HALO = 8      # Sobel(1) + 비최대 억제(1) + 이력 임계값 연결 여유 (이력 연결은 전역이라 근사)
+ROI_ALIGN = 16      # ROI 처리 영역 시작 좌표 정렬 (블러 피라미드 격자를 전체 이미지와 맞춤)
+
+DEFAULT_BUTTON_STATES = {
+    'grayscale': False,
+    'invert': False,
+    'flip_h': False,
+    'flip_v': False
+}
+
+
+class Stage:
+    """처리 단계 (단일 책임: 단계 1개의 실행 정보 보관)
+
+    func(img, **params)로 실행되며, scale_params가 있으면 크기 조절이 앞당겨졌을 때
+    파라미터를 배율에 맞게 조정합니다. uses_cache인 단계는 변환 캐시를 cache=로 받습니다.
+    모든 단계 함수는 출력 버퍼 dst=를 받습니다. halo(params)는 AREA 단계 결과가 영향을 받는
+    주변 화소 폭이며, None이면 ROI만 처리할 수 없는 단계입니다 (CLAHE 등 이미지 전체를 사용).
+    """
+
+    __slots__ = ('name', 'kind', 'func', 'params', 'scale_params', 'uses_cache', 'halo')
+
+    def __init__(self, name, kind, func, params=None, scale_params=None, uses_cache=False,
+                 halo=None):
+        self.name = name
+        self.kind = kind
+        self.func = func
+        self.params = params or {}
+        self.scale_params = scale_params
+        self.uses_cache = uses_cache
+        self.halo = halo
+
+    def run(self, img, cache=None, dst=None):
+        """단계 실행 (결과가 dst가 아닐 수 있으므로 반환값 사용)"""
+        if self.uses_cache:
+            return self.func(img, cache=cache, dst=dst, **self.params)
+        return self.func(img, dst=dst, **self.params)
+
+    def scaled(self, factor):
+        """배율 factor에 맞게 파라미터를 조정한 단계 반환"""
+        if self.scale_params is None or factor == 1.0:
+            return self
+        return Stage(self.name, self.kind, self.func,
+                     self.scale_params(self.params, factor), self.scale_params,
+                     self.uses_cache, self.halo)
+
+    def output_shape(self, shape):
+        """입력 shape에 대한 출력 shape 추정 (비용 계산용)"""
+        h, w = shape[:2]
+        channels = shape[2] if len(shape) == 3 else 1
+        if self.name in SINGLE_CHANNEL_STAGES:
+            channels = 1
+        if self.kind == ROTATION:
+            h, w = geometric_processing.rotated_size(h, w, self.params['angle'])
+        elif self.kind == RESIZE:
+            w, h = _resize_percent_size(h, w, self.params['percent_w'], self.params['percent_h'])
+        return (h, w, channels) if channels > 1 else (h, w)
+
+    def __repr__(self):
+        return f"Stage({self.name!r}, {self.params!r})"
+
+
+def _resize_percent_size(h, w, percent_w, percent_h):
+    """퍼센트 크기 조절 결과의 크기 (new_width, new_height)"""
+    return max(1, int(w * percent_w / 100.0)), max(1, int(h * percent_h / 100.0))
+
+
+def _resize_percent(img, percent_w, percent_h, dst=None, interpolation=None):
+    """퍼센트 값으로 크기 조절"""
+    h, w = img.shape[:2]
+    new_width, new_height = _resize_percent_size(h, w, percent_w, percent_h)
+    return geometric_processing.apply_resize(img, width=new_width, height=new_height,
+                                             interpolation=interpolation, dst=dst)
+
+
+def _scale_blur(params, factor):
+    """블러 커널 반경을 배율에 맞게 조정"""
+    return {'value': max(0, int(round(params['value'] * factor)))}
+
+
+def _blur_halo(params):
+    """블러 단계의 주변 화소 폭"""
+    return blur_halo(params['value'])
+
+
+def _canny_halo(params):
+    """Canny 단계의 주변 화소 폭"""
+    return CANNY_HALO
+
+
+def _upstream_key(source, stages):
+    """원본과 앞 단계들의 설정 - 입력이 같은지 구분하는 캐시 키 (CLAHE 타일 히스토그램 재사용)
+    원본을 식별하는 값이 없으면 None (캐시하지 않음)
+    """
+    if source is None:
+        return None
+    return source, tuple((stage.name, tuple(sorted(stage.params.items()))) for stage in stages)
+
+
+def build_stages(button_states, trackbar_values, source=None, fixed_geometry=False):
+    """편집기 상태로부터 처리 단계 목록 구성 (apply_all_effects와 같은 순서)
+
+    source: 처리할 원본을 식별하는 해시 가능한 값 (원본이 바뀔 때마다 바뀌는 세대 번호 등, 선택).
+        주면 CLAHE가 같은 원본과 설정의 타일 히스토그램을 재사용합니다. 없으면 매번 계산합니다.
+    fixed_geometry: 같은 크기의 프레임에 같은 단계를 반복 적용하는 경우(동영상, 일괄 처리) True.
+        회전이 좌표표를 캐시하여 remap합니다 (편집기는 False: cv2.warpAffine 직접 변환).
+    """
+    stages = []
+
+    # 버튼 효과
+    if button_states['grayscale']:
+        stages.append(Stage('grayscale', POINT, pixel_processing.to_grayscale,
+                            uses_cache=True))
+    if button_states['invert']:
+        stages.append(Stage('invert', POINT, pixel_processing.apply_invert))
+    if button_states['flip_h']:
+        stages.append(Stage('flip_h', FLIP, geometric_processing.apply_flip_horizontal))
+    if button_states['flip_v']:
+        stages.append(Stage('flip_v', FLIP, geometric_processing.apply_flip_vertical))
+
+    # 트랙바 효과
+    if trackbar_values['brightness'] != 100:
+        stages.append(Stage('brightness', POINT, pixel_processing.apply_brightness,
+                            {'value': trackbar_values['brightness']}))
+    if trackbar_values['contrast'] != 100:
+        stages.append(Stage('contrast', POINT, pixel_processing.apply_contrast,
+                            {'value': trackbar_values['contrast']}))
+    if trackbar_values['clahe'] > 0:
+        # 타일이 이미지 크기에 비례하므로 크기 조절과 근사 교환 (배율 조정 불필요)
+        stages.append(Stage('clahe', AREA, pixel_processing.apply_clahe,
+                            {'clip_limit': trackbar_values['clahe'] / 10.0,
+                             'key': _upstream_key(source, stages)}, uses_cache=True))
+    if trackbar_values['blur'] > 0:
+        stages.append(Stage('blur', AREA, area_processing.apply_blur,
+                            {'value': trackbar_values['blur']}, _scale_blur,
+                            halo=_blur_halo))
+    if trackbar_values['canny_low'] != 50 or trackbar_values['canny_high'] != 150:
+        stages.append(Stage('canny', AREA, area_processing.apply_canny,
+                            {'low_threshold': trackbar_values['canny_low'],
+                             'high_threshold': trackbar_values['canny_high']},
+                            uses_cache=True, halo=_canny_halo))
+    if trackbar_values['threshold'] != 127:
+        stages.append(Stage('threshold', POINT, pixel_processing.apply_threshold,
+                            {'value': trackbar_values['threshold']}, uses_cache=True))
+    if trackbar_values['rotation'] != 0:
+        rotation = {'angle': trackbar_values['rotation']}
+        if fixed_geometry:
+            rotation['cache_maps'] = True
+        stages.append(Stage('rotation', ROTATION, geometric_processing.apply_rotation, rotation))
+
+    # Resize 적용 (퍼센트 값으로 처리)
+    if trackbar_values['resize_w'] != 100 or trackbar_values['resize_h'] != 100:
+        stages.append(Stage('resize', RESIZE, _resize_percent,
+                            {'percent_w': trackbar_values['resize_w'],
+                             'percent_h': trackbar_values['resize_h']}))
+
+    return stages
+
+
+def build_stages_from_recipe(recipe, fixed_geometry=False):
+    """레시피로 단계 목록 구성
+
+    Args:
+        recipe: {'button_states': {...}, 'trackbar_values': {...}} 형태 (누락된 키는 기본값)
+        fixed_geometry: 같은 크기의 프레임에 반복 적용하면 True (build_stages 참고)
+    """
+    button_states = dict(DEFAULT_BUTTON_STATES)
+    button_states.update(recipe.get('button_states', {}))
+    trackbar_values = dict(DEFAULT_TRACKBAR_VALUES)
+    trackbar_values.update(recipe.get('trackbar_values', {}))
+    return build_stages(button_states, trackbar_values, fixed_geometry=fixed_geometry)
+
+
+def run_stages(img, stages, cache=None, pool=None):
+    """단계 목록을 순서대로 실행 (단계별 추적 구간 기록)
+
+    Args:
+        cache: 이번 실행에서 사용할 ConversionCache (None이면 실행마다 새로 생성).
+            호출자가 넘기면 실행 후 결과의 표시용 RGB 등을 꺼내 쓸 수 있습니다.
+        pool: BufferPool (선택). 각 단계의 출력 버퍼를 풀에서 빌리고, 다음 단계가
+            소비한 중간 결과는 풀에 반환합니다. 최종 결과는 호출자가 소유하며
+            다 쓴 뒤 pool.release()로 반환할 수 있습니다.
+    """
+    if cache is None:
+        cache = ConversionCache()
+    source = img
+    for stage in stages:
+        dst = None
+        if pool is not None:
+            dst = pool.acquire(stage.output_shape(img.shape), img.dtype)
+        with tracer.span(stage.name):
+            result = stage.run(img, cache, dst)
+        if pool is not None:
+            if result is not dst:
+                pool.release(dst)  # 효과가 없었거나 캐시 결과를 사용한 경우
+            if img is not source and img is not result and pool.owns(img):
+                # 소비된 중간 결과 반환 (재사용 전에 캐시 항목 제거)
+                cache.discard(img)
+                pool.release(img)
+        img = result
+    return img
+
+
+def roi_halo(stages):
+    """ROI만 처리할 때 필요한 주변 화소 폭 (ROI만 처리할 수 없는 단계가 있으면 None)
+
+    화소 단위 단계는 0, AREA 단계는 halo(params)를 더합니다. 대칭, 회전, 크기 조절은
+    결과 좌표가 바뀌므로, CLAHE는 이미지 전체 타일을 사용하므로 None입니다.
+    """
+    halo = 0
+    for stage in stages:
+        if stage.kind == POINT:
+            continue
+        if stage.kind != AREA or stage.halo is None:
+            return None
+        halo += stage.halo(stage.params)
+    return halo
+
+
+def roi_bounds(shape, roi, halo):
+    """ROI를 이미지 안으로 자르고, halo를 더한 처리 영역 계산
+
+    Returns:
+        (roi, region) - 둘 다 (x, y, w, h). ROI가 이미지 밖이면 None
+    """
+    height, width = shape[:2]
+    x, y, w, h = roi
+    x0, y0 = max(0, int(x)), max(0, int(y))
+    x1, y1 = min(width, int(x + w)), min(height, int(y + h))
+    if x1 <= x0 or y1 <= y0:
+        return None
+    # 시작 좌표를 ROI_ALIGN 배수로 내림 (피라미드 블러의 절반 줄이기 격자가 전체 처리와 같아짐)
+    rx0 = max(0, x0 - halo) // ROI_ALIGN * ROI_ALIGN
+    ry0 = max(0, y0 - halo) // ROI_ALIGN * ROI_ALIGN
+    rx1, ry1 = min(width, x1 + halo), min(height, y1 + halo)
+    return (x0, y0, x1 - x0, y1 - y0), (rx0, ry0, rx1 - rx0, ry1 - ry0)
+
+
+def frame_stages(stages, shape):
+    """전체 이미지 기준으로 정한 블러 방식과 피라미드 단계 수를 고정한 단계 목록
+
+    블러 방식은 처리하는 이미지 크기에 따라 달라지므로, ROI(+halo)만 처리할 때도
+    전체 이미지를 처리할 때와 같은 방식을 쓰도록 단계 파라미터로 넘깁니다.
+    """
+    planned = []
+    for stage in stages:
+        if stage.name == 'blur' and 'method' not in stage.params:
+            method, levels = blur_engine.plan(stage.params['value'], shape)
+            stage = Stage(stage.name, stage.kind, stage.func,
+                          dict(stage.params, method=method, levels=levels), stage.scale_params,
+                          stage.uses_cache, stage.halo)
+        planned.append(stage)
+        shape = stage.output_shape(shape)
+    return planned
+
+
+def process_roi(img, stages, roi, cache=None):
+    """ROI(관심 영역)만 처리
+
+    img[ROI + halo]를 복사하지 않고 view로 잘라 처리합니다.
+    처리 시간은 이미지 크기와 관계없이 ROI 크기에 비례합니다.
+
+    Returns:
+        (ROI 처리 결과, 이미지 안으로 자른 ROI (x, y, w, h)) - ROI만 처리할 수 없으면 None
+    """
+    halo = roi_halo(stages)
+    if halo is None:
+        return None
+    bounds = roi_bounds(img.shape, roi, halo)
+    if bounds is None:
+        return None
+    (x, y, w, h), (rx, ry, rw, rh) = bounds
+    region = geometric_processing.apply_crop(img, rx, ry, rw, rh, copy=False)
+    result = run_stages(region, frame_stages(stages, img.shape), cache)
+    return result[y - ry:y - ry + h, x - rx:x - rx + w], (x, y, w, h)
+
+
+def paste_roi(frame, patch, roi):
+    """ROI 처리 결과를 전체 크기 frame에 합성 (그레이스케일 결과는 frame 채널 수에 맞춤)
+
+    Returns:
+        frame의 ROI 부분 (view)
+    """
+    x, y, w, h = roi
+    target = frame[y:y + h, x:x + w]
+    if patch.ndim != target.ndim:
+        cv2.cvtColor(patch, cv2.COLOR_GRAY2BGR, dst=target)
+    else:
+        target[...] = patch
+    return target
+
+
+def run_stages_roi(img, stages, roi, frame, cache=None):
+    """ROI(관심 영역)만 처리하여 frame에 합성
+
+    Args:
+        img: 원본 이미지 (전체)
+        roi: (x, y, w, h) 원본 좌표
+        frame: 결과를 합성할 전체 크기 이미지 (img와 같은 크기, ROI 밖은 그대로 유지)
+        cache: ConversionCache (선택)
+
+    Returns:
+        ROI 처리 결과 (ROI 크기, frame의 view) - ROI만 처리할 수 없으면 None
+    """
+    processed = process_roi(img, stages, roi, cache)
+    if processed is None:
+        return None
+    return paste_roi(frame, *processed)
+
+
+def changes_coordinates(stages):
+    """결과 좌표가 원본 좌표와 달라지는 단계(대칭, 회전, 크기 조절)가 있는지 여부
+
+    화면에서 고른 ROI는 표시 중인 결과의 좌표이므로 이런 단계가 있으면 원본 좌표로 쓸 수 없습니다.
+    """
+    return any(stage.kind in (FLIP, ROTATION, RESIZE) for stage in stages)
+
+
+def split_geometric_tail(stages):
+    """끝부분의 회전/크기 조절 단계 분리
+
+    Returns:
+        (앞부분 단계 목록, 끝부분 기하 단계 목록)
+    """
+    index = len(stages)
+    while index > 0 and stages[index - 1].kind in (ROTATION, RESIZE):
+        index -= 1
+    return stages[:index], stages[index:]
+
+
+def geometric_transform(stages, shape):
+    """기하 단계들(회전/크기 조절)을 합성한 어파인 행렬과 출력 크기
+
+    재표본화 없이 화면 변환만으로 결과를 미리보기 위해 사용합니다.
+
+    Returns:
+        (2x3 행렬 - 입력 좌표 -> 출력 좌표, 출력 크기 (w, h))
+    """
+    h, w = shape[:2]
+    matrix = np.eye(3)
+    for stage in stages:
+        step = np.eye(3)
+        if stage.kind == ROTATION:
+            step[:2], (new_w, new_h) = geometric_processing.get_rotation_matrix(
+                h, w, stage.params['angle'])
+        elif stage.kind == RESIZE:
+            new_w, new_h = _resize_percent_size(h, w, stage.params['percent_w'],
+                                                stage.params['percent_h'])
+            step[0, 0] = new_w / w
+            step[1, 1] = new_h / h
+        else:
+            raise ValueError(f"기하 단계가 아님: {stage.name}")
+        matrix = step @ matrix
+        w, h = new_w, new_h
+    return matrix[:2], (w, h)
+
+
+def output_shape(stages, shape):
+    """단계 목록을 실행한 결과의 shape"""
+    for stage in stages:
+        shape = stage.output_shape(shape)
+    return shape
+
+
+def estimate_cost(stages, shape):
+    """단계 목록의 비용 추정 - 각 단계가 처리하는 입력 요소 수(화소 × 채널)의 합"""
+    cost = 0
+    for stage in stages:
+        cost += math.prod(shape)
+        shape = stage.output_shape(shape)
+    return cost
+
+
+def _commutes_with_resize(stage, resize_stage):
+    """크기 조절을 이 단계 앞으로 옮길 수 있는지 (근사 교환 포함)"""
+    if stage.kind in (POINT, AREA, FLIP):
+        return True
+    if stage.kind == ROTATION:
+        # 회전은 가로/세로 배율이 같을 때만 교환
+        return resize_stage.params['percent_w'] == resize_stage.params['percent_h']
+    return False
+
+
+def plan_fast_preview(stages, shape):
+    """빠른 미리보기용 단계 재배치
+
+    축소(resize)를 교환 가능한 단계들 앞으로 옮겨 처리 화소 수를 줄입니다.
+    앞당겨진 영역 처리 단계는 커널을 배율에 맞게 줄입니다. 후보 위치들 중
+    estimate_cost()가 가장 작은 순서를 선택합니다. 결과는 근사이므로
+    내보내기(저장)에는 원래 순서(build_stages 결과)를 사용해야 합니다.
+    """
+    resize_index = next((i for i, s in enumerate(stages) if s.kind == RESIZE), None)
+    if resize_index is None:
+        return list(stages)
+
+    resize_stage = stages[resize_index]
+    percent_w = resize_stage.params['percent_w']
+    percent_h = resize_stage.params['percent_h']
+    if percent_w > 100 or percent_h > 100:
+        # 확대는 앞당기면 처리 화소가 늘어남
+        return list(stages)
+    factor = math.sqrt(percent_w * percent_h) / 100.0
+
+    best = list(stages)
+    best_cost = estimate_cost(best, shape)
+    others = stages[:resize_index] + stages[resize_index + 1:]
+
+    # resize를 한 칸씩 앞으로 옮기며 후보 평가 (교환 불가능한 단계를 만나면 중단)
+    position = resize_index
+    while position > 0 and _commutes_with_resize(stages[position - 1], resize_stage):
+        position -= 1
+        candidate = (others[:position] + [resize_stage] +
+                     [s.scaled(factor) for s in others[position:resize_index]] +
+                     others[resize_index:])
+        cost = estimate_cost(candidate, shape)
+        if cost < best_cost:
+            best, best_cost = candidate, cost
+    return best
+
+
+def plan_proxy(stages, shape, size):
+    """드래그 중 미리보기용 단계 - 처음에 화면 크기로 줄이고 나머지 단계를 배율에 맞춤
+
+    최종 결과가 size (w, h) 안에 들어가도록 원본을 먼저 줄이므로(resize_strategy) 이미지 크기와
+    관계없이 화면 화소 수만큼만 처리합니다. 결과는 근사이므로 놓을 때 원래 단계로 다시 처리합니다.
+
+    Returns:
+        (단계 목록, 배율) - 줄일 필요가 없으면 (원래 단계 목록, 1.0)
+    """
+    out_shape = output_shape(stages, shape)
+    factor = min(size[0] / out_shape[1], size[1] / out_shape[0], 1.0)
+    if factor >= 1.0:
+        return list(stages), 1.0
+    percent = factor * 100.0
+    proxy = Stage('proxy', RESIZE, _resize_percent,
+                  {'percent_w': percent, 'percent_h': percent})
+    return [proxy] + [stage.scaled(factor) for stage in stages], factor
@@ -1,67 +1,74 @@
 """
 화소 처리 (Pixel Processing) 모듈
 픽셀 단위의 연산을 통한 이미지 처리 함수들
+
+모든 처리 함수는 선택 인자 dst=(출력 버퍼)를 받습니다. 결과가 dst에 쓰이지 않을 수
+있으므로(효과 없음, 크기 불일치 등) 항상 반환값을 사용해야 합니다.
 """
 
 import cv2
 import numpy as np
 
+from .clahe import clahe_engine
+from .conversion_cache import convert, expand_gray
+
 
-def to_grayscale(image):
+def to_grayscale(image, cache=None, dst=None):
     """
     컬러 이미지를 그레이스케일 이미지로 변환합니다.
+    cache: ConversionCache (같은 버퍼의 변환 결과 재사용, 선택)
     """
     if len(image.shape) == 3:
-        return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        return convert(image, 'gray', cache, dst)
     return image
 
 
-def apply_grayscale(img):
+def apply_grayscale(img, dst=None):
     """그레이스케일 변환 (별칭)"""
-    return to_grayscale(img)
+    return to_grayscale(img, dst=dst)
 
 
-def apply_brightness(img, value):
+def apply_brightness(img, value, dst=None):
     """밝기 조절
     value: -100 ~ 100 범위 (0이 원본)
     """
-    # -100 ~ 100을 0 ~ 200으로 변환
-    adjusted = np.clip(img.astype(np.int16) + (value - 100), 0, 255)
-    return adjusted.astype(np.uint8)
+    # -100 ~ 100을 0 ~ 200으로 변환 (256개 값의 LUT로 계산하여 임시 배열 없이 적용)
+    table = np.clip(np.arange(256, dtype=np.int16) + (value - 100), 0, 255).astype(np.uint8)
+    return cv2.LUT(img, table, dst=dst)
 
 
-def apply_contrast(img, value):
+def apply_contrast(img, value, dst=None):
     """명암 조절
     value: 0 ~ 200 범위 (100이 원본)
     """
     factor = value / 100.0
-    adjusted = np.clip(img.astype(np.float32) * factor, 0, 255)
-    return adjusted.astype(np.uint8)
+    table = np.clip(np.arange(256, dtype=np.float32) * factor, 0, 255).astype(np.uint8)
+    return cv2.LUT(img, table, dst=dst)
 
 
-def apply_invert(img):
+def apply_invert(img, dst=None):
     """이미지 반전 (색상 반전)"""
-    return cv2.bitwise_not(img)
+    return cv2.bitwise_not(img, dst=dst)
 
 
-def apply_threshold(img, value):
+def apply_threshold(img, value, cache=None, dst=None, keep_channels=False):
     """이진화 처리
     value: 임계값 (0 ~ 255)
+    cache: ConversionCache (같은 버퍼의 변환 결과 재사용, 선택)
+    keep_channels: True이면 컬러 입력의 결과를 BGR 3채널로 확장 (기본은 1채널 유지)
     """
-    if len(img.shape) == 3:
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-    else:
-        gray = img
+    gray = to_grayscale(img, cache)
     
-    _, binary = cv2.threshold(gray, value, 255, cv2.THRESH_BINARY)
+    if keep_channels and len(img.shape) == 3:
+        _, binary = cv2.threshold(gray, value, 255, cv2.THRESH_BINARY)
+        return expand_gray(binary, cache, dst)
     
-    # 원본이 컬러였으면 컬러로 변환
-    if len(img.shape) == 3:
-        return cv2.cvtColor(binary, cv2.COLOR_GRAY2BGR)
+    # 이진 결과는 1채널로 유지 (이후 단계, 히스토리, 화면 표시 모두 1/3 크기)
+    _, binary = cv2.threshold(gray, value, 255, cv2.THRESH_BINARY, dst=dst)
     return binary
 
 
-def apply_gamma(img, gamma):
+def apply_gamma(img, gamma, dst=None):
     """감마 보정
     gamma: 감마 값 (0.1 ~ 3.0, 1.0이 원본)
     """
@@ -74,19 +81,84 @@ def apply_gamma(img, gamma):
                       for i in np.arange(0, 256)]).astype("uint8")
     
     # LUT 적용
-    return cv2.LUT(img, table)
+    return cv2.LUT(img, table, dst=dst)
 
 
-def apply_histogram_equalization(img):
+def apply_histogram_equalization(img, cache=None, dst=None, local=False, clip_limit=2.0, tiles=8):
     """히스토그램 평활화
     명암 대비를 극대화하여 이미지를 선명하게 만듭니다.
+    cache: ConversionCache (같은 버퍼의 변환 결과 재사용, 선택)
+    local: True이면 지역(CLAHE) 모드 - apply_clahe() 사용 (큰 사진에서 밝은 영역이 날아가지 않음)
+    clip_limit, tiles: 지역 모드의 대비 제한과 타일 수
     """
+    if local:
+        return apply_clahe(img, clip_limit, tiles, cache, dst)
+    
     if len(img.shape) == 3:
-        # 컬러 이미지: YUV로 변환 후 Y 채널만 평활화
-        yuv = cv2.cvtColor(img, cv2.COLOR_BGR2YUV)
-        yuv[:, :, 0] = cv2.equalizeHist(yuv[:, :, 0])
-        return cv2.cvtColor(yuv, cv2.COLOR_YUV2BGR)
+        # 컬러 이미지: YUV로 변환 후 Y 채널만 평활화 (캐시된 YUV는 수정하지 않음)
+        y, u, v = cv2.split(convert(img, 'yuv', cache))
+        yuv = cv2.merge([cv2.equalizeHist(y), u, v])
+        return cv2.cvtColor(yuv, cv2.COLOR_YUV2BGR, dst=dst)
     else:
         # 그레이스케일 이미지
-        return cv2.equalizeHist(img)
+        return cv2.equalizeHist(img, dst=dst)
+
 
+def apply_clahe(img, clip_limit=2.0, tiles=8, cache=None, dst=None, key=None):
+    """지역 히스토그램 평활화 (CLAHE)
+    타일별 히스토그램으로 대비를 높이고 clip_limit로 잡음 증폭을 제한합니다.
+    key로 입력을 식별하면 타일 히스토그램/LUT를 캐시하여 clip_limit 변경 시 LUT만 다시 만듭니다.
+    
+    Args:
+        img: BGR 또는 그레이스케일 이미지
+        clip_limit: 대비 제한 (클수록 강함, 0 이하이면 제한 없음)
+        tiles: 가로/세로 타일 수
+        cache: ConversionCache (같은 버퍼의 변환 결과 재사용, 선택)
+        key: 입력을 식별하는 타일 히스토그램 캐시 키 (원본 세대 번호 + 이전 단계 설정 등, None이면 캐시하지 않음)
+    """
+    grid = (tiles, tiles)
+    if len(img.shape) == 2:
+        return clahe_engine.apply(img, clip_limit, grid, key, dst)
+    
+    # 컬러 이미지: YUV로 변환 후 Y 채널만 평활화하고 색차(U, V)는 유지 (캐시된 YUV는 수정하지 않음)
+    # BGR로 되돌리는 변환은 평활화가 끝난 행 묶음마다 바로 하여 캐시에 남아 있는 동안 처리
+    yuv = convert(img, 'yuv', cache)
+    y = cv2.extractChannel(yuv, 0)
+    if dst is None or dst.shape != img.shape or dst.dtype != img.dtype:
+        dst = np.empty_like(img)
+    equalized = np.empty_like(y)
+    
+    def compose(y0, y1):
+        strip = yuv[y0:y1].copy()
+        cv2.insertChannel(equalized[y0:y1], strip, 0)
+        cv2.cvtColor(strip, cv2.COLOR_YUV2BGR, dst=dst[y0:y1])
+    
+    clahe_engine.apply(y, clip_limit, grid, key, equalized, rows_done=compose)
+    return dst
+
+
+def calc_histograms(img, max_pixels=65536):
+    """채널별/휘도 히스토그램 계산 (표시용)
+    전체 해상도 배열 대신 간격을 두고 뽑은 표본(proxy)으로 계산하므로
+    이미지 크기와 관계없이 비용이 일정합니다.
+    
+    Args:
+        img: BGR 또는 그레이스케일 이미지
+        max_pixels: 표본 화소 수 상한
+    
+    Returns:
+        dict: {'b', 'g', 'r', 'luma'} (그레이스케일은 {'luma'}) - 각 256개 빈의 float32 배열
+    """
+    h, w = img.shape[:2]
+    step = max(1, int(np.ceil(np.sqrt(h * w / float(max_pixels)))))
+    proxy = np.ascontiguousarray(img[::step, ::step])
+    
+    histograms = {}
+    if len(proxy.shape) == 3:
+        for index, name in enumerate(('b', 'g', 'r')):
+            histograms[name] = cv2.calcHist([proxy], [index], None, [256], [0, 256]).ravel()
+        gray = cv2.cvtColor(proxy, cv2.COLOR_BGR2GRAY)
+    else:
+        gray = proxy
+    histograms['luma'] = cv2.calcHist([gray], [0], None, [256], [0, 256]).ravel()
+    return histograms
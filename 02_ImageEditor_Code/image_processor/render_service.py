@@ -0,0 +1,573 @@
+"""
+로컬 렌더 서비스 모듈
+GUI를 띄우지 않고 다른 도구에서 편집기의 처리 단계를 사용할 수 있도록
+localhost HTTP(또는 Unix 도메인 소켓)로 이미지와 레시피를 받아 처리
+
+큰 이미지는 공유 메모리(multiprocessing.shared_memory)로 주고받아 요청 본문 복사를 피하고,
+동시에 들어온 같은 크기의 요청은 묶어서(batch) 처리합니다.
+
+사용법 (02_ImageEditor_Code 폴더에서):
+    python -m image_processor.render_service --port 8765
+    python -m image_processor.render_service --unix /tmp/image_editor.sock
+
+엔드포인트:
+    POST /render   본문이 이미지 파일(PNG, JPEG 등)이면 X-Recipe 헤더(JSON)의 레시피로 처리하여
+                   PNG로 반환 (?format=.jpg로 출력 형식 지정)
+                   본문이 JSON(Content-Type: application/json)이면 공유 메모리 요청
+                   {"shm": 이름, "shape": [h, w, 3], "dtype": "uint8", "recipe": {...},
+                    "output_shm": 이름 (선택, 없으면 입력 공유 메모리에 결과를 씀)}
+                   응답: {"shm": 결과 이름, "shape": [...], "dtype": "uint8", "seconds": 처리 시간}
+    GET /metrics   대기열 길이, 처리 중 요청 수, 배치 크기, 지연 시간 백분위수 (JSON)
+
+레시피는 {"button_states": {...}, "trackbar_values": {...}} 형태이며 누락된 키는 기본값입니다.
+"""
+
+import http.client
+import json
+import math
+import os
+import queue
+import socket
+import socketserver
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import shared_memory
+from urllib.parse import parse_qs, urlparse
+
+import cv2
+import numpy as np
+
+from . import pipeline
+from .buffer_pool import BufferPool
+from .memory_budget import memory_budget
+from .tracing import tracer
+
+DEFAULT_PORT = 8765
+
+# 디스패처 종료 표시
+_STOP = None
+
+# 이 프로세스의 RenderClient가 만든 공유 메모리 이름 (같은 프로세스에서 서비스와 함께 쓸 때 구분)
+_created_shared_memory = set()
+
+
+def _percentile(sorted_values, p):
+    """정렬된 값 목록의 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(p / 100.0 * len(sorted_values)) - 1
+    return sorted_values[max(0, min(rank, len(sorted_values) - 1))]
+
+
+def _summarize_ms(values):
+    """초 단위 값들의 ms 백분위수 요약"""
+    ordered = sorted(v * 1000.0 for v in values)
+    return {
+        'count': len(ordered),
+        'p50': _percentile(ordered, 50),
+        'p95': _percentile(ordered, 95),
+        'p99': _percentile(ordered, 99),
+        'max': ordered[-1] if ordered else 0.0,
+    }
+
+
+def recipe_key(recipe) -> str:
+    """레시피 비교용 문자열 (키 순서 무관)"""
+    return json.dumps(recipe or {}, sort_keys=True)
+
+
+def attach_shared_memory(name: str):
+    """다른 프로세스가 만든 공유 메모리에 연결
+    
+    POSIX의 resource_tracker는 연결만 한 공유 메모리도 이 프로세스가 끝날 때
+    삭제(unlink)하므로 추적에서 제외합니다. 공유 메모리의 수명은 만든 쪽이 관리합니다.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    if os.name == 'posix' and name not in _created_shared_memory:
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm
+
+
+class RenderJob:
+    """렌더 요청 1개 (단일 책임: 입력, 결과, 시각 보관)"""
+    
+    __slots__ = ('image', 'recipe', 'recipe_key', 'batch_key', 'enqueued', 'started',
+                 'finished', 'result', 'error', 'done')
+    
+    def __init__(self, image, recipe):
+        self.image = image
+        self.recipe = recipe or {}
+        self.recipe_key = recipe_key(self.recipe)
+        # 같은 크기(shape, dtype)의 요청끼리 묶음
+        self.batch_key = (image.shape, image.dtype.str)
+        self.enqueued = time.perf_counter()
+        self.started = None
+        self.finished = None
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class RenderService:
+    """렌더 서비스 (단일 책임: 요청 대기열, 배치 구성, 처리, 지표 집계)
+    
+    디스패처 스레드는 처리 워커가 비기를 기다리는 동안 쌓인 요청 중 가장 오래된 요청과
+    같은 크기의 요청들을 최대 max_batch개까지 묶습니다. 배치는 레시피별 처리 단계 구성을
+    공유하고, 요청은 하나씩 빈 워커에 나눠 넘기므로 다른 워커가 노는 동안 한 워커가 배치를
+    차례로 처리하지 않습니다. 한가할 때는 기다리지 않고 바로 처리하므로 배치 때문에 지연이
+    늘지 않고, 크기가 같으므로 버퍼 풀의 출력 버퍼가 그대로 재사용됩니다.
+    """
+    
+    def __init__(self, workers: int = None, max_batch: int = 8, max_samples: int = 1000):
+        """
+        Args:
+            workers: 처리 워커 스레드 수 (기본값: CPU 수, 최대 4)
+            max_batch: 배치 1개의 최대 요청 수
+            max_samples: 지연 시간 백분위수 계산에 보관할 최근 요청 수
+        """
+        self.workers = workers or min(4, os.cpu_count() or 2)
+        self.max_batch = max(1, max_batch)
+        self._queue = queue.Queue()
+        self._slots = threading.Semaphore(self.workers)
+        self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix='render-worker')
+        self._pool = BufferPool(max_free=self.workers * self.max_batch)
+        memory_budget.register('render_service_pool', self._pool)
+        self._lock = threading.Lock()
+        self._queued = 0      # 처리를 시작하지 않은 요청 수
+        self._in_flight = 0   # 처리 중인 요청 수
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self._latencies = deque(maxlen=max_samples)
+        self._waits = deque(maxlen=max_samples)
+        self._batch_sizes = deque(maxlen=max_samples)
+        self._started_at = time.time()
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, name='render-dispatch',
+                                            daemon=True)
+        self._dispatcher.start()
+    
+    def render(self, image, recipe=None, timeout: float = None):
+        """이미지를 레시피로 처리 (처리가 끝날 때까지 대기)
+        
+        결과는 입력 자체(적용할 단계가 없을 때)이거나 버퍼 풀의 버퍼이므로,
+        다 쓴 뒤 release()로 반환하세요.
+        
+        Raises:
+            TimeoutError: timeout 안에 처리가 끝나지 않은 경우
+            Exception: 처리 중 발생한 오류
+        """
+        job = RenderJob(image, recipe)
+        with self._lock:
+            self._queued += 1
+        self._queue.put(job)
+        if not job.done.wait(timeout):
+            raise TimeoutError('렌더 시간 초과')
+        # 디스패처가 마지막 배치를 잠시 들고 있으므로 배열 참조를 끊음 (공유 메모리 close 가능하도록)
+        result, error = job.result, job.error
+        job.image = job.result = None
+        if error is not None:
+            raise error
+        return result
+    
+    def release(self, result):
+        """render() 결과 버퍼 반환 (풀 버퍼가 아니면 무시)"""
+        self._pool.release(result)
+    
+    def close(self):
+        """디스패처와 워커 종료 (대기 중인 요청은 마저 처리)"""
+        self._queue.put(_STOP)
+        self._dispatcher.join()
+        self._executor.shutdown(wait=True)
+    
+    def _dispatch_loop(self):
+        """디스패처 - 가장 오래된 요청과 같은 크기의 요청들을 묶어 빈 워커들에 하나씩 넘김"""
+        pending = []  # 대기열에서 꺼냈지만 아직 넘기지 않은 요청 (도착 순서)
+        stopping = False
+        while True:
+            if not pending:
+                if stopping:
+                    return
+                job = self._queue.get()
+                if job is _STOP:
+                    return
+                pending.append(job)
+            # 빈 워커를 기다리는 동안 들어온 요청까지 모아서 배치 구성
+            self._slots.acquire()
+            while True:
+                try:
+                    job = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if job is _STOP:
+                    stopping = True
+                else:
+                    pending.append(job)
+            key = pending[0].batch_key
+            batch = [job for job in pending if job.batch_key == key][:self.max_batch]
+            pending = [job for job in pending if job not in batch]
+            with self._lock:
+                self.batches += 1
+                self._batch_sizes.append(len(batch))
+            # 배치가 공유하는 레시피별 처리 단계 (처음 처리하는 워커가 구성)
+            stages_by_recipe = {}
+            for index, job in enumerate(batch):
+                if index:
+                    self._slots.acquire()
+                self._executor.submit(self._run_job, job, stages_by_recipe)
+    
+    def _run_job(self, job, stages_by_recipe):
+        """워커 - 요청 1개 처리 (처리 단계는 같은 배치의 요청과 공유)"""
+        try:
+            with self._lock:
+                self._queued -= 1
+                self._in_flight += 1
+            job.started = time.perf_counter()
+            try:
+                stages = stages_by_recipe.get(job.recipe_key)
+                if stages is None:
+                    # 두 워커가 동시에 구성해도 같은 단계이므로 먼저 넣은 것을 사용
+                    stages = stages_by_recipe.setdefault(
+                        job.recipe_key, pipeline.build_stages_from_recipe(job.recipe))
+                with tracer.span('render_request'):
+                    job.result = pipeline.run_stages(job.image, stages, pool=self._pool)
+            except Exception as e:
+                job.error = e
+            job.finished = time.perf_counter()
+            with self._lock:
+                self._in_flight -= 1
+                self.requests += 1
+                if job.error is not None:
+                    self.errors += 1
+                self._latencies.append(job.finished - job.enqueued)
+                self._waits.append(job.started - job.enqueued)
+            job.done.set()
+        finally:
+            self._slots.release()
+    
+    def metrics(self) -> dict:
+        """대기열 길이, 처리 중 요청 수, 배치 크기, 지연 시간(ms) 지표"""
+        with self._lock:
+            latencies = list(self._latencies)
+            waits = list(self._waits)
+            batch_sizes = list(self._batch_sizes)
+            metrics = {
+                'uptime_s': time.time() - self._started_at,
+                'workers': self.workers,
+                'max_batch': self.max_batch,
+                'queue_depth': self._queued,
+                'in_flight': self._in_flight,
+                'requests': self.requests,
+                'errors': self.errors,
+                'batches': self.batches,
+            }
+        metrics['mean_batch_size'] = sum(batch_sizes) / len(batch_sizes) if batch_sizes else 0.0
+        metrics['latency_ms'] = _summarize_ms(latencies)
+        metrics['queue_wait_ms'] = _summarize_ms(waits)
+        metrics['buffer_pool'] = {
+            'allocations': self._pool.allocations,
+            'reuses': self._pool.reuses,
+            'bytes': self._pool.memory_usage(),
+        }
+        return metrics
+
+
+class _RequestError(Exception):
+    """HTTP 오류 응답으로 바꿀 요청 오류"""
+    
+    def __init__(self, status, message, **extra):
+        super().__init__(message)
+        self.status = status
+        self.extra = extra
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """HTTP 요청 처리기 (단일 책임: HTTP 요청을 RenderService 호출로 변환)"""
+    
+    protocol_version = 'HTTP/1.1'  # 연결 유지 (요청마다 연결을 새로 맺지 않도록)
+    
+    def do_GET(self):
+        if urlparse(self.path).path == '/metrics':
+            self._send_json(200, self.server.render_service.metrics())
+        else:
+            self._send_json(404, {'error': f'알 수 없는 경로: {self.path}'})
+    
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != '/render':
+            self._drain_body()
+            self._send_json(404, {'error': f'알 수 없는 경로: {self.path}'})
+            return
+        try:
+            body = self._read_body()
+            if self.headers.get('Content-Type', '').startswith('application/json'):
+                self._send_json(200, self._render_shared(json.loads(body)))
+            else:
+                params = parse_qs(url.query)
+                self._render_encoded(body, params.get('format', ['.png'])[0])
+        except _RequestError as e:
+            self._send_json(e.status, dict({'error': str(e)}, **e.extra))
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            self._send_json(400, {'error': f'잘못된 요청: {e}'})
+        except FileNotFoundError as e:
+            self._send_json(404, {'error': f'공유 메모리 없음: {e}'})
+        except Exception as e:
+            self._send_json(500, {'error': f'렌더 오류: {e}'})
+    
+    def _render_shared(self, spec):
+        """공유 메모리 요청 처리 - 입력을 복사하지 않고 바로 처리"""
+        service = self.server.render_service
+        shape = tuple(int(n) for n in spec['shape'])
+        dtype = np.dtype(spec.get('dtype', 'uint8'))
+        if dtype != np.uint8 or len(shape) not in (2, 3):
+            raise _RequestError(400, 'uint8 (h, w) 또는 (h, w, c) 이미지만 지원')
+        input_name = spec['shm']
+        output_name = spec.get('output_shm') or input_name
+        
+        shm_in = attach_shared_memory(input_name)
+        shm_out = None
+        image = result = None
+        try:
+            if shm_in.size < math.prod(shape) * dtype.itemsize:
+                raise _RequestError(400, '공유 메모리가 shape보다 작음')
+            image = np.ndarray(shape, dtype, buffer=shm_in.buf)
+            start = time.perf_counter()
+            result = service.render(image, spec.get('recipe'))
+            seconds = time.perf_counter() - start
+            
+            shm_out = shm_in if output_name == input_name else attach_shared_memory(output_name)
+            if result.nbytes > shm_out.size:
+                raise _RequestError(413, '결과가 출력 공유 메모리보다 큼', shape=list(result.shape))
+            if result is not image:
+                np.copyto(np.ndarray(result.shape, result.dtype, buffer=shm_out.buf), result)
+            return {'shm': output_name, 'shape': list(result.shape),
+                    'dtype': result.dtype.str, 'seconds': seconds}
+        finally:
+            if result is not None:
+                service.release(result)
+            # 공유 메모리를 가리키는 배열을 모두 놓아야 close() 가능
+            del image, result
+            if shm_out is not None and shm_out is not shm_in:
+                shm_out.close()
+            shm_in.close()
+    
+    def _render_encoded(self, body, fmt):
+        """인코딩된 이미지 요청 처리 - 디코드, 처리, 인코드하여 응답"""
+        service = self.server.render_service
+        recipe = json.loads(self.headers.get('X-Recipe') or '{}')
+        image = cv2.imdecode(np.frombuffer(body, np.uint8), cv2.IMREAD_COLOR)
+        if image is None:
+            raise _RequestError(400, '이미지 디코드 실패')
+        result = service.render(image, recipe)
+        try:
+            ok, encoded = cv2.imencode(fmt, result)
+        finally:
+            service.release(result)
+        if not ok:
+            raise _RequestError(400, f'인코드 실패: {fmt}')
+        self._send(200, encoded.tobytes(), f"image/{fmt.lstrip('.').replace('jpg', 'jpeg')}")
+    
+    def _read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length)
+    
+    def _drain_body(self):
+        """처리하지 않는 요청 본문 읽어 버리기 (연결 유지를 위해)"""
+        self._read_body()
+    
+    def _send_json(self, status, payload):
+        self._send(status, json.dumps(payload, ensure_ascii=False).encode('utf-8'),
+                   'application/json; charset=utf-8')
+    
+    def _send(self, status, data, content_type):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def log_message(self, format, *args):
+        if getattr(self.server, 'verbose', False):
+            super().log_message(format, *args)
+    
+    def address_string(self):
+        # Unix 도메인 소켓에는 클라이언트 주소가 없음
+        return self.client_address[0] if self.client_address else 'unix'
+
+
+if hasattr(socket, 'AF_UNIX'):
+    class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        """Unix 도메인 소켓 HTTP 서버 (POSIX 전용)"""
+        
+        daemon_threads = True
+        
+        def server_bind(self):
+            # 이전 실행이 남긴 소켓 파일 제거
+            if os.path.exists(self.server_address):
+                os.unlink(self.server_address)
+            super().server_bind()
+        
+        def server_close(self):
+            super().server_close()
+            if os.path.exists(self.server_address):
+                os.unlink(self.server_address)
+else:
+    UnixHTTPServer = None
+
+
+def create_server(service: RenderService, host: str = '127.0.0.1', port: int = DEFAULT_PORT,
+                  unix_socket: str = None, verbose: bool = False):
+    """렌더 서비스 HTTP 서버 생성 (serve_forever()로 실행)
+    
+    Args:
+        service: 요청을 처리할 RenderService
+        host, port: TCP 주소 (기본값은 localhost만 허용, port=0이면 빈 포트 자동 선택)
+        unix_socket: 지정하면 TCP 대신 이 경로의 Unix 도메인 소켓 사용 (POSIX 전용)
+        verbose: 요청마다 로그 출력
+    """
+    if unix_socket:
+        if UnixHTTPServer is None:
+            raise OSError('이 플랫폼은 Unix 도메인 소켓을 지원하지 않음')
+        server = UnixHTTPServer(unix_socket, RenderRequestHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), RenderRequestHandler)
+        server.daemon_threads = True
+    server.render_service = service
+    server.verbose = verbose
+    return server
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """Unix 도메인 소켓으로 연결하는 HTTPConnection"""
+    
+    def __init__(self, path, timeout):
+        super().__init__('localhost', timeout=timeout)
+        self._path = path
+    
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self._path)
+
+
+class RenderClient:
+    """렌더 서비스 클라이언트 (단일 책임: 요청 전송, 공유 메모리 관리)
+    
+    render()는 이미지를 공유 메모리에 한 번 쓰고 서비스가 그 자리에서 읽고 결과를 씁니다.
+    공유 메모리는 클라이언트가 만들고 재사용하며 close()에서 해제합니다.
+    스레드마다 클라이언트를 따로 만들어 사용하세요.
+    """
+    
+    def __init__(self, host: str = '127.0.0.1', port: int = DEFAULT_PORT,
+                 unix_socket: str = None, timeout: float = 60.0):
+        if unix_socket:
+            self._connection = _UnixHTTPConnection(unix_socket, timeout)
+        else:
+            self._connection = http.client.HTTPConnection(host, port, timeout=timeout)
+        self._shm = None
+    
+    def render(self, image, recipe=None):
+        """공유 메모리로 이미지를 보내 처리 결과 반환 (새 배열)"""
+        # 결과 크기를 미리 계산하여 입력과 결과 모두 들어가는 공유 메모리 사용
+        stages = pipeline.build_stages_from_recipe(recipe or {})
+        output_shape = pipeline.output_shape(stages, image.shape)
+        for _ in range(2):
+            shm = self._shared_memory(max(image.nbytes, math.prod(output_shape) * image.itemsize))
+            np.copyto(np.ndarray(image.shape, image.dtype, buffer=shm.buf), image)
+            status, reply = self._request_json('/render', {
+                'shm': shm.name, 'shape': list(image.shape), 'dtype': image.dtype.str,
+                'recipe': recipe or {},
+            })
+            if status != 413:
+                break
+            output_shape = tuple(reply['shape'])  # 예상보다 큰 결과 - 크기를 늘려 다시 요청
+        if status != 200:
+            raise RuntimeError(f"렌더 실패 ({status}): {reply.get('error')}")
+        result = np.ndarray(tuple(reply['shape']), np.dtype(reply['dtype']), buffer=shm.buf)
+        return result.copy()
+    
+    def render_encoded(self, data: bytes, recipe=None, fmt: str = '.png') -> bytes:
+        """인코딩된 이미지(파일 내용)를 보내 인코딩된 결과 반환"""
+        self._connection.request('POST', f'/render?format={fmt}', body=data, headers={
+            'Content-Type': 'application/octet-stream',
+            'X-Recipe': json.dumps(recipe or {}),
+        })
+        response = self._connection.getresponse()
+        body = response.read()
+        if response.status != 200:
+            raise RuntimeError(f"렌더 실패 ({response.status}): {body.decode('utf-8', 'replace')}")
+        return body
+    
+    def metrics(self) -> dict:
+        """서비스 지표"""
+        self._connection.request('GET', '/metrics')
+        response = self._connection.getresponse()
+        return json.loads(response.read())
+    
+    def close(self):
+        """연결 종료, 공유 메모리 해제"""
+        self._connection.close()
+        self._release_shared_memory()
+    
+    def _shared_memory(self, size):
+        """size 이상의 공유 메모리 (작으면 새로 만듦)"""
+        if self._shm is None or self._shm.size < size:
+            self._release_shared_memory()
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+            _created_shared_memory.add(self._shm.name)
+        return self._shm
+    
+    def _release_shared_memory(self):
+        if self._shm is not None:
+            _created_shared_memory.discard(self._shm.name)
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+    
+    def _request_json(self, path, payload):
+        self._connection.request('POST', path, body=json.dumps(payload).encode('utf-8'),
+                                 headers={'Content-Type': 'application/json'})
+        response = self._connection.getresponse()
+        return response.status, json.loads(response.read())
+
+
+def main(argv=None):
+    """명령줄 실행"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='로컬 렌더 서비스')
+    parser.add_argument('--host', default='127.0.0.1', help='TCP 주소 (기본값: localhost만)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--unix', help='Unix 도메인 소켓 경로 (지정하면 TCP 대신 사용)')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--max-batch', type=int, default=8)
+    parser.add_argument('--verbose', action='store_true', help='요청 로그 출력')
+    args = parser.parse_args(argv)
+    
+    service = RenderService(workers=args.workers, max_batch=args.max_batch)
+    try:
+        server = create_server(service, args.host, args.port, args.unix, args.verbose)
+    except OSError as e:
+        print(f"서버 시작 실패: {e}")
+        service.close()
+        return 1
+    address = args.unix or f"http://{args.host}:{server.server_address[1]}"
+    print(f"렌더 서비스 실행 중: {address} (워커 {service.workers}, 배치 최대 {service.max_batch})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
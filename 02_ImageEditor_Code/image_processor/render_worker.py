@@ -0,0 +1,591 @@
+"""
+렌더 워커 (Render Worker) 모듈
+처리 파이프라인을 별도 프로세스에서 실행하여 GUI 스레드가 이미지 연산을 하지 않도록 함
+
+원본과 결과 이미지는 GUI 프로세스가 만든 공유 메모리(multiprocessing.shared_memory)에 있고,
+프로세스 사이에는 설정 dict와 결과 정보(shape, 히스토그램, 단계별 시간)만 오갑니다.
+워커는 시작 시 미리 실행해 두며(cv2 import, 작은 이미지로 한 번 처리),
+비정상 종료되면 자동으로 다시 실행하고 처리 중이던 요청을 다시 보냅니다.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .buffer_pool import REFILL_BYTES_PER_SECOND
+
+# 결과 뒤에 붙이는 화면 배율 이미지의 정렬 단위 (바이트)
+_ALIGN = 64
+
+
+def _aligned(nbytes):
+    return (nbytes + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+class SharedSlot:
+    """공유 메모리 슬롯 (단일 책임: GUI 프로세스가 소유한 공유 메모리의 생성/확장/해제)
+    
+    배열 view가 남아 있어 닫지 못한 공유 메모리는 이름만 삭제(unlink)해 두고
+    view가 없어진 뒤 다음 확장 때 닫습니다.
+    """
+    
+    def __init__(self, headroom: float = 1.1):
+        self.headroom = headroom
+        self.shm = None
+        self._retired = []
+    
+    @property
+    def name(self):
+        return self.shm.name if self.shm is not None else None
+    
+    @property
+    def size(self):
+        return self.shm.size if self.shm is not None else 0
+    
+    @property
+    def nbytes(self):
+        """보관 중인 공유 메모리 바이트 수 (닫지 못한 이전 공유 메모리 포함)"""
+        return self.size + sum(shm.size for shm in self._retired)
+    
+    def ensure(self, nbytes):
+        """nbytes 이상 확보 - 새로 만들었으면 이전 공유 메모리 이름 반환 (없으면 None)"""
+        if self.shm is not None and self.shm.size >= nbytes:
+            return None
+        old_name = self.close()
+        self.shm = shared_memory.SharedMemory(create=True, size=max(int(nbytes * self.headroom), _ALIGN))
+        return old_name
+    
+    def view(self, shape, dtype, offset=0):
+        """공유 메모리의 배열 view"""
+        return np.ndarray(shape, dtype, buffer=self.shm.buf, offset=offset)
+    
+    def close(self):
+        """공유 메모리 해제 - 해제한 이름 반환"""
+        for shm in list(self._retired):
+            try:
+                shm.close()
+                self._retired.remove(shm)
+            except BufferError:
+                pass
+        if self.shm is None:
+            return None
+        shm, self.shm = self.shm, None
+        try:
+            shm.close()
+        except BufferError:
+            self._retired.append(shm)  # 아직 view가 남아 있음
+        shm.unlink()
+        return shm.name
+
+
+class RenderResult:
+    """렌더 결과 (단일 책임: 공유 메모리 결과 view와 결과 정보 보관)
+    
+    image와 display는 출력 슬롯의 view이므로 RenderWorker.release()로 슬롯을 돌려준 뒤에는
+    사용하지 않아야 합니다.
+    ROI 요청('roi')의 image는 ROI 부분만 처리한 결과이고, roi는 그 위치 (x, y, w, h)입니다.
+    """
+    
+    __slots__ = ('seq', 'purpose', 'slot', 'image', 'display', 'display_scale',
+                 'histograms', 'frame', 'events', 'trace_origin_ns', 'seconds', 'history', 'roi')
+    
+    def __init__(self, seq, purpose, slot, image, display, display_scale,
+                 histograms, frame, events, trace_origin_ns, seconds, history, roi=None):
+        self.seq = seq
+        self.purpose = purpose
+        self.slot = slot
+        self.image = image
+        self.display = display
+        self.display_scale = display_scale
+        self.histograms = histograms
+        self.frame = frame           # 워커가 기록한 (이름, ms) 목록 (추적 비활성화면 빈 목록)
+        self.events = events         # 워커의 추적 이벤트
+        self.trace_origin_ns = trace_origin_ns
+        self.seconds = seconds
+        self.history = history
+        self.roi = roi
+
+
+def _worker_stages(params, shape, source=None):
+    """요청 설정으로 워커가 실행할 단계 목록
+    source: 원본 세대 번호 (CLAHE 타일 히스토그램 캐시 키, 선택)
+    """
+    from . import pipeline
+    stages = pipeline.build_stages(params['button_states'], params['trackbar_values'], source)
+    if params.get('head'):
+        # 기하 변환 미리보기: 끝부분의 회전/크기 조절 직전까지
+        stages, _ = pipeline.split_geometric_tail(stages)
+    elif params.get('proxy'):
+        # 드래그 중 미리보기: 화면 크기로 먼저 줄여 처리
+        stages, _ = pipeline.plan_proxy(stages, shape, params['proxy'])
+    elif params.get('fast_preview'):
+        stages = pipeline.plan_fast_preview(stages, shape)
+    return stages
+
+
+def _display_size(shape, display_size):
+    """화면 배율 이미지 크기 ((w, h), 배율) - 줄일 필요가 없으면 (None, 1.0)
+    
+    ImageDisplayWidget._calculate_scale()과 같은 식으로 계산합니다.
+    """
+    if not display_size:
+        return None, 1.0
+    h, w = shape[:2]
+    scale = min(display_size[0] / w, display_size[1] / h, 1.0)
+    if scale >= 1.0:
+        return None, 1.0
+    return (int(w * scale), int(h * scale)), scale
+
+
+def output_nbytes(params, shape, dtype):
+    """요청 결과(처리 결과 + 화면 배율 이미지)에 필요한 출력 공유 메모리 크기"""
+    from . import pipeline
+    out_shape = pipeline.output_shape(_worker_stages(params, shape), shape)
+    if params.get('roi'):
+        # ROI 부분만 보냄 (이미지 안으로 자르기 전 크기이므로 넉넉함)
+        _, _, w, h = params['roi']
+        return _aligned(w * h * int(np.prod(out_shape[2:])) * np.dtype(dtype).itemsize)
+    nbytes = _aligned(int(np.prod(out_shape)) * np.dtype(dtype).itemsize)
+    size, _ = _display_size(out_shape, params.get('display_size'))
+    if size is not None:
+        channels = out_shape[2] if len(out_shape) == 3 else 1
+        nbytes += size[0] * size[1] * channels
+    return nbytes
+
+
+def _warm_up():
+    """작은 이미지로 한 번 처리하여 OpenCV 초기화 비용을 미리 치름"""
+    from . import pipeline, pixel_processing
+    image = np.zeros((64, 64, 3), dtype=np.uint8)
+    stages = pipeline.build_stages_from_recipe({'trackbar_values': {
+        'brightness': 120, 'contrast': 110, 'blur': 2, 'rotation': 10, 'resize_w': 50}})
+    pixel_processing.calc_histograms(pipeline.run_stages(image, stages))
+
+
+def _render(message, segments, pool):
+    """워커 - 요청 1개 처리 후 응답 dict 반환"""
+    from . import geometric_processing, pipeline, pixel_processing
+    from .conversion_cache import ConversionCache
+    from .tracing import tracer
+    
+    def attach(name):
+        shm = segments.get(name)
+        if shm is None:
+            # GUI 프로세스와 같은 resource_tracker를 쓰므로 등록 해제하지 않음
+            shm = segments[name] = shared_memory.SharedMemory(name=name)
+        return shm
+    
+    params = message['params']
+    source_name, shape, dtype = message['source']
+    output_name, output_size = message['output']
+    start = time.perf_counter()
+    tracer.set_enabled(params.get('trace', False))
+    tracer.begin_frame()
+    with tracer.span('apply_all_effects', 'frame'):
+        image = np.ndarray(shape, dtype, buffer=attach(source_name).buf)
+        cache = ConversionCache()
+        stages = _worker_stages(params, shape, message['generation'])
+        roi = None
+        if params.get('roi'):
+            # ROI 편집: ROI(+주변 halo)만 처리하고 ROI 부분만 보냄
+            processed = pipeline.process_roi(image, stages, params['roi'], cache)
+            if processed is None:
+                return {'seq': message['seq'],
+                        'error': 'ROI만 처리할 수 없는 설정이거나 ROI가 이미지 밖에 있습니다'}
+            result, roi = processed
+        else:
+            result = pipeline.run_stages(image, stages, cache, pool)
+        size, scale = _display_size(result.shape, params.get('display_size'))
+        offset = _aligned(result.nbytes)
+        needed = offset + (size[0] * size[1] * (result.nbytes // (result.shape[0] * result.shape[1]))
+                           if size is not None else 0)
+        if needed > output_size:
+            pool.release(result)
+            return {'seq': message['seq'], 'resize': needed}
+        output = attach(output_name)
+        with tracer.span('result_copy'):
+            np.copyto(np.ndarray(result.shape, result.dtype, buffer=output.buf), result)
+        display_shape = None
+        if size is not None:
+            with tracer.span('display_resize', 'display'):
+                display_shape = (size[1], size[0]) + result.shape[2:]
+                geometric_processing.apply_resize(
+                    result, size[0], size[1],
+                    dst=np.ndarray(display_shape, np.uint8, buffer=output.buf, offset=offset))
+        histograms = None
+        if params.get('histograms', True):
+            with tracer.span('histogram', 'display'):
+                histograms = pixel_processing.calc_histograms(result)
+        reply = {
+            'seq': message['seq'],
+            'shape': result.shape,
+            'dtype': result.dtype.str,
+            'display_shape': display_shape,
+            'display_offset': offset,
+            'display_scale': scale,
+            'histograms': histograms,
+            'roi': roi,
+        }
+        pool.release(result)
+    tracer.end_frame()
+    reply['frame'] = tracer.last_frame if tracer.enabled else []
+    # 이 프레임의 추적 이벤트는 GUI 프로세스의 추적기로 넘김
+    reply['events'] = list(tracer.events)
+    reply['trace_origin_ns'] = tracer.origin_ns
+    tracer.events.clear()
+    reply['seconds'] = time.perf_counter() - start
+    return reply
+
+
+def _worker_main(conn):
+    """렌더 워커 프로세스 진입점 - 요청을 받아 처리하고 결과 정보를 보냄"""
+    from .buffer_pool import BufferPool
+    
+    _warm_up()
+    conn.send({'op': 'ready', 'pid': os.getpid()})
+    segments = {}  # 공유 메모리 이름 -> 연결된 SharedMemory
+    pool = BufferPool()
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break  # GUI 프로세스 종료
+        if message['op'] == 'stop':
+            break
+        for name in message.get('forget', ()):
+            # GUI가 확장하거나 해제한 공유 메모리 연결 끊기
+            shm = segments.pop(name, None)
+            if shm is not None:
+                try:
+                    shm.close()
+                except BufferError:
+                    pass  # 남은 view는 프로세스 종료 시 해제
+        if message['op'] == 'render':
+            try:
+                reply = _render(message, segments, pool)
+            except Exception as e:
+                reply = {'seq': message['seq'], 'error': f"{type(e).__name__}: {e}"}
+            conn.send(reply)
+    for shm in segments.values():
+        shm.close()
+
+
+class RenderWorker:
+    """렌더 워커 관리자 (단일 책임: 워커 프로세스 실행/재시작, 공유 메모리 슬롯, 요청 병합)
+    
+    - 원본 슬롯 2개: 새 원본은 처리 중인 요청이 읽지 않는 슬롯에 씁니다.
+    - 출력 슬롯 2개: 워커는 GUI가 돌려준(release) 슬롯에만 씁니다. GUI가 표시 중인 결과는
+      다음 결과를 받아 바꿀 때까지 그대로 유지됩니다.
+    - 요청은 한 번에 1개만 처리하고, 처리 중에 들어온 요청은 종류별로 가장 최근 것만 남깁니다
+      (슬라이더 드래그 중 밀린 중간 값은 건너뜀).
+    
+    on_result(RenderResult)와 on_failed(메시지)는 수신 스레드에서 호출되므로
+    GUI에서는 Qt 시그널 등으로 GUI 스레드에 넘겨 처리해야 합니다.
+    """
+    
+    # RESTART_WINDOW초 안에 MAX_RESTARTS번 비정상 종료하면 재시작을 포기
+    MAX_RESTARTS = 3
+    RESTART_WINDOW = 30.0
+    
+    def __init__(self, on_result, on_failed=None):
+        self.on_result = on_result
+        self.on_failed = on_failed
+        self.ready = False       # 워커 준비(미리 실행) 완료 여부
+        self.restarts = 0
+        self._context = multiprocessing.get_context('spawn')  # Qt 프로세스는 fork하지 않음
+        self._lock = threading.Lock()
+        self._process = None
+        self._conn = None
+        self._closed = False
+        self._restart_times = deque(maxlen=self.MAX_RESTARTS)
+        self._sources = [SharedSlot(headroom=1.0), SharedSlot(headroom=1.0)]
+        self._outputs = [SharedSlot(), SharedSlot()]
+        self._export = SharedSlot()
+        self._free_outputs = [0, 1]
+        self._source = None      # (원본 슬롯 번호, shape, dtype)
+        self._generation = 0     # 원본이 바뀔 때마다 증가 (이전 원본의 결과는 버림)
+        self._seq = 0
+        self._pending = {}       # 종류 -> 아직 보내지 않은 가장 최근 요청
+        self._in_flight = None   # (요청, 출력 슬롯 번호, 원본 슬롯 번호)
+        self._forget = []        # 워커가 연결을 끊어야 할 공유 메모리 이름
+        self._waiters = {}       # 내보내기 요청 번호 -> (Event, 응답 보관 dict)
+        self._export_used = 0.0  # 저장 전용 슬롯을 마지막으로 사용한 시각
+    
+    def start(self):
+        """워커 프로세스 실행 (준비되면 ready가 True가 됨)"""
+        self._spawn()
+    
+    def is_alive(self):
+        return self._process is not None and self._process.is_alive()
+    
+    def set_source(self, image):
+        """원본 이미지를 공유 메모리에 복사하고 그 view 반환 (이후 요청의 원본)"""
+        with self._lock:
+            index = 1 - self._source[0] if self._source is not None else 0
+            slot = self._sources[index]
+            if self._in_flight is not None and self._in_flight[2] == index:
+                # 처리 중인 요청이 이 슬롯을 읽는 중 - 새 공유 메모리로 교체 (이전 것은 워커가 다 쓸 때까지 유지)
+                self._forget_name(slot.close())
+            self._forget_name(slot.ensure(image.nbytes))
+            view = slot.view(image.shape, image.dtype)
+            np.copyto(view, image)
+            self._source = (index, image.shape, image.dtype.str)
+            self._generation += 1
+            self._pending.clear()
+        return view
+    
+    def request(self, params, purpose='render', history=True):
+        """처리 요청 (결과는 on_result로 전달) - 요청 번호 반환, 원본이 없으면 None
+        
+        Args:
+            params: {'button_states', 'trackbar_values', 'fast_preview', 'head', 'proxy', 'roi', 'trace',
+                     'display_size', 'histograms'}
+            purpose: 요청 종류 ('render', 'preview', 'proxy', 'roi') - 종류별로 가장 최근 요청만 처리
+            history: 결과를 히스토리에 추가할지 여부 (RenderResult.history로 전달)
+        """
+        with self._lock:
+            if self._source is None or self._closed:
+                return None
+            self._seq += 1
+            self._pending[purpose] = {'seq': self._seq, 'purpose': purpose, 'history': history,
+                                      'params': params, 'generation': self._generation}
+            self._dispatch_locked()
+            return self._seq
+    
+    def render_sync(self, params, timeout: float = 120.0, cancel=None):
+        """처리가 끝날 때까지 기다려 결과 복사본 반환 (저장용), 실패하거나 취소하면 None
+        
+        큰 이미지는 오래 걸리므로 GUI 스레드가 아닌 백그라운드 스레드에서 호출합니다.
+        cancel: threading.Event (선택) - 설정되면 기다리기를 멈추고, 아직 보내지 않은 요청은 취소
+        """
+        event = threading.Event()
+        holder = {}
+        with self._lock:
+            if self._source is None or self._closed:
+                return None
+            self._seq += 1
+            seq = self._seq
+            self._waiters[seq] = (event, holder)
+            self._pending['export'] = {'seq': seq, 'purpose': 'export', 'history': False,
+                                       'params': dict(params, display_size=None, histograms=False),
+                                       'generation': self._generation}
+            self._dispatch_locked()
+        deadline = time.monotonic() + timeout
+        while not event.wait(0.05):
+            if (cancel is not None and cancel.is_set()) or time.monotonic() >= deadline:
+                break
+        with self._lock:
+            self._waiters.pop(seq, None)
+            pending = self._pending.get('export')
+            if pending is not None and pending['seq'] == seq:
+                del self._pending['export']  # 처리 중인 요청은 끝나면 결과를 버림
+            reply = holder.get('reply')
+            if reply is None or (cancel is not None and cancel.is_set()):
+                return None
+            if 'error' in reply or 'shape' not in reply:
+                print(f"렌더 워커 저장 처리 실패: {reply.get('error', '결과 없음')}")
+                return None
+            return self._export.view(reply['shape'], reply['dtype']).copy()
+    
+    def release(self, result):
+        """결과의 출력 슬롯 돌려주기 (GUI가 더 이상 그 결과를 표시/참조하지 않을 때)"""
+        with self._lock:
+            if result.slot is not None and result.slot not in self._free_outputs:
+                self._free_outputs.append(result.slot)
+            self._dispatch_locked()
+    
+    def memory_usage(self) -> int:
+        """공유 메모리 슬롯의 총 바이트 수 (메모리 예산 보고용)"""
+        with self._lock:
+            return sum(slot.nbytes for slot in self._sources + self._outputs + [self._export])
+    
+    def memory_candidates(self):
+        """제거할 수 있는 슬롯 - 처리 중이 아닌 저장 전용 슬롯 (원본/표시 슬롯은 사용 중)"""
+        with self._lock:
+            if self._export.shm is None or self._export_in_use_locked():
+                return []
+            return [('export', self._export.size, self._export_used,
+                     self._export.size / REFILL_BYTES_PER_SECOND)]
+    
+    def evict_memory(self, key) -> int:
+        """저장 전용 슬롯 해제 (다음 저장 때 다시 만듦)"""
+        with self._lock:
+            if key != 'export' or self._export.shm is None or self._export_in_use_locked():
+                return 0
+            size = self._export.size
+            self._forget_name(self._export.close())
+            return size
+    
+    def _export_in_use_locked(self):
+        return ((self._in_flight is not None and self._in_flight[1] is None)
+                or 'export' in self._pending or bool(self._waiters))
+    
+    def stop(self):
+        """워커 종료, 공유 메모리 해제"""
+        with self._lock:
+            self._closed = True
+            conn, process = self._conn, self._process
+            self._conn = None
+            self._pending.clear()
+        if conn is not None:
+            try:
+                conn.send({'op': 'stop'})
+            except OSError:
+                pass
+        if process is not None:
+            process.join(timeout=2.0)
+            if process.is_alive():
+                process.terminate()
+        self._wake_waiters()
+        for slot in self._sources + self._outputs + [self._export]:
+            slot.close()
+    
+    def _spawn(self):
+        """워커 프로세스와 수신 스레드 시작"""
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(target=_worker_main, args=(child_conn,),
+                                        name='render-worker', daemon=True)
+        process.start()
+        child_conn.close()
+        with self._lock:
+            self.ready = False
+            self._process, self._conn = process, parent_conn
+            self._dispatch_locked()
+        listener = threading.Thread(target=self._listen, args=(process, parent_conn),
+                                    name='render-worker-listen', daemon=True)
+        listener.start()
+    
+    def _forget_name(self, name):
+        if name is not None:
+            self._forget.append(name)
+    
+    def _dispatch_locked(self):
+        """처리 중인 요청이 없으면 가장 오래된 대기 요청 전송 (잠금 안에서 호출)"""
+        if self._in_flight is not None or self._conn is None or self._source is None:
+            return
+        for base in sorted(self._pending.values(), key=lambda r: r['seq']):
+            if base['purpose'] == 'export':
+                slot_index, slot = None, self._export
+                self._export_used = time.monotonic()
+            elif self._free_outputs:
+                slot_index = self._free_outputs[0]
+                slot = self._outputs[slot_index]
+            else:
+                continue  # GUI가 이전 결과를 돌려줄 때까지 대기
+            del self._pending[base['purpose']]
+            if slot_index is not None:
+                self._free_outputs.remove(slot_index)
+            source_index, shape, dtype = self._source
+            self._forget_name(slot.ensure(output_nbytes(base['params'], shape, dtype)))
+            self._in_flight = (base, slot_index, source_index)
+            self._send_locked(dict(base, op='render',
+                                   source=(self._sources[source_index].name, shape, dtype),
+                                   output=(slot.name, slot.size)))
+            return
+    
+    def _send_locked(self, message):
+        message['forget'], self._forget = self._forget, []
+        try:
+            self._conn.send(message)
+        except OSError:
+            pass  # 워커 종료 - 수신 스레드가 재시작 처리
+    
+    def _listen(self, process, conn):
+        """수신 스레드 - 워커 응답 처리, 워커가 종료되면 재시작"""
+        while True:
+            try:
+                reply = conn.recv()
+            except (EOFError, OSError):
+                break
+            if reply.get('op') == 'ready':
+                self.ready = True
+                continue
+            self._on_reply(reply)
+        conn.close()
+        process.join(timeout=1.0)
+        if not self._closed and process is self._process:
+            self._on_crash(process.exitcode)
+    
+    def _on_reply(self, reply):
+        """워커 응답 처리 (수신 스레드)"""
+        result = None
+        with self._lock:
+            if self._in_flight is None or self._in_flight[0]['seq'] != reply['seq']:
+                return
+            base, slot_index, source_index = self._in_flight
+            slot = self._export if slot_index is None else self._outputs[slot_index]
+            if 'resize' in reply and base['generation'] == self._generation:
+                # 예상보다 큰 결과 - 출력 슬롯을 늘려 다시 요청
+                self._forget_name(slot.ensure(reply['resize']))
+                _, shape, dtype = self._source
+                self._send_locked(dict(base, op='render',
+                                       source=(self._sources[source_index].name, shape, dtype),
+                                       output=(slot.name, slot.size)))
+                return
+            self._in_flight = None
+            if base['purpose'] == 'export':
+                if 'resize' in reply:
+                    # 처리 중에 원본이 바뀜 - 요청한 원본이 공유 메모리에 남아 있지 않을 수 있으므로 다시 보내지 않음
+                    reply = {'seq': reply['seq'], 'error': '저장 중에 원본이 바뀌어 결과를 만들지 못했습니다'}
+                waiter = self._waiters.get(base['seq'])
+                if waiter is not None:
+                    waiter[1]['reply'] = reply
+                    waiter[0].set()
+            elif 'error' in reply or base['generation'] != self._generation:
+                if 'error' in reply:
+                    print(f"렌더 워커 처리 오류: {reply['error']}")
+                self._free_outputs.append(slot_index)  # 결과 없음 또는 이전 원본의 결과
+            else:
+                image = slot.view(reply['shape'], reply['dtype'])
+                display = None
+                if reply['display_shape'] is not None:
+                    display = slot.view(reply['display_shape'], np.uint8, reply['display_offset'])
+                result = RenderResult(base['seq'], base['purpose'], slot_index, image, display,
+                                      reply['display_scale'], reply['histograms'], reply['frame'],
+                                      reply['events'], reply['trace_origin_ns'],
+                                      reply['seconds'], base['history'], reply['roi'])
+            self._dispatch_locked()
+        if result is not None:
+            self.on_result(result)
+    
+    def _on_crash(self, exitcode):
+        """워커 비정상 종료 - 다시 실행하고 처리 중이던 요청을 다시 보냄"""
+        print(f"렌더 워커 종료됨 (exit code {exitcode}) - 다시 시작합니다")
+        now = time.monotonic()
+        with self._lock:
+            self._conn = None
+            self._restart_times.append(now)
+            give_up = (len(self._restart_times) == self.MAX_RESTARTS
+                       and now - self._restart_times[0] < self.RESTART_WINDOW)
+            if self._in_flight is not None:
+                base, slot_index, _ = self._in_flight
+                self._in_flight = None
+                if slot_index is not None:
+                    self._free_outputs.append(slot_index)
+                pending = self._pending.get(base['purpose'])
+                if pending is None or pending['seq'] < base['seq']:
+                    self._pending[base['purpose']] = base
+            # 워커가 연결했던 공유 메모리는 새 워커가 다시 연결
+            self._forget = []
+            if give_up:
+                self._closed = True
+        if give_up:
+            self._wake_waiters()
+            if self.on_failed is not None:
+                self.on_failed(f"렌더 워커가 {self.RESTART_WINDOW:.0f}초 안에 "
+                               f"{self.MAX_RESTARTS}번 종료되어 재시작을 중단했습니다")
+            return
+        self.restarts += 1
+        self._spawn()
+    
+    def _wake_waiters(self):
+        """기다리는 내보내기 요청 깨우기 (결과 없음)"""
+        with self._lock:
+            waiters = list(self._waiters.values())
+        for event, _ in waiters:
+            event.set()
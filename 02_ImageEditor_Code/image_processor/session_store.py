@@ -0,0 +1,106 @@
+"""
+세션 저장 모듈
+종료할 때 마지막 작업 상태(선택한 파일, 처리 설정, 화면 해상도 미리보기)를 저장하고
+다음 실행 시 전체 해상도 이미지를 읽기 전에 이전 화면을 바로 보여줄 수 있도록 복원
+"""
+
+import json
+import os
+
+import cv2
+
+from .geometric_processing import apply_resize
+from .tracing import tracer
+
+
+class SessionStore:
+    """세션 저장소 (단일 책임: 마지막 세션 저장/복원)
+
+    session_dir 아래에 설정(session.json)과 미리보기(session_preview.png)를 저장합니다.
+    미리보기는 원본 파일의 수정 시각과 크기가 저장 당시와 같을 때만 복원합니다.
+    """
+
+    STATE_FILE = 'session.json'
+    PREVIEW_FILE = 'session_preview.png'
+
+    def __init__(self, session_dir):
+        self.session_dir = session_dir
+
+    @property
+    def state_path(self):
+        return os.path.join(self.session_dir, self.STATE_FILE)
+
+    @property
+    def preview_path(self):
+        return os.path.join(self.session_dir, self.PREVIEW_FILE)
+
+    @staticmethod
+    def _file_signature(file_path):
+        """파일 변경 확인용 (수정 시각, 크기)"""
+        stat = os.stat(file_path)
+        return [stat.st_mtime, stat.st_size]
+
+    def save(self, file_path, button_states, trackbar_values, image, max_size=None):
+        """세션 저장
+
+        Args:
+            file_path: 선택한 이미지 파일 경로
+            button_states: 버튼 상태 딕셔너리
+            trackbar_values: 슬라이더 값 딕셔너리
+            image: 현재 화면에 표시 중인 처리 결과 (BGR 또는 그레이스케일)
+            max_size: 미리보기 최대 크기 (w, h), 보통 이미지 표시 영역 크기
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        try:
+            os.makedirs(self.session_dir, exist_ok=True)
+            h, w = image.shape[:2]
+            state = {
+                'file_path': file_path,
+                'file_signature': self._file_signature(file_path) if file_path and os.path.exists(file_path) else None,
+                'button_states': dict(button_states),
+                'trackbar_values': dict(trackbar_values),
+                'image_size': [w, h],
+            }
+            with tracer.span('session_save', 'io'):
+                preview = image
+                if max_size is not None:
+                    scale = min(max_size[0] / w, max_size[1] / h, 1.0)
+                    if scale < 1.0:
+                        preview = apply_resize(image, max(1, int(w * scale)), max(1, int(h * scale)))
+                # 빠른 압축 (종료 시간 최소화)
+                if not cv2.imwrite(self.preview_path, preview, [cv2.IMWRITE_PNG_COMPRESSION, 1]):
+                    print(f"세션 미리보기 저장 실패: {self.preview_path}")
+                    return False
+                with open(self.state_path, 'w', encoding='utf-8') as f:
+                    json.dump(state, f, ensure_ascii=False, indent=2)
+            return True
+        except Exception as e:
+            print(f"세션 저장 오류: {e}")
+            return False
+
+    def load(self):
+        """저장된 세션 불러오기
+
+        Returns:
+            Optional[dict]: file_path, button_states, trackbar_values, image_size와
+            preview(원본 파일이 바뀌었거나 없으면 None). 세션이 없으면 None
+        """
+        if not os.path.exists(self.state_path):
+            return None
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            file_path = state.get('file_path')
+            if not file_path or not os.path.exists(file_path):
+                return None
+            state['preview'] = None
+            signature = state.get('file_signature')
+            if signature is not None and self._file_signature(file_path) == signature:
+                with tracer.span('session_preview_read', 'io'):
+                    state['preview'] = cv2.imread(self.preview_path, cv2.IMREAD_UNCHANGED)
+            return state
+        except Exception as e:
+            print(f"세션 불러오기 오류: {e}")
+            return None
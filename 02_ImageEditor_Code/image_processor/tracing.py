@@ -0,0 +1,213 @@
+"""
+추적(Tracing) 모듈
+처리 단계, 파일 입출력, 화면 변환의 소요 시간을 기록하고
+Chrome/Perfetto 트레이스 JSON으로 내보내는 기능
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from functools import wraps
+
+
+class _NullSpan:
+    """비활성 상태에서 사용하는 빈 구간 (오버헤드 최소화)"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """활성 상태에서 사용하는 측정 구간"""
+
+    __slots__ = ('tracer', 'name', 'category', 'start')
+
+    def __init__(self, tracer, name, category):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.tracer._record(self.name, self.category, self.start, time.perf_counter_ns())
+        return False
+
+
+class Tracer:
+    """구간 추적기 (단일 책임: 구간 시간 기록 및 트레이스 내보내기)
+
+    비활성 상태에서는 span()이 공유된 빈 컨텍스트를 반환하므로
+    플래그 확인 1회 외에는 비용이 들지 않습니다.
+    """
+
+    def __init__(self, max_events: int = 200000):
+        self.enabled: bool = False
+        self.events = deque(maxlen=max_events)
+        self.last_frame: list = []  # 마지막 렌더의 (이름, ms) 목록
+        self.last_durations: dict = {}  # 이름별 마지막 소요 시간 (ms)
+        self._frame = None
+        self._frame_thread = None
+        self._origin_ns = time.perf_counter_ns()
+        self._lock = threading.Lock()
+
+    def enable(self):
+        """추적 활성화"""
+        self.enabled = True
+
+    def disable(self):
+        """추적 비활성화"""
+        self.enabled = False
+        self._frame = None
+
+    def set_enabled(self, enabled: bool):
+        """추적 활성화 여부 설정"""
+        if enabled:
+            self.enable()
+        else:
+            self.disable()
+
+    def clear(self):
+        """기록된 이벤트 초기화"""
+        with self._lock:
+            self.events.clear()
+            self.last_frame = []
+            self.last_durations = {}
+
+    def span(self, name: str, category: str = 'stage'):
+        """측정 구간 컨텍스트 매니저 반환
+
+        사용 예:
+            with tracer.span('blur'):
+                img = area_processing.apply_blur(img, 5)
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category)
+
+    def traced(self, name: str = None, category: str = 'stage'):
+        """함수 전체를 측정 구간으로 감싸는 데코레이터"""
+        def decorator(func):
+            span_name = name or func.__name__
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Span(self, span_name, category):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def begin_frame(self):
+        """렌더 1회(프레임) 기록 시작"""
+        if self.enabled:
+            self._frame = []
+            self._frame_thread = threading.get_ident()
+
+    def end_frame(self):
+        """렌더 1회(프레임) 기록 종료"""
+        if self._frame is not None:
+            self.last_frame = self._frame
+            self._frame = None
+
+    def _record(self, name, category, start_ns, end_ns):
+        """이벤트 기록 (Chrome 트레이스 'X' 이벤트 형식)"""
+        duration_ms = (end_ns - start_ns) / 1e6
+        thread_id = threading.get_ident()
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': (start_ns - self._origin_ns) / 1000.0,
+            'dur': (end_ns - start_ns) / 1000.0,
+            'pid': os.getpid(),
+            'tid': thread_id,
+        }
+        with self._lock:
+            self.events.append(event)
+            self.last_durations[name] = duration_ms
+            if self._frame is not None and thread_id == self._frame_thread:
+                self._frame.append((name, duration_ms))
+
+    @property
+    def origin_ns(self) -> int:
+        """이벤트 시각(ts)의 기준 시각 (perf_counter_ns)"""
+        return self._origin_ns
+
+    def add_remote_frame(self, frame, events=(), origin_ns=None):
+        """다른 프로세스(렌더 워커)에서 기록한 프레임을 마지막 렌더로 추가
+
+        events의 시각은 origin_ns 기준이므로 이 추적기의 기준 시각으로 옮겨 저장합니다.
+        """
+        shift = (origin_ns - self._origin_ns) / 1000.0 if origin_ns is not None else 0.0
+        with self._lock:
+            for event in events:
+                event['ts'] += shift
+                self.events.append(event)
+            self.last_frame = list(frame)
+            self.last_durations.update(frame)
+
+    def format_last_frame(self, limit: int = 6) -> str:
+        """마지막 렌더의 단계별 소요 시간을 정보 바용 문자열로 반환"""
+        if not self.last_frame:
+            return ''
+        # 프레임 전체 구간은 Total로 따로 표시
+        stages = [(n, ms) for n, ms in self.last_frame if n != 'apply_all_effects']
+        total = sum(ms for n, ms in self.last_frame if n == 'apply_all_effects')
+        stages.sort(key=lambda item: item[1], reverse=True)
+        parts = [f"{n} {ms:.1f}ms" for n, ms in stages[:limit]]
+        if total:
+            parts.append(f"Total {total:.1f}ms")
+        return ' | '.join(parts)
+
+    def export_chrome_trace(self, file_path: str) -> bool:
+        """Chrome/Perfetto에서 열 수 있는 트레이스 JSON 저장
+
+        Args:
+            file_path: 저장 경로 (.json)
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        with self._lock:
+            events = list(self.events)
+
+        # 스레드 이름 메타데이터
+        thread_names = {t.ident: t.name for t in threading.enumerate()}
+        metadata = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': tid,
+             'args': {'name': thread_names.get(tid, f'thread-{tid}')}}
+            for tid in {e['tid'] for e in events}
+        ]
+
+        try:
+            directory = os.path.dirname(file_path)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump({'traceEvents': metadata + events,
+                           'displayTimeUnit': 'ms'}, f)
+            return True
+        except Exception as e:
+            print(f"트레이스 저장 오류: {e}")
+            return False
+
+
+# 애플리케이션 전역 추적기 (환경 변수 IMAGE_EDITOR_TRACE=1 로 시작 시 활성화)
+tracer = Tracer()
+if os.environ.get('IMAGE_EDITOR_TRACE') == '1':
+    tracer.enable()
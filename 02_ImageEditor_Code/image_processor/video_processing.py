@@ -0,0 +1,262 @@
+"""
+동영상 처리 (Video Processing) 모듈
+동영상, 애니메이션 GIF, 번호가 매겨진 이미지 시퀀스를 프레임 단위로 읽어
+편집기와 같은 처리 단계를 적용하는 스트리밍 파이프라인
+
+디코드 스레드 → 처리 워커들 → 순서 보장 인코드의 생산자/소비자 구조이며,
+동시에 존재하는 프레임 수가 제한되므로 클립 길이와 관계없이 메모리가 일정합니다.
+
+사용법 (02_ImageEditor_Code 폴더에서):
+    python -m image_processor.video_processing input.mp4 output.mp4 --recipe recipe.json
+    python -m image_processor.video_processing "frames/frame_%04d.png" "out/frame_%04d.png"
+"""
+
+import os
+import queue
+import re
+import threading
+import time
+
+import cv2
+
+from . import pipeline
+from .buffer_pool import BufferPool
+from .tracing import tracer
+
+# 처리 워커 종료 표시
+_END = None
+
+# 입력으로 지원하는 동영상 확장자
+VIDEO_EXTENSIONS = ['.mp4', '.avi', '.mov', '.mkv', '.webm', '.gif']
+
+
+def sequence_pattern_from_file(file_path: str) -> str:
+    """이미지 시퀀스의 파일 1개로부터 printf 형식 패턴 추정
+
+    예: 'frames/frame_0001.png' -> 'frames/frame_%04d.png'
+    숫자로 끝나지 않는 파일명은 그대로 반환합니다.
+    """
+    directory, file_name = os.path.split(file_path)
+    base_name, ext = os.path.splitext(file_name)
+    match = re.search(r'(\d+)$', base_name)
+    if not match or ext.lower() in VIDEO_EXTENSIONS:
+        return file_path
+    digits = match.group(1)
+    pattern = f"{base_name[:match.start()]}%0{len(digits)}d{ext}"
+    return os.path.join(directory, pattern)
+
+
+class VideoStreamProcessor:
+    """동영상 스트리밍 처리기 (단일 책임: 프레임 디코드 → 처리 → 순서 보장 인코드)"""
+
+    def __init__(self, stages, workers: int = None, max_in_flight: int = None,
+                 fourcc: str = 'mp4v'):
+        """
+        Args:
+            stages: pipeline.build_stages()로 만든 처리 단계 목록
+            workers: 처리 워커 스레드 수 (기본값: CPU 수, 최대 8)
+            max_in_flight: 동시에 메모리에 존재할 수 있는 최대 프레임 수
+            fourcc: 출력 동영상 코덱 (예: 'mp4v', 'XVID', 'MJPG')
+        """
+        self.stages = stages
+        self.workers = workers or min(8, os.cpu_count() or 2)
+        self.max_in_flight = max_in_flight or self.workers * 2 + 2
+        self.fourcc = fourcc
+        self.frames_total = 0
+        self.frames_done = 0
+        # 처리 결과 버퍼 재사용 (인코드 후 반환)
+        self._pool = BufferPool(max_free=self.max_in_flight * 2)
+        self._stop = threading.Event()
+        self._error = None
+
+    def cancel(self):
+        """처리 중단 요청"""
+        self._stop.set()
+
+    def process(self, input_path: str, output_path: str, fps: float = None):
+        """입력 클립을 처리하여 출력 경로에 저장
+
+        Args:
+            input_path: 동영상/GIF 경로 또는 이미지 시퀀스 패턴 (예: 'frame_%04d.png')
+            output_path: 출력 동영상 경로 또는 이미지 시퀀스 패턴
+            fps: 출력 FPS (None이면 입력 FPS, 알 수 없으면 30)
+
+        Returns:
+            Optional[dict]: 처리 통계 (frames, seconds, fps), 실패 시 None
+        """
+        capture = cv2.VideoCapture(input_path)
+        if not capture.isOpened():
+            print(f"동영상 열기 실패: {input_path}")
+            return None
+
+        input_fps = capture.get(cv2.CAP_PROP_FPS)
+        fps = fps or (input_fps if input_fps and input_fps > 0 else 30.0)
+        self.frames_total = int(capture.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+        self.frames_done = 0
+        self._stop.clear()
+        self._error = None
+
+        # 동시에 존재하는 프레임 수 제한 (디코드 시 획득, 인코드 후 반환)
+        slots = threading.Semaphore(self.max_in_flight)
+        decoded = queue.Queue(maxsize=self.max_in_flight)
+        processed = queue.Queue(maxsize=self.max_in_flight)
+
+        start = time.perf_counter()
+        threads = [threading.Thread(target=self._decode_loop, name='video-decode',
+                                    args=(capture, decoded, slots), daemon=True)]
+        threads += [threading.Thread(target=self._process_loop, name=f'video-worker-{i}',
+                                     args=(decoded, processed), daemon=True)
+                    for i in range(self.workers)]
+        for thread in threads:
+            thread.start()
+
+        written = self._encode_loop(output_path, fps, processed, slots)
+
+        for thread in threads:
+            thread.join()
+        capture.release()
+        elapsed = time.perf_counter() - start
+
+        if self._error is not None:
+            print(f"동영상 처리 오류: {self._error}")
+            return None
+        return {
+            'frames': written,
+            'seconds': elapsed,
+            'fps': written / elapsed if elapsed > 0 else 0.0,
+            'cancelled': self._stop.is_set(),
+        }
+
+    def _decode_loop(self, capture, decoded, slots):
+        """디코드 스레드 - 프레임을 읽어 처리 대기열에 넣음"""
+        index = 0
+        try:
+            while not self._stop.is_set():
+                # 대기 중에도 중단 요청을 확인하기 위해 제한 시간 사용
+                if not slots.acquire(timeout=0.1):
+                    continue
+                with tracer.span('video_decode', 'io'):
+                    ok, frame = capture.read()
+                if not ok:
+                    slots.release()
+                    break
+                decoded.put((index, frame))
+                index += 1
+        except Exception as e:
+            self._fail(e)
+        finally:
+            for _ in range(self.workers):
+                decoded.put(_END)
+
+    def _process_loop(self, decoded, processed):
+        """처리 워커 - 편집 단계를 적용하여 인코드 대기열에 넣음"""
+        try:
+            while True:
+                item = decoded.get()
+                if item is _END:
+                    break
+                index, frame = item
+                if self._stop.is_set():
+                    processed.put((index, None))
+                    continue
+                processed.put((index, pipeline.run_stages(frame, self.stages, pool=self._pool)))
+        except Exception as e:
+            self._fail(e)
+        finally:
+            processed.put(_END)
+
+    def _encode_loop(self, output_path, fps, processed, slots):
+        """인코드 (호출 스레드) - 프레임 번호 순서대로 기록"""
+        is_sequence = '%' in output_path
+        directory = os.path.dirname(output_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        writer = None
+        pending = {}  # 순서를 기다리는 프레임 (크기는 max_in_flight 이하)
+        next_index = 0
+        finished_workers = 0
+        written = 0
+        try:
+            while finished_workers < self.workers:
+                item = processed.get()
+                if item is _END:
+                    finished_workers += 1
+                    continue
+                index, frame = item
+                pending[index] = frame
+                while next_index in pending:
+                    frame = pending.pop(next_index)
+                    next_index += 1
+                    if frame is not None and not self._stop.is_set():
+                        with tracer.span('video_encode', 'io'):
+                            if is_sequence:
+                                cv2.imwrite(output_path % written, frame)
+                            else:
+                                if writer is None:
+                                    writer = self._open_writer(output_path, fps, frame)
+                                writer.write(frame)
+                        written += 1
+                        self.frames_done = written
+                    self._pool.release(frame)
+                    slots.release()
+        except Exception as e:
+            self._fail(e)
+            # 남은 프레임 소비 (생산자 스레드가 막히지 않도록)
+            while finished_workers < self.workers:
+                if processed.get() is _END:
+                    finished_workers += 1
+                else:
+                    slots.release()
+        finally:
+            if writer is not None:
+                writer.release()
+        return written
+
+    def _open_writer(self, output_path, fps, frame):
+        """첫 처리 프레임의 크기/채널로 VideoWriter 생성"""
+        h, w = frame.shape[:2]
+        writer = cv2.VideoWriter(output_path, cv2.VideoWriter_fourcc(*self.fourcc),
+                                 fps, (w, h), isColor=(frame.ndim == 3))
+        if not writer.isOpened():
+            raise IOError(f"동영상 쓰기 실패: {output_path} ({self.fourcc})")
+        return writer
+
+    def _fail(self, error):
+        """첫 오류 기록 후 전체 중단"""
+        if self._error is None:
+            self._error = error
+        self._stop.set()
+
+
+def main(argv=None):
+    """명령줄 실행"""
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description='동영상/이미지 시퀀스 스트리밍 처리')
+    parser.add_argument('input', help='입력 동영상/GIF 또는 시퀀스 패턴 (예: frame_%%04d.png)')
+    parser.add_argument('output', help='출력 동영상 또는 시퀀스 패턴')
+    parser.add_argument('--recipe', help='레시피 JSON ({"button_states": ..., "trackbar_values": ...})')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--fps', type=float, default=None)
+    parser.add_argument('--fourcc', default='mp4v')
+    args = parser.parse_args(argv)
+
+    recipe = {}
+    if args.recipe:
+        with open(args.recipe, encoding='utf-8') as f:
+            recipe = json.load(f)
+
+    # 모든 프레임이 같은 크기이므로 회전 좌표표를 한 번 만들어 재사용
+    stages = pipeline.build_stages_from_recipe(recipe, fixed_geometry=True)
+    processor = VideoStreamProcessor(stages, workers=args.workers, fourcc=args.fourcc)
+    stats = processor.process(sequence_pattern_from_file(args.input), args.output, args.fps)
+    if stats is None:
+        return 1
+    print(f"{stats['frames']} 프레임, {stats['seconds']:.2f} s, {stats['fps']:.1f} frames/s")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
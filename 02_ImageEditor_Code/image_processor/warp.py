@@ -0,0 +1,210 @@
+"""
+워프 (Warp) 모듈
+어파인/원근(homography) 변환 적용과 고정 기하 변환용 좌표표(remap map) 캐시
+
+- 기본: cv2.warpAffine / cv2.warpPerspective (편집기처럼 변환이 매번 바뀔 수 있는 경로)
+- cache_maps=True: 동영상 프레임, 일괄 처리처럼 같은 변환을 반복하는 호출자가 선택합니다.
+  처음 사용할 때 고정소수점 좌표표(convertMaps, CV_16SC2 + 보간 가중치)를 만들고
+  이후 프레임은 행렬과 좌표 계산 없이 cv2.remap 한 번으로 처리합니다.
+  같은 변환은 항상 같은 좌표표로 처리하므로 결과가 호출마다 같습니다
+  (좌표를 1/32 화소로 줄이므로 직접 변환과는 조금 다름).
+- 정수 이동: 보간 없이 복사 (직접 변환과 결과가 같고 좌표 계산이 없음)
+- 좌표표는 메모리 예산(memory_budget)의 하위 시스템 'warp_maps'로 등록되어 오래 쓰지 않은 것부터 제거
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+from .memory_budget import memory_budget
+
+# 보관할 좌표표 수
+MAX_ENTRIES = 16
+# 좌표표를 만들 때 한 번에 계산하는 행 수 (임시 float 배열 크기 제한)
+MAP_BUILD_ROWS = 256
+
+
+def to_homography(matrix):
+    """2x3 어파인 또는 3x3 행렬을 3x3 float64 행렬로 변환"""
+    matrix = np.asarray(matrix, dtype=np.float64)
+    if matrix.shape == (2, 3):
+        matrix = np.vstack([matrix, (0.0, 0.0, 1.0)])
+    if matrix.shape != (3, 3):
+        raise ValueError("matrix must be a 2x3 or 3x3 array")
+    return matrix
+
+
+def build_maps(matrix, size, interpolation=cv2.INTER_LINEAR):
+    """결과 화소마다 원본 좌표를 계산한 고정소수점 좌표표 (map1, map2)
+
+    Args:
+        matrix: 원본 -> 결과 2x3 어파인 또는 3x3 원근 행렬 (cv2.warpAffine/warpPerspective와 같은 방향)
+        size: 결과 크기 (w, h)
+        interpolation: 보간 방법 (INTER_NEAREST면 map2는 None)
+
+    Returns:
+        (map1 (h, w, 2) int16 정수 좌표, map2 (h, w) uint16 보간 가중치 번호 또는 None)
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    perspective = matrix.shape == (3, 3)
+    inverse = np.linalg.inv(to_homography(matrix))
+    width, height = size
+    nearest = interpolation == cv2.INTER_NEAREST
+    map1 = np.empty((height, width, 2), np.int16)
+    map2 = None if nearest else np.empty((height, width), np.uint16)
+    xs = np.arange(width, dtype=np.float64)
+    (a, b, c), (d, e, f), (g, h, i) = inverse
+    for y0 in range(0, height, MAP_BUILD_ROWS):
+        y1 = min(height, y0 + MAP_BUILD_ROWS)
+        ys = np.arange(y0, y1, dtype=np.float64)[:, None]
+        map_x = a * xs + (b * ys + c)
+        map_y = d * xs + (e * ys + f)
+        if perspective:
+            # cv2.warpPerspective와 같이 w가 0이면 0으로 처리
+            w = g * xs + (h * ys + i)
+            w = np.divide(1.0, w, out=np.zeros_like(w), where=w != 0)
+            map_x *= w
+            map_y *= w
+        map_x, map_y = map_x.astype(np.float32), map_y.astype(np.float32)
+        if nearest:
+            cv2.convertMaps(map_x, map_y, cv2.CV_16SC2, dstmap1=map1[y0:y1], nninterpolation=True)
+        else:
+            cv2.convertMaps(map_x, map_y, cv2.CV_16SC2, dstmap1=map1[y0:y1], dstmap2=map2[y0:y1])
+    return map1, map2
+
+
+def integer_shift(matrix):
+    """어파인 행렬이 정수 이동만 하면 (tx, ty), 아니면 None"""
+    (a, b, tx), (c, d, ty) = matrix[:2]
+    if (a, b, c, d) != (1.0, 0.0, 0.0, 1.0) or tx != int(tx) or ty != int(ty):
+        return None
+    return int(tx), int(ty)
+
+
+def shift_image(img, tx, ty, size, dst=None):
+    """정수 이동 (보간 없이 복사, 드러난 영역은 검은색) - 같은 이동의 warpAffine 결과와 같음"""
+    width, height = size
+    shape = (height, width) + img.shape[2:]
+    out = dst if dst is not None and dst.shape == shape and dst.dtype == img.dtype else np.empty(shape, img.dtype)
+    src_h, src_w = img.shape[:2]
+    x0, y0 = min(max(0, tx), width), min(max(0, ty), height)
+    x1, y1 = max(min(width, src_w + tx), x0), max(min(height, src_h + ty), y0)
+    out[y0:y1, x0:x1] = img[y0 - ty:y1 - ty, x0 - tx:x1 - tx]
+    out[:y0] = 0
+    out[y1:] = 0
+    out[y0:y1, :x0] = 0
+    out[y0:y1, x1:] = 0
+    return out
+
+
+class WarpEngine:
+    """워프 엔진 (단일 책임: 기하 변환 적용과 고정 변환의 좌표표 캐시)
+
+    키는 (원본 shape, dtype, 결과 크기, 행렬, 보간 방법, 원근 여부)입니다.
+    cache_maps=True로 호출한 변환만 좌표표를 만들어 보관합니다. 그 밖의 호출은 좌표표를 보지도 만들지도
+    않으므로 직접 변환과 결과가 같습니다. 정수 이동은 보간 없이 복사합니다 (캐시 불필요).
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        """
+        Args:
+            max_entries: 보관할 좌표표 수 (넘으면 오래 쓰지 않은 것부터 제거)
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # 키 -> {'maps', 'build_s', 'used'}
+        self._lock = threading.Lock()
+
+    def warp_affine(self, img, matrix, size, dst=None, interpolation=cv2.INTER_LINEAR,
+                    cache_maps=False):
+        """어파인 변환 (cv2.warpAffine, 검은색 배경)
+        matrix: 원본 -> 결과 2x3 행렬
+        size: 결과 크기 (w, h)
+        cache_maps: True면 좌표표를 캐시하여 remap (같은 변환을 반복하는 동영상, 일괄 처리)
+        """
+        return self._warp(img, np.asarray(matrix, dtype=np.float64), size, dst, interpolation,
+                          False, cache_maps)
+
+    def warp_perspective(self, img, matrix, size, dst=None, interpolation=cv2.INTER_LINEAR,
+                         cache_maps=False):
+        """원근 변환 (cv2.warpPerspective, 검은색 배경)
+        matrix: 원본 -> 결과 3x3 행렬 (homography)
+        size: 결과 크기 (w, h)
+        cache_maps: True면 좌표표를 캐시하여 remap (같은 변환을 반복하는 동영상, 일괄 처리)
+        """
+        return self._warp(img, np.asarray(matrix, dtype=np.float64), size, dst, interpolation,
+                          True, cache_maps)
+
+    def is_cached(self, img, matrix, size, interpolation=cv2.INTER_LINEAR, perspective=False):
+        """이 변환의 좌표표를 보관 중인지 여부"""
+        key = self._key(img, np.asarray(matrix, dtype=np.float64), size, interpolation, perspective)
+        with self._lock:
+            return key in self._entries
+
+    def _key(self, img, matrix, size, interpolation, perspective):
+        return (img.shape, img.dtype.str, tuple(size), matrix.tobytes(), interpolation, perspective)
+
+    def _warp(self, img, matrix, size, dst, interpolation, perspective, cache_maps):
+        shift = None if perspective else integer_shift(matrix)
+        if shift is not None:
+            return shift_image(img, shift[0], shift[1], size, dst)
+        if not cache_maps:
+            warp = cv2.warpPerspective if perspective else cv2.warpAffine
+            return warp(img, matrix, tuple(size), dst=dst, flags=interpolation,
+                        borderMode=cv2.BORDER_CONSTANT, borderValue=(0, 0, 0))
+        maps = self._maps(self._key(img, matrix, size, interpolation, perspective),
+                          matrix, size, interpolation)
+        return cv2.remap(img, maps[0], maps[1], interpolation, dst=dst,
+                         borderMode=cv2.BORDER_CONSTANT, borderValue=(0, 0, 0))
+
+    def _maps(self, key, matrix, size, interpolation):
+        """변환의 좌표표 (없으면 만들어 보관, 최근 사용으로 표시)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                entry['used'] = time.monotonic()
+                return entry['maps']
+        # 만드는 동안 잠금을 풀어 둠 (같은 변환을 동시에 만들어도 결과는 같음)
+        start = time.perf_counter()
+        maps = build_maps(matrix, size, interpolation)
+        entry = {'maps': maps, 'build_s': time.perf_counter() - start, 'used': time.monotonic()}
+        with self._lock:
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        memory_budget.enforce()
+        return maps
+
+    def clear(self):
+        """모든 좌표표 제거"""
+        with self._lock:
+            self._entries.clear()
+
+    def memory_usage(self) -> int:
+        """보관 중인 좌표표의 총 바이트 수 (메모리 예산 보고용)"""
+        with self._lock:
+            return sum(_maps_nbytes(entry['maps']) for entry in self._entries.values())
+
+    def memory_candidates(self):
+        """제거할 수 있는 좌표표 (다시 만드는 비용은 측정한 생성 시간)"""
+        with self._lock:
+            return [(key, _maps_nbytes(entry['maps']), entry['used'], entry['build_s'])
+                    for key, entry in self._entries.items()]
+
+    def evict_memory(self, key) -> int:
+        """좌표표 해제 (다음 처리에서 같은 좌표표를 다시 만듦)"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            return 0 if entry is None else _maps_nbytes(entry['maps'])
+
+
+def _maps_nbytes(maps):
+    return maps[0].nbytes + (maps[1].nbytes if maps[1] is not None else 0)
+
+
+# 프로세스 전체에서 공유하는 워프 엔진
+warp_engine = WarpEngine()
+memory_budget.register('warp_maps', warp_engine)
@@ -2,24 +2,37 @@
 
 import sys
 import os
-import glob
+import math
+import threading
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QSlider, QLabel, QListWidget, QListWidgetItem,
     QMenuBar, QMenu, QStatusBar, QFileDialog, QMessageBox,
-    QScrollArea, QGroupBox, QGridLayout, QFrame
+    QScrollArea, QGroupBox, QGridLayout, QFrame, QProgressDialog
 )
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QMimeData
-from PyQt5.QtGui import QImage, QPixmap, QFont, QDragEnterEvent, QDropEvent
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QMimeData, QRectF, QObject, QEvent
+from PyQt5.QtGui import QImage, QPixmap, QFont, QDragEnterEvent, QDropEvent, QTransform
 import cv2
 import numpy as np
-from image_processor import pixel_processing, area_processing, geometric_processing, file_operations
+# image_processor 하위 모듈은 사용하는 것만 불러옴 (동영상 처리 등은 처음 사용할 때)
+from image_processor import file_operations
+from image_processor import geometric_processing
+from image_processor import pipeline
+from image_processor.buffer_pool import BufferPool
+from image_processor.conversion_cache import ConversionCache
+from image_processor.memory_budget import memory_budget
+from image_processor.session_store import SessionStore
 from image_processor.UI.settings_panel import SettingsPanel
+from image_processor.UI.latency_monitor import LatencyMonitor
+from image_processor.UI.histogram_widget import HistogramWidget
+from image_processor.tracing import tracer
 
 
 class ImageDisplayWidget(QWidget):
     """이미지 표시 위젯 (드래그 가능)"""
     
+    roi_selected = pyqtSignal(tuple)  # ROI 선택 모드에서 드래그로 고른 영역 (x, y, w, h) 원본 좌표
+    
     def __init__(self):
         super().__init__()
         self.image = None
@@ -28,22 +41,181 @@ class ImageDisplayWidget(QWidget):
         self.offset_y = 0
         self.is_dragging = False
         self.drag_start_pos = None
+        self.latency_monitor = None  # 입력-화면 지연 모니터 (선택)
+        self._rgb = None  # 표시용 RGB (처리 중 이미 만들어진 경우, 이미지가 바뀔 때까지 재사용)
+        self._owns_image = False  # self.image가 위젯 소유 복사본인지 (공유 메모리 view면 False)
+        self._display = None  # 렌더 워커가 만든 화면 배율 이미지 (이미지, 배율)
+        self._pixmap = None  # 화면 배율 pixmap (이동/다시 그리기 시 재사용)
+        self._pixmap_scale = None
+        self._preview = None  # 기하 변환 미리보기 상태 (begin_preview ~ end_preview)
+        self._placeholder = None  # 세션 복원 미리보기 (전체 해상도 이미지가 준비될 때까지)
+        self._proxy = None  # 드래그 중 화면 크기로 줄여 처리한 결과 (set_proxy ~ set_image)
+        self.roi_selecting = False  # True면 왼쪽 드래그로 이동 대신 ROI 선택
+        self.roi = None  # 표시할 ROI 테두리 (x, y, w, h) 원본 좌표
+        self._roi_anchor = None  # ROI 선택 드래그 시작점 (원본 좌표)
         self.setMinimumSize(800, 500)
         self.setStyleSheet("background-color: #1e1e1e;")
     
-    def set_image(self, image):
-        """이미지 설정"""
+    def set_image(self, image, rgb=None, display=None, copy=True):
+        """이미지 설정
+        rgb: 처리 중 이미 만들어진 표시용 RGB (있으면 변환 생략)
+        display: 렌더 워커가 만든 (화면 배율 이미지, 배율) - 배율이 같으면 축소 생략
+        copy: False면 복사하지 않고 참조만 보관 (렌더 워커 결과 view - 호출자가 수명 관리)
+        """
         if image is not None:
-            self.image = image.copy()
+            if not copy:
+                self.image = image
+            elif (self._owns_image and self.image is not image
+                    and self.image.shape == image.shape and self.image.dtype == image.dtype):
+                # 크기가 같으면 기존 버퍼에 복사 (드래그 중 재할당 방지)
+                np.copyto(self.image, image)
+            else:
+                self.image = image.copy()
+            self._owns_image = copy
+            # 세 채널이 같은 결과는 BGR이 곧 RGB이므로 복사본을 그대로 사용
+            self._rgb = self.image if rgb is image else rgb
+            self._display = display if display is not None and display[0] is not None else None
+            self._pixmap = None
+            self._preview = None
+            self._placeholder = None
+            self._proxy = None
+            self._calculate_scale()
+            self.update()
+    
+    def set_placeholder(self, preview, size):
+        """전체 해상도 이미지를 읽기 전에 표시할 축소 이미지 설정 (세션 복원)
+        preview: 화면 해상도로 줄여 저장해 둔 이미지 (BGR 또는 그레이스케일)
+        size: 원래 이미지 크기 (w, h) - 배율과 위치를 이 크기 기준으로 계산하여
+              전체 해상도 이미지로 바뀔 때 화면이 움직이지 않음
+        """
+        self._placeholder = {
+            'pixmap': self._make_scaled_pixmap(preview, None, 1.0),
+            'size': tuple(size),
+        }
+        self._calculate_scale()
+        self.update()
+    
+    def set_proxy(self, proxy, size):
+        """드래그 중 화면 크기로 줄인 원본에 처리를 적용한 결과 표시 (다음 set_image까지)
+        proxy: 축소 처리 결과 (pixmap을 바로 만들므로 호출 후 재사용해도 됨)
+        size: 전체 해상도 결과 크기 (w, h) - 배율과 위치를 이 크기 기준으로 계산
+        """
+        self._proxy = {
+            'pixmap': self._make_scaled_pixmap(proxy, None, 1.0),
+            'size': tuple(size),
+        }
+        self._calculate_scale()
+        self.update()
+    
+    def update_region(self, image, rect):
+        """이미지의 rect 영역만 바뀌었을 때 표시 갱신 (ROI 편집)
+        image: 제자리에서 수정된 표시 중인 이미지 - 다른 이미지면 set_image(copy=False)로 전체 갱신
+        rect: 바뀐 영역 (x, y, w, h) 원본 좌표. 화면 배율 pixmap의 해당 부분만 다시 만들어 덮어씀
+        """
+        if (image is not self.image or self._pixmap is None or self._display is not None
+                or self._pixmap_scale != self.scale_factor
+                or self._preview is not None or self._proxy is not None):
+            self.set_image(image, copy=False)
+            return
+        from PyQt5.QtGui import QPainter
+        x, y, w, h = rect
+        height, width = image.shape[:2]
+        pixmap_w, pixmap_h = self._pixmap.width(), self._pixmap.height()
+        fx, fy = width / pixmap_w, height / pixmap_h
+        # pixmap 화소 범위 (경계 화소가 포함되도록 바깥으로 넓힘)와 그에 해당하는 원본 범위
+        px0, py0 = int(x / fx), int(y / fy)
+        px1 = min(pixmap_w, math.ceil((x + w) / fx))
+        py1 = min(pixmap_h, math.ceil((y + h) / fy))
+        sx0, sy0 = int(px0 * fx), int(py0 * fy)
+        sx1, sy1 = min(width, math.ceil(px1 * fx)), min(height, math.ceil(py1 * fy))
+        with tracer.span('display_region', 'display'):
+            patch = geometric_processing.apply_resize(image[sy0:sy1, sx0:sx1], px1 - px0, py1 - py0)
+            painter = QPainter(self._pixmap)
+            painter.drawPixmap(px0, py0, self._make_scaled_pixmap(patch, None, 1.0))
+            painter.end()
+        self._rgb = None
+        self.update(self.offset_x + px0 - 2, self.offset_y + py0 - 2,
+                    px1 - px0 + 4, py1 - py0 + 4)
+    
+    def set_roi(self, roi):
+        """ROI 테두리 설정 (None이면 지움)"""
+        self.roi = roi
+        self.update()
+    
+    def _to_image_point(self, pos):
+        """위젯 좌표 -> 원본 이미지 좌표 (이미지 안으로 자름)"""
+        h, w = self.image.shape[:2]
+        x = (pos.x() - self.offset_x) / self.scale_factor
+        y = (pos.y() - self.offset_y) / self.scale_factor
+        return min(max(int(x), 0), w), min(max(int(y), 0), h)
+    
+    def _roi_from_anchor(self, pos):
+        """드래그 시작점과 현재 위치로 만든 ROI (x, y, w, h)"""
+        (ax, ay), (bx, by) = self._roi_anchor, self._to_image_point(pos)
+        return min(ax, bx), min(ay, by), abs(bx - ax), abs(by - ay)
+    
+    def has_image(self):
+        """표시 중인 이미지가 있는지 여부 (세션 복원 미리보기 포함)"""
+        return self.image is not None or self._placeholder is not None
+    
+    def begin_preview(self, base, display=None):
+        """기하 변환 미리보기 시작
+        base: 기하 변환(회전/크기 조절) 직전 단계까지의 처리 결과.
+        display: 렌더 워커가 만든 (화면 배율 이미지, 배율) - 배율이 같으면 축소 생략
+        화면 배율로 줄인 pixmap을 한 번만 만들어 두고, 이후에는 변환 행렬만 바꿔 그립니다.
+        """
+        h, w = base.shape[:2]
+        scale = min(self.width() / w, self.height() / h, 1.0)
+        if display is not None and display[0] is not None and display[1] == scale:
+            pixmap = self._make_scaled_pixmap(display[0], None, 1.0)
+        else:
+            pixmap = self._make_scaled_pixmap(base, None, scale)
+        self._preview = {
+            'pixmap': pixmap,
+            'scale': scale,
+            'transform': QTransform(),
+            'size': (w, h),
+        }
+        self._calculate_scale()
+        self.update()
+    
+    def set_preview_transform(self, matrix, size):
+        """미리보기 변환 갱신 (재표본화 없이 다시 그리기만 함)
+        matrix: 미리보기 원본 좌표 -> 출력 이미지 좌표의 2x3 어파인 행렬
+        size: 출력 이미지 크기 (w, h)
+        """
+        if self._preview is None:
+            return
+        (a, b, c), (d, e, f) = matrix
+        self._preview['transform'] = QTransform(a, d, b, e, c, f)
+        self._preview['size'] = size
+        self._calculate_scale()
+        self.update()
+    
+    def end_preview(self):
+        """기하 변환 미리보기 종료"""
+        if self._preview is not None:
+            self._preview = None
             self._calculate_scale()
             self.update()
     
+    def is_previewing(self):
+        """기하 변환 미리보기 중인지 여부"""
+        return self._preview is not None
+    
     def _calculate_scale(self):
         """이미지 크기에 맞게 스케일 계산"""
-        if self.image is None:
+        if self._preview is not None:
+            w, h = self._preview['size']
+        elif self._proxy is not None:
+            w, h = self._proxy['size']
+        elif self.image is not None:
+            h, w = self.image.shape[:2]
+        elif self._placeholder is not None:
+            w, h = self._placeholder['size']
+        else:
             return
         
-        h, w = self.image.shape[:2]
         widget_w = self.width()
         widget_h = self.height()
         
@@ -59,13 +231,20 @@ class ImageDisplayWidget(QWidget):
     
     def mousePressEvent(self, event):
         """마우스 클릭 이벤트"""
-        if event.button() == Qt.LeftButton:
+        if event.button() == Qt.LeftButton and self.roi_selecting and self.image is not None:
+            self._roi_anchor = self._to_image_point(event.pos())
+            self.roi = None
+            self.update()
+        elif event.button() == Qt.LeftButton:
             self.is_dragging = True
             self.drag_start_pos = event.pos()
     
     def mouseMoveEvent(self, event):
         """마우스 이동 이벤트"""
-        if self.is_dragging and self.drag_start_pos:
+        if self._roi_anchor is not None:
+            self.roi = self._roi_from_anchor(event.pos())
+            self.update()
+        elif self.is_dragging and self.drag_start_pos:
             delta = event.pos() - self.drag_start_pos
             self.offset_x += delta.x()
             self.offset_y += delta.y()
@@ -74,7 +253,14 @@ class ImageDisplayWidget(QWidget):
     
     def mouseReleaseEvent(self, event):
         """마우스 릴리즈 이벤트"""
-        if event.button() == Qt.LeftButton:
+        if event.button() == Qt.LeftButton and self._roi_anchor is not None:
+            roi = self._roi_from_anchor(event.pos())
+            self._roi_anchor = None
+            if roi[2] > 0 and roi[3] > 0:
+                self.roi = roi
+                self.roi_selected.emit(roi)
+            self.update()
+        elif event.button() == Qt.LeftButton:
             self.is_dragging = False
             self.drag_start_pos = None
     
@@ -83,33 +269,140 @@ class ImageDisplayWidget(QWidget):
         self._calculate_scale()
         self.update()
     
+    def _make_scaled_pixmap(self, image, rgb, scale):
+        """이미지를 화면 배율의 QPixmap으로 변환
+        rgb가 없으면 BGR 배열을 그대로 읽음 (Format_BGR888, 색 변환 생략)
+        축소는 OpenCV로 먼저 처리 (절반 줄이기 반복 + INTER_AREA, Qt 부드러운 변환보다 빠름)
+        """
+        if scale < 1.0:
+            with tracer.span('display_scale', 'display'):
+                size = (max(1, int(image.shape[1] * scale)), max(1, int(image.shape[0] * scale)))
+                image = geometric_processing.apply_resize(image, size[0], size[1])
+                if rgb is not None:
+                    rgb = geometric_processing.apply_resize(rgb, size[0], size[1])
+            scale = 1.0
+        
+        # OpenCV 이미지를 QImage로 변환
+        with tracer.span('display_convert', 'display'):
+            if len(image.shape) == 2:
+                q_image = QImage(image.data, image.shape[1], image.shape[0],
+                               image.strides[0], QImage.Format_Grayscale8)
+            elif rgb is None:
+                q_image = QImage(image.data, image.shape[1], image.shape[0],
+                               image.strides[0], QImage.Format_BGR888)
+            else:
+                q_image = QImage(rgb.data, rgb.shape[1], rgb.shape[0],
+                               rgb.strides[0], QImage.Format_RGB888)
+        
+        if scale == 1.0:
+            return QPixmap.fromImage(q_image)
+        
+        # 이미지 크기 조정 (확대)
+        with tracer.span('display_scale', 'display'):
+            return QPixmap.fromImage(q_image).scaled(
+                int(image.shape[1] * scale),
+                int(image.shape[0] * scale),
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation
+            )
+    
+    def _scaled_pixmap(self):
+        """현재 이미지의 화면 배율 pixmap (이미지나 배율이 바뀔 때만 다시 생성)"""
+        if self._pixmap is None or self._pixmap_scale != self.scale_factor:
+            if self._display is not None and self._display[1] == self.scale_factor:
+                # 렌더 워커가 이미 화면 배율로 줄여 둠
+                self._pixmap = self._make_scaled_pixmap(self._display[0], None, 1.0)
+            else:
+                self._pixmap = self._make_scaled_pixmap(self.image, self._rgb, self.scale_factor)
+            self._pixmap_scale = self.scale_factor
+        return self._pixmap
+    
     def paintEvent(self, event):
         """그리기 이벤트"""
         from PyQt5.QtGui import QPainter
         painter = QPainter(self)
         
-        if self.image is None:
+        if not self.has_image():
             return
         
-        # OpenCV 이미지를 QImage로 변환
-        if len(self.image.shape) == 2:
-            q_image = QImage(self.image.data, self.image.shape[1], self.image.shape[0],
-                           self.image.strides[0], QImage.Format_Grayscale8)
-        else:
-            rgb_image = cv2.cvtColor(self.image, cv2.COLOR_BGR2RGB)
-            q_image = QImage(rgb_image.data, rgb_image.shape[1], rgb_image.shape[0],
-                           rgb_image.strides[0], QImage.Format_RGB888)
-        
-        # 이미지 크기 조정
-        scaled_pixmap = QPixmap.fromImage(q_image).scaled(
-            int(self.image.shape[1] * self.scale_factor),
-            int(self.image.shape[0] * self.scale_factor),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
+        with tracer.span('paint', 'display'):
+            stretched = self._proxy if self._proxy is not None else (
+                self._placeholder if self.image is None else None)
+            if stretched is not None:
+                # 세션 복원/드래그 중 축소 미리보기: 원래 이미지의 화면 크기로 늘려 그림
+                w, h = stretched['size']
+                painter.setRenderHint(QPainter.SmoothPixmapTransform)
+                painter.drawPixmap(
+                    QRectF(self.offset_x, self.offset_y, w * self.scale_factor, h * self.scale_factor),
+                    stretched['pixmap'],
+                    QRectF(stretched['pixmap'].rect()))
+            elif self._preview is not None:
+                # 기하 변환 미리보기: 캐시된 pixmap을 변환 행렬로 그림
+                preview = self._preview
+                painter.save()
+                painter.setRenderHint(QPainter.SmoothPixmapTransform)
+                painter.translate(self.offset_x, self.offset_y)
+                painter.scale(self.scale_factor, self.scale_factor)
+                # 실제 회전 결과처럼 출력 캔버스를 검은색으로 채움
+                painter.fillRect(QRectF(0, 0, *preview['size']), Qt.black)
+                painter.setTransform(preview['transform'], True)
+                painter.scale(1.0 / preview['scale'], 1.0 / preview['scale'])
+                painter.drawPixmap(0, 0, preview['pixmap'])
+                painter.restore()
+            else:
+                # 이미지 그리기
+                painter.drawPixmap(self.offset_x, self.offset_y, self._scaled_pixmap())
+            
+            if self.roi is not None:
+                self._draw_roi(painter)
         
-        # 이미지 그리기
-        painter.drawPixmap(self.offset_x, self.offset_y, scaled_pixmap)
+        # 지연 모니터: 페인트 완료 기록 및 오버레이 표시
+        if self.latency_monitor is not None and self.latency_monitor.enabled:
+            self.latency_monitor.mark_painted()
+            if self.latency_monitor.overlay_enabled:
+                self._draw_latency_overlay(painter)
+    
+    def memory_usage(self):
+        """표시용으로 보관 중인 바이트 수 (메모리 예산 보고용)
+        렌더 워커 결과 view는 워커 공유 메모리로 집계되므로 제외합니다.
+        """
+        total = self.image.nbytes if self.image is not None and self._owns_image else 0
+        pixmaps = [self._pixmap]
+        if self._preview is not None:
+            pixmaps.append(self._preview['pixmap'])
+        if self._placeholder is not None:
+            pixmaps.append(self._placeholder['pixmap'])
+        if self._proxy is not None:
+            pixmaps.append(self._proxy['pixmap'])
+        for pixmap in pixmaps:
+            if pixmap is not None:
+                total += pixmap.width() * pixmap.height() * pixmap.depth() // 8
+        return total
+    
+    def memory_candidates(self):
+        """화면에 표시 중이므로 제거할 항목 없음"""
+        return []
+    
+    def evict_memory(self, key):
+        return 0
+    
+    def _draw_roi(self, painter):
+        """ROI 테두리 그리기 (점선)"""
+        from PyQt5.QtGui import QColor, QPen
+        x, y, w, h = self.roi
+        pen = QPen(QColor(0, 200, 255))
+        pen.setStyle(Qt.DashLine)
+        painter.setPen(pen)
+        painter.drawRect(QRectF(self.offset_x + x * self.scale_factor, self.offset_y + y * self.scale_factor,
+                                w * self.scale_factor, h * self.scale_factor))
+    
+    def _draw_latency_overlay(self, painter):
+        """지연 통계 오버레이 그리기"""
+        from PyQt5.QtGui import QColor
+        text = self.latency_monitor.summary_text()
+        painter.fillRect(8, 8, painter.fontMetrics().width(text) + 16, 24, QColor(0, 0, 0, 160))
+        painter.setPen(QColor(0, 255, 128))
+        painter.drawText(16, 25, text)
 
 
 class FileListWidget(QListWidget):
@@ -220,10 +513,56 @@ class FileListWidget(QListWidget):
             event.ignore()
 
 
+class StartupLoader(QObject):
+    """시작 작업 처리기 (단일 책임: 폴더 스캔과 첫 이미지 디코딩을 백그라운드 스레드에서 실행)
+    
+    결과는 시그널로 전달되며 GUI 스레드에서 처리됩니다 (Qt 대기열 연결).
+    """
+    
+    files_scanned = pyqtSignal(list)  # 이미지 파일 경로 목록
+    image_decoded = pyqtSignal(str, object)  # (파일 경로, 이미지) - 파일이 없으면 ('', None)
+    
+    def start(self, images_dir, preferred_path=None):
+        """백그라운드 스캔/디코딩 시작
+        preferred_path: 목록에 있으면 첫 파일 대신 디코딩할 파일 (이전 세션의 파일)
+        """
+        thread = threading.Thread(target=self._run, args=(images_dir, preferred_path),
+                                  name='startup-load', daemon=True)
+        thread.start()
+    
+    def _run(self, images_dir, preferred_path):
+        with tracer.span('scan_image_files', 'io'):
+            files = file_operations.FileLoader.list_images(images_dir)
+        self.files_scanned.emit(files)
+        if not files:
+            self.image_decoded.emit('', None)
+            return
+        file_path = preferred_path if preferred_path in files else files[0]
+        self.image_decoded.emit(file_path, file_operations.FileLoader.load(file_path))
+
+
+class RenderWorkerBridge(QObject):
+    """렌더 워커 연결 (단일 책임: 워커 수신 스레드의 결과/오류를 GUI 스레드로 전달)"""
+    
+    result_ready = pyqtSignal(object)  # RenderResult
+    worker_failed = pyqtSignal(str)  # 재시작을 포기한 이유
+
+
 class ImageEditor(QMainWindow):
     """이미지 편집기 메인 윈도우"""
     
-    def __init__(self):
+    # 드래그 중 화면 변환으로 미리보는 슬라이더 (처리 순서의 마지막 단계들)
+    GEOMETRIC_KEYS = ('rotation', 'resize_w', 'resize_h')
+    # 드래그 중 화면 크기로 줄인 원본으로 처리하여 미리보는 슬라이더 (전체 해상도 처리가 느린 단계)
+    PROXY_KEYS = ('clahe',)
+    # 저장할 이미지를 렌더 워커에서 다시 처리할 때 기다리는 최대 시간 (초, 백그라운드에서 기다림)
+    EXPORT_TIMEOUT_S = 120.0
+    # 저장 처리가 이 시간(ms)보다 오래 걸리면 진행 대화상자 표시
+    EXPORT_DIALOG_DELAY_MS = 300
+    # ROI 편집 중 마지막 변경 후 이 시간(ms)이 지나면 히스토리에 추가 (슬라이더 값마다 전체 프레임 복사 방지)
+    ROI_HISTORY_DELAY_MS = 500
+    
+    def __init__(self, images_dir=None):
         super().__init__()
         self.original_image = None
         self.processed_image = None
@@ -241,7 +580,8 @@ class ImageEditor(QMainWindow):
             # 일반 Python 스크립트 실행 시
             current_dir = os.path.dirname(os.path.abspath(__file__))
         
-        self.images_dir = os.path.join(current_dir, 'images')
+        # images_dir을 지정하면 해당 폴더 사용 (벤치마크 등)
+        self.images_dir = images_dir or os.path.join(current_dir, 'images')
         # images 폴더가 없으면 생성 (빈 폴더로 시작)
         if not os.path.exists(self.images_dir):
             os.makedirs(self.images_dir)
@@ -258,6 +598,7 @@ class ImageEditor(QMainWindow):
             'brightness': 100,  # 중간값으로 변경
             'contrast': 100,
             'threshold': 127,
+            'clahe': 0,
             'blur': 0,
             'canny_low': 50,
             'canny_high': 150,
@@ -274,9 +615,70 @@ class ImageEditor(QMainWindow):
         self.file_loader = file_operations.FileLoader()
         self.settings_manager = file_operations.SettingsManager()
         
+        # 동영상 처리 (백그라운드 스레드)
+        self.video_processor = None
+        self._video_timer = None
+        
+        # 빠른 미리보기 (단계 재배치, 저장 시에는 정확한 순서로 다시 처리)
+        self.fast_preview = False
+        self._last_render = None
+        self._preview_base_shape = None  # 기하 변환 미리보기 원본 크기
+        
+        # 1채널(gray/이진) 결과를 저장할 때 BGR 3채널로 확장할지 여부 (기본은 1채널로 저장)
+        self.export_gray_as_bgr = False
+        
+        # 처리 단계 출력 버퍼 풀 (드래그 중 큰 배열 재할당 방지)
+        self.buffer_pool = BufferPool()
+        
+        # 렌더 워커 (별도 프로세스에서 처리, start_deferred_startup에서 실행)
+        # 준비되기 전이나 실패한 뒤에는 이 프로세스에서 처리
+        self.render_worker = None
+        self._worker_source = None  # 워커에 넘긴 원본 (공유 메모리 view)
+        self._source_generation = 0  # 원본을 바꿀 때마다 증가 (CLAHE 타일 히스토그램 캐시 키)
+        self._worker_result = None  # 표시 중인 워커 결과 (다음 결과를 받으면 슬롯 반환)
+        self._render_seq = None  # 마지막 처리 요청 번호
+        self._geometric_dragging = False
+        self._proxy_dragging = False
+        self._preview_requested = False  # 기하 변환 미리보기 원본을 워커에 요청함
+        self._export_cancel = None  # 저장할 이미지를 워커에서 처리하는 중이면 취소 Event
+        
+        # ROI 편집 (File > ROI Edit): ROI와 주변 halo만 처리하여 (렌더 워커가 있으면 워커에서) 전체 프레임에 합성
+        self.roi_mode = False
+        self.roi = None  # (x, y, w, h) 원본 좌표
+        self._roi_frame = None  # 원본 복사본 + ROI 처리 결과 (화면 표시, 저장에 사용)
+        self._roi_applied = None  # _roi_frame에 처리 결과를 쓴 영역 (ROI를 바꾸면 원본으로 되돌림)
+        self._roi_history_timer = QTimer(self)
+        self._roi_history_timer.setSingleShot(True)
+        self._roi_history_timer.setInterval(self.ROI_HISTORY_DELAY_MS)
+        self._roi_history_timer.timeout.connect(self._commit_roi_history)
+        self.render_bridge = RenderWorkerBridge(self)
+        self.render_bridge.result_ready.connect(self._on_render_result)
+        self.render_bridge.worker_failed.connect(self._on_render_worker_failed)
+        
+        # 마지막 세션 (종료 시 저장, 시작 시 전체 해상도 디코딩 전에 미리보기 표시)
+        self.session_store = SessionStore(os.path.join(os.path.dirname(self.images_dir), 'session'))
+        self._session = None
+        self._suspend_render = False  # 상태를 한꺼번에 바꾸는 동안 슬라이더마다 처리하지 않음
+        
+        # 폴더 스캔과 첫 이미지 디코딩은 창을 띄운 뒤 백그라운드에서 실행 (start_deferred_startup)
+        self.startup_loader = StartupLoader(self)
+        self.startup_loader.files_scanned.connect(self._on_files_scanned)
+        self.startup_loader.image_decoded.connect(self._on_startup_image_decoded)
+        
+        # 입력-화면 지연 모니터 (IMAGE_EDITOR_LATENCY=1 로 시작 시 활성화)
+        self.latency_monitor = LatencyMonitor(self)
+        
         self.current_tab = 'Pixel'
         self.init_ui()
-        self.scan_image_files()
+        
+        # 메모리 예산에 하위 시스템 등록 (File > Memory Usage에서 확인)
+        memory_budget.register('history', self.file_manager)
+        memory_budget.register('buffer_pool', self.buffer_pool)
+        memory_budget.register('display', self.image_display)
+        self.memory_view = None
+        
+        if os.environ.get('IMAGE_EDITOR_LATENCY') == '1':
+            self.on_toggle_latency_monitor()
     
     def init_ui(self):
         """UI 초기화"""
@@ -309,6 +711,8 @@ class ImageEditor(QMainWindow):
         
         # 중앙 이미지 표시 영역
         self.image_display = ImageDisplayWidget()
+        self.image_display.latency_monitor = self.latency_monitor
+        self.image_display.roi_selected.connect(self.on_roi_selected)
         right_layout.addWidget(self.image_display, 1)
         
         # 하단 설정 패널
@@ -341,6 +745,13 @@ class ImageEditor(QMainWindow):
         self.file_list.file_dropped.connect(self.on_file_dropped)
         layout.addWidget(self.file_list)
         
+        # 히스토그램 (처리 결과의 분포)
+        histogram_title = QLabel('Histogram')
+        histogram_title.setStyleSheet("color: #dcdcdc; font-size: 14px; font-weight: bold; padding: 5px;")
+        layout.addWidget(histogram_title)
+        self.histogram_widget = HistogramWidget()
+        layout.addWidget(self.histogram_widget)
+        
         return panel
     
     def create_top_bar(self):
@@ -379,7 +790,8 @@ class ImageEditor(QMainWindow):
         
         # 메뉴 항목 정의 (File을 맨 앞으로)
         menu_items = {
-            'File': ['Save', 'Save As', 'Load', 'Undo', 'Redo', 'Settings', 'Exit'],
+            'File': ['Save', 'Save As', 'Load', 'Undo', 'Redo', 'Settings',
+                     'Process Video', 'Fast Preview', 'ROI Edit', 'Export Gray as BGR', 'Toggle Trace', 'Export Trace', 'Latency Monitor', 'Memory Usage', 'Exit'],
             'Pixel': ['Brightness', 'Contrast', 'Threshold', 'Grayscale', 'Invert'],
             'Area': ['Blur', 'Canny Edge', 'Sharpen', 'Median Blur'],
             'Geometric': ['Rotation', 'Flip H', 'Flip V', 'Resize', 'Translate']
@@ -439,12 +851,20 @@ class ImageEditor(QMainWindow):
         self.info_label = QLabel('File: No Image | Size: 0 KB')
         self.info_label.setStyleSheet("color: #dcdcdc; font-size: 11px;")
         layout.addWidget(self.info_label)
+        layout.addStretch()
+        
+        # 마지막 렌더의 단계별 소요 시간 (추적 활성화 시에만 표시)
+        self.timing_label = QLabel('')
+        self.timing_label.setStyleSheet("color: #9cdcfe; font-size: 11px;")
+        layout.addWidget(self.timing_label)
         
         return bar
     
     def create_settings_panel(self):
         """하단 설정 패널 생성"""
         panel = SettingsPanel()
+        # 지연 모니터는 처리 슬롯보다 먼저 연결 (입력 시점 기록)
+        panel.attach_latency_monitor(self.latency_monitor)
         
         # RESET 버튼 연결
         panel.get_reset_button().clicked.connect(self.on_reset_clicked)
@@ -461,6 +881,11 @@ class ImageEditor(QMainWindow):
             lambda val: self.on_slider_changed('contrast', val))
         pixel_settings.get_threshold_slider().valueChanged.connect(
             lambda val: self.on_slider_changed('threshold', val))
+        pixel_settings.get_clahe_slider().valueChanged.connect(
+            lambda val: self.on_slider_changed('clahe', val))
+        # 드래그 중에는 축소 원본으로 미리보기, 놓을 때 전체 해상도 처리
+        pixel_settings.get_clahe_slider().sliderPressed.connect(self.on_proxy_drag_started)
+        pixel_settings.get_clahe_slider().sliderReleased.connect(self.on_proxy_drag_finished)
         
         # Area 설정 위젯 연결
         area_settings = panel.get_area_settings()
@@ -485,6 +910,12 @@ class ImageEditor(QMainWindow):
             lambda val: self.on_slider_changed('resize_w', val))
         geometric_settings.get_resize_h_slider().valueChanged.connect(
             lambda val: self.on_slider_changed('resize_h', val))
+        # 드래그 중에는 화면 변환으로 미리보기, 놓을 때 실제 처리
+        for slider in (geometric_settings.get_rotation_slider(),
+                       geometric_settings.get_resize_w_slider(),
+                       geometric_settings.get_resize_h_slider()):
+            slider.sliderPressed.connect(self.on_geometric_drag_started)
+            slider.sliderReleased.connect(self.on_geometric_drag_finished)
         
         # File 설정 위젯 연결
         file_settings = panel.get_file_settings()
@@ -508,48 +939,239 @@ class ImageEditor(QMainWindow):
     
     def scan_image_files(self):
         """이미지 파일 스캔 - images 폴더 기준"""
-        extensions = ['*.jpg', '*.jpeg', '*.png', '*.bmp', '*.gif', '*.tiff',
-                      '*.JPG', '*.JPEG', '*.PNG', '*.BMP', '*.GIF', '*.TIFF']
-        self.image_files = []
-        for ext in extensions:
-            # images 폴더 내에서만 검색
-            pattern = os.path.join(self.images_dir, ext)
-            found_files = glob.glob(pattern)
-            self.image_files.extend(found_files)
-        self.image_files = sorted(list(set(self.image_files)))
+        with tracer.span('scan_image_files', 'io'):
+            self.image_files = self.file_loader.list_images(self.images_dir)
+        self._populate_file_list()
+    
+    def _populate_file_list(self):
+        """파일 리스트 업데이트"""
         print(f"스캔된 이미지 파일 수: {len(self.image_files)}")
-        
-        # 파일 리스트 업데이트
         self.file_list.clear()
         for file_path in self.image_files:
             file_name = os.path.basename(file_path)
             item = QListWidgetItem(file_name)
             self.file_list.addItem(item)
     
+    def start_deferred_startup(self):
+        """창을 띄운 뒤 실행하는 시작 작업
+        
+        이전 세션이 있으면 저장된 미리보기와 설정을 바로 표시하고,
+        폴더 스캔과 전체 해상도 디코딩은 백그라운드에서 진행합니다.
+        """
+        self.start_render_worker()
+        self._session = self.session_store.load()
+        preferred_path = None
+        if self._session is not None:
+            preferred_path = self._session['file_path']
+            self._set_states(self._session['button_states'], self._session['trackbar_values'])
+            if self._session['preview'] is not None:
+                self.image_display.set_placeholder(self._session['preview'], self._session['image_size'])
+                self.histogram_widget.set_image(self._session['preview'])
+                self.statusBar().showMessage(f'Restoring: {os.path.basename(preferred_path)}')
+        self.startup_loader.start(self.images_dir, preferred_path)
+    
+    def start_render_worker(self):
+        """렌더 워커 프로세스 실행 (IMAGE_EDITOR_RENDER_WORKER=0 이면 사용하지 않음)
+        
+        워커는 백그라운드에서 준비(cv2 import, 미리 실행)되며, 준비되기 전의 처리는
+        이 프로세스에서 합니다.
+        """
+        if self.render_worker is not None or os.environ.get('IMAGE_EDITOR_RENDER_WORKER') == '0':
+            return
+        from image_processor.render_worker import RenderWorker
+        self.render_worker = RenderWorker(self.render_bridge.result_ready.emit,
+                                          self.render_bridge.worker_failed.emit)
+        self.render_worker.start()
+        memory_budget.register('render_worker', self.render_worker)
+        if self.original_image is not None:
+            self._set_original(self.original_image)
+    
+    def _worker_active(self):
+        """현재 원본을 렌더 워커로 처리할 수 있는지 여부"""
+        return (self.render_worker is not None and self.render_worker.ready
+                and self.original_image is not None and self.original_image is self._worker_source)
+    
+    def _set_original(self, img):
+        """원본 이미지 설정 - 렌더 워커가 있으면 공유 메모리로 옮겨 워커와 함께 사용"""
+        if self.render_worker is not None:
+            img = self.render_worker.set_source(img)
+            self._worker_source = img
+        self.original_image = img
+        self._source_generation += 1
+    
+    def _render_params(self, **overrides):
+        """렌더 워커 요청 설정 (현재 상태)"""
+        params = {
+            'button_states': dict(self.button_states),
+            'trackbar_values': dict(self.trackbar_values),
+            'fast_preview': self.fast_preview,
+            'trace': tracer.enabled,
+            'display_size': (self.image_display.width(), self.image_display.height()),
+        }
+        params.update(overrides)
+        return params
+    
+    def _on_render_result(self, result):
+        """렌더 워커 결과 (GUI 스레드) - 표시만 하고 이미지 연산은 하지 않음"""
+        worker = self.render_worker
+        if worker is None:
+            return  # 워커 실패 후 도착한 결과
+        if result.purpose == 'preview':
+            if self._preview_requested:
+                self._preview_requested = False
+                self._preview_base_shape = result.image.shape
+                self.image_display.begin_preview(result.image, display=(result.display, result.display_scale))
+                self.update_geometric_preview()
+            # 미리보기 pixmap을 만들었으므로 슬롯은 바로 반환
+            worker.release(result)
+            return
+        if result.purpose == 'proxy':
+            if self._proxy_dragging:
+                stages = pipeline.build_stages(self.button_states, self.trackbar_values)
+                full_shape = pipeline.output_shape(stages, self.original_image.shape)
+                self.image_display.set_proxy(result.image, (full_shape[1], full_shape[0]))
+                self.histogram_widget.set_histograms(result.histograms)
+            worker.release(result)
+            return
+        if result.purpose == 'roi':
+            if self.roi_mode and self.roi is not None and self._roi_frame is not None:
+                if result.frame:
+                    tracer.add_remote_frame(result.frame, result.events, result.trace_origin_ns)
+                self._composite_roi(result.image, result.roi, result.histograms)
+            # patch는 프레임에 복사했으므로 슬롯은 바로 반환
+            worker.release(result)
+            return
+        if self.roi_mode and self.processed_image is self._roi_frame:
+            # ROI 처리 전에 보낸 요청의 결과 (ROI 결과를 유지)
+            worker.release(result)
+            return
+        if result.frame:
+            tracer.add_remote_frame(result.frame, result.events, result.trace_origin_ns)
+        previous, self._worker_result = self._worker_result, result
+        self.processed_image = result.image
+        if result.history:
+            with tracer.span('history'):
+                self.file_manager.add_to_history(self.processed_image)
+        if not self._geometric_dragging:
+            # 기하 슬라이더 드래그 중에는 미리보기를 유지 (놓으면 다시 요청함)
+            self.image_display.set_image(result.image, display=(result.display, result.display_scale),
+                                         copy=False)
+            self.histogram_widget.set_histograms(result.histograms)
+        if previous is not None:
+            worker.release(previous)
+        self.update_timing_info()
+    
+    def _on_render_worker_failed(self, message):
+        """렌더 워커 재시작 포기 - 이후 처리는 이 프로세스에서 함"""
+        print(message)
+        worker, self.render_worker = self.render_worker, None
+        self._copy_out_of_render_worker()
+        self._preview_requested = False
+        if worker is not None:
+            memory_budget.unregister('render_worker')
+            worker.stop()
+        self.statusBar().showMessage('Render worker stopped - rendering in-process')
+        self.apply_all_effects()
+
+    def _copy_out_of_render_worker(self):
+        """렌더 워커 공유 메모리의 view를 이 프로세스의 복사본으로 바꿈 (워커를 멈추기 전)
+        원본과 표시 중인 결과는 공유 메모리 슬롯의 view이므로 stop()으로 슬롯을 닫은 뒤에는 읽을 수 없습니다.
+        """
+        if self.original_image is not None and self.original_image is self._worker_source:
+            self.original_image = self.original_image.copy()
+        result = self._worker_result
+        if result is not None and (self.processed_image is result.image
+                                   or self.image_display.image is result.image):
+            image = result.image.copy()
+            if self.processed_image is result.image:
+                self.processed_image = image
+            if self.image_display.image is result.image:
+                # 화면 배율 이미지(result.display)도 슬롯의 view이므로 함께 버림
+                self.image_display.set_image(image, copy=False)
+        self._worker_source = None
+        self._worker_result = None
+    
+    def _on_files_scanned(self, files):
+        """백그라운드 스캔 완료"""
+        self.image_files = files
+        self._populate_file_list()
+        if self.current_file_path in self.image_files:
+            self.file_list.setCurrentRow(self.image_files.index(self.current_file_path))
+        self.update_file_info()
+    
+    def _on_startup_image_decoded(self, file_path, image):
+        """백그라운드 첫 이미지 디코딩 완료"""
+        session, self._session = self._session, None
+        if self.original_image is not None:
+            # 디코딩 중에 사용자가 다른 파일을 이미 열었음
+            return
+        if image is None:
+            self._show_test_image()
+            return
+        states = None
+        if session is not None and session['file_path'] == file_path:
+            # 복원 중에 사용자가 바꾼 설정도 유지 (현재 상태 그대로 적용)
+            states = (self.button_states, self.trackbar_values)
+        self._set_loaded_image(file_path, image, states)
+        if file_path in self.image_files:
+            self.file_list.setCurrentRow(self.image_files.index(file_path))
+        self.statusBar().showMessage('Ready')
+    
+    def _show_test_image(self):
+        """표시할 이미지 파일이 없을 때 테스트 이미지 표시"""
+        test_image = np.zeros((400, 600, 3), dtype=np.uint8)
+        cv2.rectangle(test_image, (50, 50), (550, 350), (100, 150, 200), -1)
+        cv2.putText(test_image, "Test Image - Drag to move", (150, 200),
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+        self._set_original(test_image)
+        self.processed_image = test_image.copy()
+        self.update_image_display()
+    
+    def save_session(self):
+        """현재 파일, 설정, 화면 해상도 미리보기를 세션으로 저장 (종료 시)"""
+        if self.processed_image is None or not self.current_file_path:
+            return False
+        size = (self.image_display.width(), self.image_display.height())
+        return self.session_store.save(self.current_file_path, self.button_states,
+                                       self.trackbar_values, self.processed_image, max_size=size)
+    
     def load_image(self, file_path):
         """이미지 로드"""
-        img = cv2.imread(file_path)
+        img = self.file_loader.load(file_path)
         if img is not None:
-            self.original_image = img
-            self.processed_image = self.original_image.copy()
-            self.current_file_path = file_path
-            self.file_manager.set_current_file(file_path)
-            # 히스토리 초기화 및 첫 이미지 추가
-            self.file_manager.history = [self.original_image.copy()]
-            self.file_manager.history_index = 0
-            self._reset_states()
-            self.update_image_display()
-            self.update_file_info()
+            self._set_loaded_image(file_path, img)
             return True
         return False
     
+    def _set_loaded_image(self, file_path, img, states=None):
+        """읽은 이미지를 현재 이미지로 설정
+        states: (button_states, trackbar_values) - 지정하면 초기화 대신 이 설정으로 처리 (세션 복원)
+        """
+        self._set_original(img)
+        self.processed_image = self.original_image.copy()
+        self._reset_roi()
+        self.current_file_path = file_path
+        self.file_manager.set_current_file(file_path)
+        # 히스토리 초기화 및 첫 이미지 추가
+        self.file_manager.reset_history(self.original_image)
+        if states is None:
+            self._reset_states()
+            self.update_image_display()
+        else:
+            self._set_states(*states)
+            if pipeline.build_stages(self.button_states, self.trackbar_values):
+                self.apply_all_effects()
+            else:
+                self.update_image_display()
+        self.update_file_info()
+    
     def _reset_states(self):
         """상태 초기화"""
-        self.button_states = {k: False for k in self.button_states}
-        self.trackbar_values = {
+        self._set_states({k: False for k in self.button_states}, {
             'brightness': 100,  # 중간값으로 변경
             'contrast': 100,
             'threshold': 127,
+            'clahe': 0,
             'blur': 0,
             'canny_low': 50,
             'canny_high': 150,
@@ -557,28 +1179,40 @@ class ImageEditor(QMainWindow):
             'rotation': 0,
             'resize_w': 100,
             'resize_h': 100
-        }
+        })
+    
+    def _set_states(self, button_states, trackbar_values):
+        """버튼/슬라이더 상태를 한꺼번에 설정 (처리는 하지 않음)
+        알 수 없는 키는 무시합니다 (이전 버전에서 저장한 세션 등).
+        """
+        self.button_states = {k: bool(button_states.get(k, False)) for k in self.button_states}
+        self.trackbar_values = {k: int(trackbar_values.get(k, v)) for k, v in self.trackbar_values.items()}
         
-        # 슬라이더 값 초기화
-        if hasattr(self, 'pixel_settings'):
-            self.pixel_settings.get_brightness_slider().setValue(100)
-            self.pixel_settings.get_contrast_slider().setValue(100)
-            self.pixel_settings.get_threshold_slider().setValue(127)
-            self.pixel_settings.get_grayscale_button().setChecked(False)
-            self.pixel_settings.get_invert_button().setChecked(False)
-        
-        if hasattr(self, 'area_settings'):
-            self.area_settings.get_blur_slider().setValue(0)
-            self.area_settings.get_canny_low_slider().setValue(50)
-            self.area_settings.get_canny_high_slider().setValue(150)
-            self.area_settings.get_sharpen_slider().setValue(0)
-        
-        if hasattr(self, 'geometric_settings'):
-            self.geometric_settings.get_rotation_slider().setValue(0)
-            self.geometric_settings.get_resize_w_slider().setValue(100)
-            self.geometric_settings.get_resize_h_slider().setValue(100)
-            self.geometric_settings.get_flip_h_button().setChecked(False)
-            self.geometric_settings.get_flip_v_button().setChecked(False)
+        # 슬라이더마다 처리하지 않도록 잠시 멈춤 (값 표시 라벨은 그대로 갱신)
+        self._suspend_render = True
+        try:
+            if hasattr(self, 'pixel_settings'):
+                self.pixel_settings.get_brightness_slider().setValue(self.trackbar_values['brightness'])
+                self.pixel_settings.get_contrast_slider().setValue(self.trackbar_values['contrast'])
+                self.pixel_settings.get_threshold_slider().setValue(self.trackbar_values['threshold'])
+                self.pixel_settings.get_clahe_slider().setValue(self.trackbar_values['clahe'])
+                self.pixel_settings.get_grayscale_button().setChecked(self.button_states['grayscale'])
+                self.pixel_settings.get_invert_button().setChecked(self.button_states['invert'])
+            
+            if hasattr(self, 'area_settings'):
+                self.area_settings.get_blur_slider().setValue(self.trackbar_values['blur'])
+                self.area_settings.get_canny_low_slider().setValue(self.trackbar_values['canny_low'])
+                self.area_settings.get_canny_high_slider().setValue(self.trackbar_values['canny_high'])
+                self.area_settings.get_sharpen_slider().setValue(self.trackbar_values['sharpen'])
+            
+            if hasattr(self, 'geometric_settings'):
+                self.geometric_settings.get_rotation_slider().setValue(self.trackbar_values['rotation'])
+                self.geometric_settings.get_resize_w_slider().setValue(self.trackbar_values['resize_w'])
+                self.geometric_settings.get_resize_h_slider().setValue(self.trackbar_values['resize_h'])
+                self.geometric_settings.get_flip_h_button().setChecked(self.button_states['flip_h'])
+                self.geometric_settings.get_flip_v_button().setChecked(self.button_states['flip_v'])
+        finally:
+            self._suspend_render = False
     
     def on_file_selected(self, item):
         """파일 선택 이벤트"""
@@ -625,6 +1259,22 @@ class ImageEditor(QMainWindow):
             self.on_redo_clicked()
         elif action_name == 'Settings':
             self.on_settings_clicked()
+        elif action_name == 'Process Video':
+            self.on_process_video_clicked()
+        elif action_name == 'Fast Preview':
+            self.on_toggle_fast_preview()
+        elif action_name == 'ROI Edit':
+            self.on_toggle_roi_mode()
+        elif action_name == 'Export Gray as BGR':
+            self.on_toggle_export_gray_as_bgr()
+        elif action_name == 'Toggle Trace':
+            self.on_toggle_trace()
+        elif action_name == 'Export Trace':
+            self.on_export_trace()
+        elif action_name == 'Latency Monitor':
+            self.on_toggle_latency_monitor()
+        elif action_name == 'Memory Usage':
+            self.on_show_memory_view()
         elif action_name == 'Exit':
             self.on_exit_clicked()
     
@@ -651,8 +1301,97 @@ class ImageEditor(QMainWindow):
     def on_slider_changed(self, key, value):
         """슬라이더 변경 이벤트"""
         self.trackbar_values[key] = value
+        if self._suspend_render:
+            return
+        if key in self.GEOMETRIC_KEYS and self.image_display.is_previewing():
+            self.update_geometric_preview()
+            return
+        if key in self.GEOMETRIC_KEYS and self._preview_requested:
+            return  # 미리보기 원본을 받으면 현재 값으로 시작
+        if key in self.PROXY_KEYS and self._proxy_dragging:
+            self.update_proxy_preview()
+            return
         self.apply_all_effects()
     
+    def on_geometric_drag_started(self):
+        """기하 슬라이더 드래그 시작 - 기하 변환 직전까지의 결과로 미리보기 시작"""
+        if self.original_image is None:
+            return
+        stages = pipeline.build_stages(self.button_states, self.trackbar_values)
+        head, tail = pipeline.split_geometric_tail(stages)
+        if self._worker_active():
+            self._geometric_dragging = True
+            result = self._worker_result
+            if (not tail and result is not None and self.processed_image is result.image
+                    and result.seq == self._render_seq):
+                # 현재 결과가 곧 기하 변환 직전 결과
+                self._preview_base_shape = result.image.shape
+                self.image_display.begin_preview(result.image, display=(result.display, result.display_scale))
+                self.update_geometric_preview()
+            else:
+                # 워커가 기하 변환 직전 결과를 만들면 미리보기 시작 (_on_render_result)
+                self._preview_requested = True
+                self.render_worker.request(self._render_params(head=True, histograms=False),
+                                           purpose='preview', history=False)
+            return
+        if not tail:
+            # 현재 결과가 곧 기하 변환 직전 결과
+            base = self.processed_image
+        else:
+            with tracer.span('preview_base', 'frame'):
+                base = pipeline.run_stages(self.original_image, head)
+        self._preview_base_shape = base.shape
+        self.image_display.begin_preview(base)
+        self.update_geometric_preview()
+    
+    def update_geometric_preview(self):
+        """현재 기하 슬라이더 값으로 미리보기 변환 갱신 (재표본화 없음)"""
+        stages = pipeline.build_stages(self.button_states, self.trackbar_values)
+        _, tail = pipeline.split_geometric_tail(stages)
+        matrix, size = pipeline.geometric_transform(tail, self._preview_base_shape)
+        self.image_display.set_preview_transform(matrix, size)
+    
+    def on_geometric_drag_finished(self):
+        """기하 슬라이더 놓기 - 실제 회전/크기 조절을 한 번 수행"""
+        dragging, self._geometric_dragging = self._geometric_dragging, False
+        requested, self._preview_requested = self._preview_requested, False
+        if dragging and self._worker_active():
+            # 미리보기는 새 결과가 표시될 때까지 유지
+            self.apply_all_effects()
+        elif self.image_display.is_previewing() or requested:
+            self.image_display.end_preview()
+            self.apply_all_effects()
+    
+    def on_proxy_drag_started(self):
+        """축소 미리보기 슬라이더 드래그 시작"""
+        if self.original_image is not None:
+            self._proxy_dragging = True
+    
+    def update_proxy_preview(self):
+        """화면 크기로 줄인 원본에 현재 설정을 적용하여 표시 (히스토리에 추가하지 않음)"""
+        size = (max(1, self.image_display.width()), max(1, self.image_display.height()))
+        if self._worker_active():
+            # 결과는 _on_render_result ('proxy')
+            self.render_worker.request(self._render_params(proxy=size), purpose='proxy', history=False)
+            return
+        tracer.begin_frame()
+        with tracer.span('proxy_preview', 'frame'):
+            stages = pipeline.build_stages(self.button_states, self.trackbar_values,
+                                           self._source_generation)
+            full_shape = pipeline.output_shape(stages, self.original_image.shape)
+            proxy_stages, _ = pipeline.plan_proxy(stages, self.original_image.shape, size)
+            image = pipeline.run_stages(self.original_image, proxy_stages, ConversionCache())
+            self.image_display.set_proxy(image, (full_shape[1], full_shape[0]))
+            self.histogram_widget.set_image(image)
+        tracer.end_frame()
+        self.update_timing_info()
+    
+    def on_proxy_drag_finished(self):
+        """축소 미리보기 슬라이더 놓기 - 전체 해상도로 한 번 처리 (새 결과가 표시될 때까지 미리보기 유지)"""
+        dragging, self._proxy_dragging = self._proxy_dragging, False
+        if dragging:
+            self.apply_all_effects()
+    
     def on_reset_clicked(self):
         """리셋 버튼 클릭"""
         if self.original_image is not None:
@@ -664,51 +1403,223 @@ class ImageEditor(QMainWindow):
         """모든 효과 적용"""
         if self.original_image is None:
             return
+        if self.roi_mode and self.roi is not None and self._apply_roi_effects():
+            return
+        if self._worker_active():
+            # 렌더 워커에 요청 (처리 중이면 가장 최근 요청만 남음), 결과는 _on_render_result
+            self._render_seq = self.render_worker.request(self._render_params())
+            return
         
-        img = self.original_image.copy()
-        
-        # 버튼 효과
-        if self.button_states['grayscale']:
-            img = pixel_processing.to_grayscale(img)
-        if self.button_states['invert']:
-            img = pixel_processing.apply_invert(img)
-        if self.button_states['flip_h']:
-            img = geometric_processing.apply_flip_horizontal(img)
-        if self.button_states['flip_v']:
-            img = geometric_processing.apply_flip_vertical(img)
-        
-        # 트랙바 효과
-        if self.trackbar_values['brightness'] != 100:
-            img = pixel_processing.apply_brightness(img, self.trackbar_values['brightness'])
-        if self.trackbar_values['contrast'] != 100:
-            img = pixel_processing.apply_contrast(img, self.trackbar_values['contrast'])
-        if self.trackbar_values['blur'] > 0:
-            img = area_processing.apply_blur(img, self.trackbar_values['blur'])
-        if self.trackbar_values['canny_low'] != 50 or self.trackbar_values['canny_high'] != 150:
-            img = area_processing.apply_canny(img, self.trackbar_values['canny_low'],
-                                             self.trackbar_values['canny_high'])
-        if self.trackbar_values['threshold'] != 127:
-            img = pixel_processing.apply_threshold(img, self.trackbar_values['threshold'])
-        if self.trackbar_values['rotation'] != 0:
-            img = geometric_processing.apply_rotation(img, self.trackbar_values['rotation'])
-        
-        # Resize 적용 (퍼센트 값으로 처리)
-        if self.trackbar_values['resize_w'] != 100 or self.trackbar_values['resize_h'] != 100:
-            h, w = img.shape[:2]
-            # 퍼센트를 실제 크기로 변환
-            new_width = int(w * self.trackbar_values['resize_w'] / 100.0)
-            new_height = int(h * self.trackbar_values['resize_h'] / 100.0)
-            img = geometric_processing.apply_resize(img, width=new_width, height=new_height)
-        
-        self.processed_image = img
-        # 히스토리에 추가 (이미지 처리 후)
-        if self.original_image is not None:
-            self.file_manager.add_to_history(self.processed_image)
-        self.update_image_display()
+        tracer.begin_frame()
+        with tracer.span('apply_all_effects', 'frame'):
+            stages = pipeline.build_stages(self.button_states, self.trackbar_values,
+                                           self._source_generation)
+            if self.fast_preview:
+                # 빠른 미리보기: 축소를 앞당겨 처리 화소 수 최소화 (근사)
+                stages = pipeline.plan_fast_preview(stages, self.original_image.shape)
+            cache = ConversionCache()
+            img = pipeline.run_stages(self.original_image, stages, cache, self.buffer_pool)
+            if img is self.original_image:
+                img = img.copy()
+            
+            # 이전 렌더 결과는 더 이상 참조되지 않으므로 풀에 반환
+            # (화면 표시와 히스토리는 각자 복사본을 보관)
+            if self._last_render is not None and self._last_render is not img:
+                self.buffer_pool.release(self._last_render)
+            self.processed_image = img
+            self._last_render = img
+            # 히스토리에 추가 (이미지 처리 후)
+            if self.original_image is not None:
+                with tracer.span('history'):
+                    self.file_manager.add_to_history(self.processed_image)
+        tracer.end_frame()
+        self.update_image_display(rgb=cache.get(img, 'rgb'))
+        self.update_timing_info()
+    
+    def _apply_roi_effects(self):
+        """ROI 편집 - ROI(+주변 halo)만 처리하여 캐시된 전체 프레임에 합성
+        처리 시간과 화면 갱신이 이미지 크기가 아니라 ROI 크기에 비례합니다.
+        렌더 워커가 있으면 워커에서 처리합니다 (결과는 _on_render_result 'roi').
+        워커가 없을 때(시작 전, 재시작 포기 후)만 이 프로세스에서 처리합니다.
+        ROI만 처리할 수 없는 단계(CLAHE)가 있으면 False (전체 처리)
+        대칭, 회전, 크기 조절이 있으면 화면에서 고른 ROI가 원본 좌표가 아니므로 ROI를 해제하고 False
+        """
+        stages = pipeline.build_stages(self.button_states, self.trackbar_values)
+        if pipeline.changes_coordinates(stages):
+            self._flush_roi_history()
+            self._reset_roi()
+            self.statusBar().showMessage('ROI 해제됨 (대칭, 회전, 크기 조절 중에는 ROI 편집 불가)')
+            return False
+        if pipeline.roi_halo(stages) is None:
+            return False
+        original = self.original_image
+        if self._roi_frame is None or self._roi_frame.shape != original.shape:
+            self._roi_frame = original.copy()
+            self._roi_applied = None
+        if self._worker_active():
+            self.render_worker.request(self._render_params(roi=self.roi, display_size=None),
+                                       purpose='roi', history=False)
+            return True
+        
+        tracer.begin_frame()
+        with tracer.span('apply_all_effects', 'frame'):
+            processed = pipeline.process_roi(original, stages, self.roi, ConversionCache())
+        tracer.end_frame()
+        if processed is None:
+            return False
+        self._composite_roi(*processed)
+        return True
+    
+    def _composite_roi(self, patch, roi, histograms=None):
+        """ROI 처리 결과를 캐시된 전체 프레임에 합성하여 표시 (이전 ROI 영역은 원본으로 되돌림)
+        histograms: 렌더 워커가 계산한 히스토그램 (None이면 patch로 계산)
+        """
+        frame, original = self._roi_frame, self.original_image
+        changed = roi
+        previous = self._roi_applied
+        if previous is not None and previous != roi:
+            x, y, w, h = previous
+            frame[y:y + h, x:x + w] = original[y:y + h, x:x + w]
+            x0, y0 = min(x, roi[0]), min(y, roi[1])
+            x1 = max(x + w, roi[0] + roi[2])
+            y1 = max(y + h, roi[1] + roi[3])
+            changed = (x0, y0, x1 - x0, y1 - y0)
+        patch = pipeline.paste_roi(frame, patch, roi)
+        self._roi_applied = roi
+        
+        self.processed_image = frame
+        self.image_display.update_region(frame, changed)
+        if histograms is not None:
+            self.histogram_widget.set_histograms(histograms)
+        else:
+            self.histogram_widget.set_image(patch)
+        if self._worker_result is not None and self.render_worker is not None:
+            # 표시 중이던 워커 결과를 더 이상 참조하지 않으므로 슬롯 반환
+            self.render_worker.release(self._worker_result)
+            self._worker_result = None
+        self._roi_history_timer.start()
+        self.update_timing_info()
+    
+    def _commit_roi_history(self):
+        """ROI 편집 결과를 히스토리에 추가 (변경이 멈춘 뒤 한 번)"""
+        self._roi_history_timer.stop()
+        if self._roi_frame is not None and self.processed_image is self._roi_frame:
+            with tracer.span('history'):
+                self.file_manager.add_to_history(self._roi_frame)
+    
+    def _flush_roi_history(self):
+        """아직 히스토리에 추가하지 않은 ROI 편집 결과가 있으면 바로 추가 (되돌리기 전)"""
+        if self._roi_history_timer.isActive():
+            self._commit_roi_history()
+    
+    def _reset_roi(self):
+        """ROI 선택과 캐시된 프레임 제거 (새 이미지, ROI 편집 끄기)"""
+        self._roi_history_timer.stop()
+        self.roi = None
+        self._roi_frame = None
+        self._roi_applied = None
+        self.image_display.set_roi(None)
+    
+    def on_toggle_roi_mode(self):
+        """ROI 편집 켜기/끄기 - 켜면 화면에서 드래그로 ROI를 고르고, 효과는 ROI에만 적용"""
+        self.roi_mode = not self.roi_mode
+        self.image_display.roi_selecting = self.roi_mode
+        if self.roi_mode:
+            self.statusBar().showMessage('ROI Edit: ON (이미지에서 드래그하여 영역 선택)')
+            return
+        self._flush_roi_history()
+        self._reset_roi()
+        self.statusBar().showMessage('ROI Edit: OFF')
+        self.apply_all_effects()
+    
+    def on_roi_selected(self, roi):
+        """화면에서 ROI를 고름"""
+        if not self.roi_mode or self.original_image is None:
+            return
+        if pipeline.changes_coordinates(pipeline.build_stages(self.button_states, self.trackbar_values)):
+            # 표시 중인 결과의 좌표가 원본 좌표와 다름
+            self.image_display.set_roi(None)
+            self.statusBar().showMessage('ROI Edit: 대칭, 회전, 크기 조절을 끈 뒤 영역을 선택하세요')
+            return
+        self.roi = tuple(int(v) for v in roi)
+        self.statusBar().showMessage(f'ROI: {self.roi[2]}x{self.roi[3]} at ({self.roi[0]}, {self.roi[1]})')
+        self.apply_all_effects()
+    
+    def get_export_image(self):
+        """저장할 이미지 반환 (이 프로세스에서 처리) - 빠른 미리보기 결과는 정확한 순서로 다시 처리"""
+        if (self.fast_preview and self.original_image is not None
+                and self.processed_image is self._last_render):
+            return self._render_export_in_process()
+        return self.processed_image
     
-    def update_image_display(self):
-        """이미지 표시 업데이트"""
-        self.image_display.set_image(self.processed_image)
+    def _render_export_in_process(self):
+        """현재 설정을 정확한 순서로 이 프로세스에서 처리"""
+        stages = pipeline.build_stages(self.button_states, self.trackbar_values,
+                                       self._source_generation)
+        with tracer.span('export_render', 'frame'):
+            return pipeline.run_stages(self.original_image, stages)
+    
+    def export_image(self, on_ready):
+        """저장할 이미지를 준비하여 on_ready(image) 호출
+        빠른 미리보기 결과이거나 최신 설정의 결과가 아직 없으면 렌더 워커에서 정확히 다시 처리합니다.
+        워커를 기다리는 동안 GUI 스레드는 멈추지 않고 취소할 수 있는 진행 대화상자를 표시합니다.
+        취소하면 on_ready를 호출하지 않습니다.
+        """
+        result = self._worker_result
+        if not (self._worker_active() and result is not None and self.processed_image is result.image
+                and (self.fast_preview or result.seq != self._render_seq)):
+            on_ready(self.get_export_image())
+            return
+        if self._export_cancel is not None:
+            return  # 이미 저장할 이미지를 처리 중
+        worker = self.render_worker
+        params = self._render_params(fast_preview=False)
+        fast_preview = self.fast_preview
+        cancel = threading.Event()
+        holder = {}
+        
+        def run():
+            holder['image'] = worker.render_sync(params, self.EXPORT_TIMEOUT_S, cancel)
+        
+        thread = threading.Thread(target=run, name='export-render', daemon=True)
+        dialog = QProgressDialog('저장할 이미지를 처리하는 중...', '취소', 0, 0, self)
+        dialog.setWindowTitle('저장')
+        dialog.setWindowModality(Qt.WindowModal)  # 처리 중 설정 변경 방지 (화면은 계속 갱신)
+        dialog.setMinimumDuration(self.EXPORT_DIALOG_DELAY_MS)
+        dialog.canceled.connect(cancel.set)
+        self._export_cancel = cancel
+        thread.start()
+        
+        timer = QTimer(self)
+        timer.timeout.connect(
+            lambda: self._poll_export(thread, holder, cancel, dialog, timer, fast_preview, on_ready))
+        timer.start(50)
+    
+    def _poll_export(self, thread, holder, cancel, dialog, timer, fast_preview, on_ready):
+        """저장할 이미지 처리 완료 확인 (GUI 스레드에서 주기적으로)"""
+        if thread.is_alive():
+            return
+        timer.stop()
+        timer.deleteLater()
+        dialog.reset()
+        dialog.deleteLater()
+        self._export_cancel = None
+        if cancel.is_set():
+            self.statusBar().showMessage('저장 취소됨')
+            return
+        image = holder.get('image')
+        if image is None:
+            # 워커에서 처리하지 못함 (시간 초과, 워커 실패) - 이 프로세스에서 처리
+            print("렌더 워커에서 저장할 이미지를 처리하지 못해 이 프로세스에서 처리합니다")
+            image = self._render_export_in_process() if fast_preview else self.processed_image
+        on_ready(image)
+    
+    def update_image_display(self, rgb=None):
+        """이미지 표시 업데이트
+        rgb: 처리 중 변환 캐시에 만들어진 표시용 RGB (선택)
+        """
+        self.image_display.set_image(self.processed_image, rgb)
+        self.histogram_widget.set_image(self.processed_image)
     
     def update_file_info(self):
         """파일 정보 업데이트"""
@@ -727,28 +1638,48 @@ class ImageEditor(QMainWindow):
         else:
             self.info_label.setText(f"File: No Image | Size: {len(self.image_files)} files")
     
+    def update_timing_info(self):
+        """정보 바에 마지막 렌더의 단계별 소요 시간 표시"""
+        if not tracer.enabled:
+            self.timing_label.setText('')
+            return
+        text = tracer.format_last_frame()
+        paint_ms = tracer.last_durations.get('paint')
+        if paint_ms is not None:
+            text = f"{text} | Paint {paint_ms:.1f}ms" if text else f"Paint {paint_ms:.1f}ms"
+        self.timing_label.setText(text)
+    
     def on_save_clicked(self):
         """저장하기 버튼 클릭"""
         if self.processed_image is not None and self.current_file_path:
-            if self.file_saver.save(self.processed_image, self.current_file_path):
-                QMessageBox.information(self, "저장 완료", "파일이 저장되었습니다.")
-            else:
-                QMessageBox.warning(self, "저장 실패", "파일 저장에 실패했습니다.")
+            path = self.current_file_path
+            self.export_image(lambda image: self._save_exported(image, path))
         else:
             QMessageBox.warning(self, "저장 불가", "저장할 이미지가 없습니다.")
     
+    def _save_exported(self, image, path):
+        """준비된 이미지를 현재 파일에 저장"""
+        if self.file_saver.save(image, path, self.export_gray_as_bgr):
+            QMessageBox.information(self, "저장 완료", "파일이 저장되었습니다.")
+        else:
+            QMessageBox.warning(self, "저장 실패", "파일 저장에 실패했습니다.")
+    
     def on_save_as_clicked(self):
         """다른이름으로 저장하기 버튼 클릭"""
         if self.processed_image is not None:
-            saved_path = self.file_saver.save_as(self.processed_image, self.current_file_path)
-            if saved_path:
-                self.current_file_path = saved_path
-                self.file_manager.set_current_file(saved_path)
-                self.update_file_info()
-                QMessageBox.information(self, "저장 완료", "파일이 저장되었습니다.")
+            self.export_image(self._save_exported_as)
         else:
             QMessageBox.warning(self, "저장 불가", "저장할 이미지가 없습니다.")
     
+    def _save_exported_as(self, image):
+        """준비된 이미지를 다른 이름으로 저장"""
+        saved_path = self.file_saver.save_as(image, self.current_file_path, self.export_gray_as_bgr)
+        if saved_path:
+            self.current_file_path = saved_path
+            self.file_manager.set_current_file(saved_path)
+            self.update_file_info()
+            QMessageBox.information(self, "저장 완료", "파일이 저장되었습니다.")
+    
     def on_load_clicked(self):
         """불러오기 버튼 클릭 - 파일을 images 폴더로 복사 후 로드"""
         file_path, image = self.file_loader.load_from_dialog(self.current_file_path)
@@ -782,6 +1713,7 @@ class ImageEditor(QMainWindow):
     
     def on_undo_clicked(self):
         """되돌리기 버튼 클릭"""
+        self._flush_roi_history()
         if self.history_manager.can_undo():
             image = self.history_manager.undo()
             if image is not None:
@@ -792,6 +1724,7 @@ class ImageEditor(QMainWindow):
     
     def on_redo_clicked(self):
         """앞으로 돌리기 버튼 클릭"""
+        self._flush_roi_history()
         if self.history_manager.can_redo():
             image = self.history_manager.redo()
             if image is not None:
@@ -804,6 +1737,122 @@ class ImageEditor(QMainWindow):
         """설정하기 버튼 클릭"""
         self.settings_manager.show_settings_dialog()
     
+    def on_process_video_clicked(self):
+        """현재 설정을 동영상/GIF/이미지 시퀀스에 적용하여 저장"""
+        from image_processor import video_processing
+        
+        if self.video_processor is not None:
+            reply = QMessageBox.question(
+                self, "동영상 처리", "동영상을 처리 중입니다. 중단하시겠습니까?",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+            if reply == QMessageBox.Yes:
+                self.video_processor.cancel()
+            return
+        
+        input_path, _ = QFileDialog.getOpenFileName(
+            self, "동영상 불러오기", self.images_dir,
+            "Video Files (*.mp4 *.avi *.mov *.mkv *.webm *.gif);;"
+            "Image Sequence (*.png *.jpg *.jpeg *.bmp *.tiff);;All Files (*)")
+        if not input_path:
+            return
+        output_path, _ = QFileDialog.getSaveFileName(
+            self, "동영상 저장", os.path.splitext(input_path)[0] + '_edited.mp4',
+            "Video Files (*.mp4 *.avi);;All Files (*)")
+        if not output_path:
+            return
+        
+        # 이미지 시퀀스의 파일 1개를 고르면 번호 패턴으로 변환
+        input_path = video_processing.sequence_pattern_from_file(input_path)
+        stages = pipeline.build_stages(self.button_states, self.trackbar_values)
+        processor = video_processing.VideoStreamProcessor(stages)
+        result = {}
+        
+        def run():
+            result['stats'] = processor.process(input_path, output_path)
+        
+        thread = threading.Thread(target=run, name='video-process', daemon=True)
+        self.video_processor = processor
+        thread.start()
+        
+        # 진행 상황 표시 (GUI 스레드에서 주기적으로 확인)
+        self._video_timer = QTimer(self)
+        self._video_timer.timeout.connect(lambda: self._poll_video_progress(thread, result))
+        self._video_timer.start(200)
+    
+    def _poll_video_progress(self, thread, result):
+        """동영상 처리 진행 상황 갱신 및 완료 처리"""
+        processor = self.video_processor
+        if thread.is_alive():
+            total = f"/{processor.frames_total}" if processor.frames_total else ''
+            self.statusBar().showMessage(f'Video: {processor.frames_done}{total} frames')
+            return
+        
+        self._video_timer.stop()
+        self._video_timer = None
+        self.video_processor = None
+        stats = result.get('stats')
+        if stats is None:
+            QMessageBox.warning(self, "동영상 처리 실패", "동영상 처리에 실패했습니다.")
+        else:
+            self.statusBar().showMessage(
+                f"Video: {stats['frames']} frames, {stats['seconds']:.1f} s, "
+                f"{stats['fps']:.1f} frames/s" + (' (중단됨)' if stats['cancelled'] else ''))
+    
+    def on_toggle_fast_preview(self):
+        """빠른 미리보기 켜기/끄기"""
+        self.fast_preview = not self.fast_preview
+        state = 'ON' if self.fast_preview else 'OFF'
+        self.statusBar().showMessage(f'Fast Preview: {state} (저장은 항상 정확한 순서로 처리)')
+        self.apply_all_effects()
+    
+    def on_toggle_export_gray_as_bgr(self):
+        """1채널 결과를 BGR 3채널로 확장하여 저장할지 전환"""
+        self.export_gray_as_bgr = not self.export_gray_as_bgr
+        state = 'ON' if self.export_gray_as_bgr else 'OFF'
+        self.statusBar().showMessage(f'Export Gray as BGR: {state} (처리와 표시는 항상 1채널로 유지)')
+    
+    def on_toggle_trace(self):
+        """추적 활성화/비활성화 전환"""
+        tracer.set_enabled(not tracer.enabled)
+        state = 'ON' if tracer.enabled else 'OFF'
+        self.statusBar().showMessage(f'Trace: {state}')
+        self.update_timing_info()
+    
+    def on_export_trace(self):
+        """Chrome/Perfetto 트레이스 JSON 내보내기"""
+        if not tracer.events:
+            QMessageBox.information(self, "트레이스", "기록된 트레이스가 없습니다. 먼저 Toggle Trace로 추적을 켜세요.")
+            return
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "트레이스 저장", "trace.json", "Trace Files (*.json);;All Files (*)")
+        if file_path:
+            if tracer.export_chrome_trace(file_path):
+                self.statusBar().showMessage(f'Trace saved: {file_path}')
+            else:
+                QMessageBox.warning(self, "저장 실패", "트레이스 저장에 실패했습니다.")
+    
+    def on_toggle_latency_monitor(self):
+        """입력-화면 지연 모니터 켜기/끄기 (오버레이 + CSV 로그)"""
+        if self.latency_monitor.enabled:
+            summary = self.latency_monitor.summary_text()
+            self.latency_monitor.stop()
+            self.statusBar().showMessage(f'Latency Monitor: OFF | {summary}')
+        else:
+            log_path = os.path.join(os.path.dirname(self.images_dir), 'logs', 'latency.csv')
+            self.latency_monitor.reset()
+            self.latency_monitor.start(csv_path=log_path, overlay=True)
+            self.statusBar().showMessage(f'Latency Monitor: ON | Log: {log_path}')
+        self.image_display.update()
+    
+    def on_show_memory_view(self):
+        """하위 시스템별 메모리 사용량 창 표시 (디버그용)"""
+        if self.memory_view is None:
+            from image_processor.UI.memory_view import MemoryView
+            self.memory_view = MemoryView(self)
+            self.memory_view.resize(360, 240)
+        self.memory_view.show()
+        self.memory_view.raise_()
+    
     def on_exit_clicked(self):
         """종료하기 버튼 클릭"""
         reply = QMessageBox.question(
@@ -812,11 +1861,71 @@ class ImageEditor(QMainWindow):
             QMessageBox.No
         )
         if reply == QMessageBox.Yes:
+            self.save_session()
+            if self.render_worker is not None:
+                self.render_worker.stop()
             file_operations.ApplicationManager.exit_application()
+    
+    def closeEvent(self, event):
+        """창 닫기 - 마지막 세션 저장, 렌더 워커 종료"""
+        self.save_session()
+        if self.render_worker is not None:
+            self.render_worker.stop()
+        super().closeEvent(event)
+
+
+class StartupProbe(QObject):
+    """시작 시간 측정기 (단일 책임: 실행 시점부터 첫 페인트/첫 이미지 표시까지의 시간 측정)
+
+    IMAGE_EDITOR_STARTUP_PROBE=<실행 시각(time.time())> 환경 변수로 활성화되며,
+    전체 해상도 이미지가 그려지면 결과를 한 줄로 출력하고 창을 닫습니다 (benchmarks.startup_time).
+    first_image는 세션 복원 미리보기를 포함한 첫 이미지, full_image는 전체 해상도 이미지입니다.
+    창을 닫을 때 세션이 저장되므로 다음 실행은 세션 복원 경로를 측정합니다.
+    """
+    
+    def __init__(self, app, editor, launch_time):
+        super().__init__(editor)
+        import time
+        self._time = time.time
+        self.app = app
+        self.editor = editor
+        self.launch_time = launch_time
+        self.first_paint = None
+        self.first_image = None
+        editor.image_display.installEventFilter(self)
+    
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            # 페인트 처리가 끝난 뒤 기록
+            QTimer.singleShot(0, self._on_painted)
+        return False
+    
+    def _on_painted(self):
+        """페인트 완료 기록 - 전체 해상도 이미지가 표시되었으면 결과 출력 후 종료"""
+        if self.editor is None:
+            return  # 이미 종료 처리됨 (대기 중이던 타이머)
+        elapsed = self._time() - self.launch_time
+        if self.first_paint is None:
+            self.first_paint = elapsed
+        if self.first_image is None and self.editor.image_display.has_image():
+            self.first_image = elapsed
+        if self.editor.image_display.image is not None:
+            print(f"STARTUP first_paint={self.first_paint:.4f} first_image={self.first_image:.4f} "
+                  f"full_image={elapsed:.4f}", flush=True)
+            self.editor.image_display.removeEventFilter(self)
+            editor, self.editor = self.editor, None
+            editor.close()
 
 
 def main():
-    """메인 함수"""
+    """메인 함수
+    
+    사용법: python main.py [이미지 폴더]
+    """
+    # 렌더 워커 프로세스 실행 지원 (PyInstaller EXE)
+    import multiprocessing
+    multiprocessing.freeze_support()
+    
     app = QApplication(sys.argv)
     
     # 다크 테마 스타일
@@ -826,22 +1935,17 @@ def main():
     palette.setColor(palette.WindowText, Qt.white)
     app.setPalette(palette)
     
-    editor = ImageEditor()
+    images_dir = sys.argv[1] if len(sys.argv) > 1 and os.path.isdir(sys.argv[1]) else None
+    editor = ImageEditor(images_dir=images_dir)
+    
+    # 시작 시간 측정 (benchmarks.startup_time)
+    if os.environ.get('IMAGE_EDITOR_STARTUP_PROBE'):
+        editor._startup_probe = StartupProbe(app, editor, float(os.environ['IMAGE_EDITOR_STARTUP_PROBE']))
+    
     editor.show()
     
-    # 첫 번째 이미지 자동 로드
-    if len(editor.image_files) > 0:
-        editor.load_image(editor.image_files[0])
-        editor.file_list.setCurrentRow(0)
-    else:
-        # 테스트 이미지 생성
-        test_image = np.zeros((400, 600, 3), dtype=np.uint8)
-        cv2.rectangle(test_image, (50, 50), (550, 350), (100, 150, 200), -1)
-        cv2.putText(test_image, "Test Image - Drag to move", (150, 200),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
-        editor.original_image = test_image
-        editor.processed_image = test_image.copy()
-        editor.update_image_display()
+    # 이전 세션 미리보기를 바로 표시하고, 폴더 스캔과 첫 이미지 디코딩은 백그라운드에서 진행
+    editor.start_deferred_startup()
     
     sys.exit(app.exec_())
 
@@ -0,0 +1,50 @@
+"""
+블러 엔진 테스트
+ROI만 처리한 결과가 전체 처리 결과의 같은 부분과 같고, 방식 선택이 측정과 관계없이 고정인지 확인
+
+사용법 (02_ImageEditor_Code 폴더에서):
+    python -m pytest tests
+"""
+
+import numpy as np
+import pytest
+
+from benchmarks.common import make_synthetic_image
+from image_processor import pipeline
+from image_processor.blur import DEFAULT_COSTS, BlurEngine
+
+WIDTH, HEIGHT = 960, 540
+
+
+@pytest.fixture(scope='module')
+def image():
+    return make_synthetic_image(WIDTH, HEIGHT)
+
+
+@pytest.mark.parametrize('radius', [4, 15, 30, 60, 200])
+@pytest.mark.parametrize('roi', [(400, 200, 64, 48), (0, 0, 100, 80), (900, 500, 60, 40),
+                                 (17, 333, 5, 7)])
+def test_roi_matches_full_render(image, radius, roi):
+    """가장자리의 작은 ROI는 처리 영역이 작아 피라미드 단계 수가 달라질 수 있음 - 전체 기준 방식 사용"""
+    stages = pipeline.build_stages_from_recipe({'trackbar_values': {'blur': radius, 'brightness': 120}})
+    full = pipeline.run_stages(image, stages)
+    patch, (x, y, w, h) = pipeline.process_roi(image, stages, roi)
+    assert np.array_equal(patch, full[y:y + h, x:x + w])
+
+
+def test_frame_stages_fix_blur_plan():
+    engine = BlurEngine()
+    stages = pipeline.build_stages_from_recipe({'trackbar_values': {'blur': 60}})
+    planned = pipeline.frame_stages(stages, (HEIGHT, WIDTH, 3))
+    method, levels = engine.plan(60, (HEIGHT, WIDTH, 3))
+    assert planned[0].params == {'value': 60, 'method': method, 'levels': levels}
+    assert 'method' not in stages[0].params
+
+
+def test_calibrate_does_not_change_selection():
+    engine = BlurEngine()
+    before = [engine.plan(radius, (HEIGHT, WIDTH)) for radius in (2, 10, 30, 100)]
+    measured = engine.calibrate(size=128, repeat=1)
+    assert set(measured) == set(DEFAULT_COSTS)
+    assert engine.costs == DEFAULT_COSTS
+    assert [engine.plan(radius, (HEIGHT, WIDTH)) for radius in (2, 10, 30, 100)] == before
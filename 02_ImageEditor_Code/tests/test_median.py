@@ -0,0 +1,27 @@
+"""
+미디언 필터 테스트
+띠로 나누어 처리한 결과가 cv2.medianBlur를 한 번 호출한 결과와 같은지 확인
+
+사용법 (02_ImageEditor_Code 폴더에서):
+    python -m pytest tests
+"""
+
+import cv2
+import numpy as np
+import pytest
+
+from image_processor import median
+from image_processor.median import MedianFilter
+
+
+@pytest.mark.parametrize('channels', [1, 3])
+@pytest.mark.parametrize('kernel_size', [3, 5, 7, 15, 31])
+def test_bands_match_median_blur(monkeypatch, channels, kernel_size):
+    monkeypatch.setattr(median, 'PARALLEL_MIN_PIXELS', 0)
+    monkeypatch.setattr(median, 'HISTOGRAM_MIN_BAND_PIXELS', ())
+    rng = np.random.default_rng(kernel_size)
+    shape = (700, 300) if channels == 1 else (700, 300, 3)
+    img = rng.integers(0, 256, shape, dtype=np.uint8)
+    median_filter = MedianFilter(workers=4)
+    assert len(median_filter._bands(img.shape, kernel_size)) > 1
+    assert np.array_equal(median_filter.apply(img, kernel_size), cv2.medianBlur(img, kernel_size))
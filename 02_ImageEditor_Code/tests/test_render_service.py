@@ -0,0 +1,79 @@
+"""
+렌더 서비스 테스트
+같은 크기 요청의 배치가 빈 워커들에 나뉘어 처리되어 배치 때문에 지연(p99)이 늘지 않는지 확인
+
+사용법 (02_ImageEditor_Code 폴더에서):
+    python -m pytest tests
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from image_processor import pipeline
+from image_processor.render_service import RenderService
+
+WORKERS = 4
+REQUESTS = 24
+STAGE_SECONDS = 0.1
+
+
+@pytest.fixture
+def slow_stages(monkeypatch):
+    """처리 단계를 STAGE_SECONDS 걸리는 처리로 바꾸고 동시에 처리 중인 요청 수의 최댓값 기록"""
+    state = {'running': 0, 'peak': 0}
+    lock = threading.Lock()
+
+    def run_stages(img, stages, cache=None, pool=None):
+        with lock:
+            state['running'] += 1
+            state['peak'] = max(state['peak'], state['running'])
+        time.sleep(STAGE_SECONDS)
+        with lock:
+            state['running'] -= 1
+        return img
+
+    monkeypatch.setattr(pipeline, 'run_stages', run_stages)
+    return state
+
+
+def _burst(max_batch):
+    """동시에 REQUESTS개 요청 - (전체 시간 s, 서비스 지표)"""
+    service = RenderService(workers=WORKERS, max_batch=max_batch)
+    image = np.zeros((64, 64, 3), np.uint8)
+    recipe = {'trackbar_values': {'brightness': 130}}
+    barrier = threading.Barrier(REQUESTS + 1)
+
+    def client():
+        barrier.wait()
+        service.render(image, recipe, timeout=10)
+
+    threads = [threading.Thread(target=client) for _ in range(REQUESTS)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    metrics = service.metrics()
+    service.close()
+    return elapsed, metrics
+
+
+def test_batch_uses_all_workers(slow_stages):
+    elapsed, metrics = _burst(max_batch=8)
+    assert metrics['requests'] == REQUESTS and metrics['errors'] == 0
+    assert slow_stages['peak'] == WORKERS
+    # 4개 워커가 모두 일하면 24개 요청은 6번의 처리 시간이면 끝남 (한 워커가 배치를 차례로 처리하면 8번 이상)
+    assert elapsed < STAGE_SECONDS * (REQUESTS / WORKERS + 1.5)
+
+
+def test_batching_does_not_regress_p99(slow_stages):
+    _, unbatched = _burst(max_batch=1)
+    _, batched = _burst(max_batch=8)
+    assert batched['mean_batch_size'] > 1
+    # 배치 없이 처리할 때보다 꼬리 지연이 처리 1번 이상 늘지 않음
+    assert batched['latency_ms']['p99'] <= unbatched['latency_ms']['p99'] + STAGE_SECONDS * 1000 * 0.5
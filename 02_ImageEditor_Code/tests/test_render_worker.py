@@ -0,0 +1,75 @@
+"""
+렌더 워커 테스트
+워커 프로세스 없이 가짜 연결로 응답을 흉내 내어 저장(render_sync) 요청의 응답 처리를 확인
+
+사용법 (02_ImageEditor_Code 폴더에서):
+    python -m pytest tests
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from image_processor import pipeline
+from image_processor.render_worker import RenderWorker
+
+PARAMS = {'button_states': dict(pipeline.DEFAULT_BUTTON_STATES),
+          'trackbar_values': dict(pipeline.DEFAULT_TRACKBAR_VALUES, brightness=120)}
+
+
+class _FakeConn:
+    """워커 프로세스 대신 보낸 메시지를 보관하는 연결"""
+
+    def __init__(self):
+        self.sent = []
+
+    def send(self, message):
+        self.sent.append(message)
+
+
+@pytest.fixture
+def worker():
+    worker = RenderWorker(on_result=lambda result: None)
+    worker._conn = _FakeConn()
+    worker.set_source(np.zeros((32, 48, 3), np.uint8))
+    yield worker
+    worker.stop()
+
+
+def _start_export(worker):
+    """백그라운드 스레드에서 render_sync 실행 - (스레드, 결과 보관 dict, 보낸 메시지)"""
+    holder = {}
+    thread = threading.Thread(target=lambda: holder.setdefault('image', worker.render_sync(PARAMS, 5.0)))
+    thread.start()
+    deadline = time.monotonic() + 5.0
+    while not worker._conn.sent and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return thread, holder, worker._conn.sent[-1]
+
+
+def test_export_resize_after_source_change_falls_back(worker, capsys):
+    """저장 중에 원본이 바뀐 뒤 'resize' 응답 - KeyError 없이 None (호출자가 이 프로세스에서 처리)"""
+    thread, holder, message = _start_export(worker)
+    worker.set_source(np.ones((64, 64, 3), np.uint8))
+    worker._on_reply({'seq': message['seq'], 'resize': 1 << 20})
+    thread.join(5.0)
+    assert not thread.is_alive()
+    assert holder['image'] is None
+    assert '원본이 바뀌어' in capsys.readouterr().out
+    assert worker._in_flight is None
+    assert len(worker._conn.sent) == 1
+
+
+def test_export_resize_same_source_resends(worker):
+    thread, holder, message = _start_export(worker)
+    worker._on_reply({'seq': message['seq'], 'resize': 1 << 20})
+    assert len(worker._conn.sent) == 2
+    resent = worker._conn.sent[-1]
+    assert resent['seq'] == message['seq'] and resent['output'][1] >= 1 << 20
+    expected = np.arange(32 * 48 * 3, dtype=np.uint8).reshape(32, 48, 3)
+    np.copyto(worker._export.view(expected.shape, expected.dtype), expected)
+    worker._on_reply({'seq': message['seq'], 'shape': expected.shape, 'dtype': expected.dtype.str})
+    thread.join(5.0)
+    assert np.array_equal(holder['image'], expected)
@@ -0,0 +1,144 @@
+"""
+워프 엔진 테스트
+편집기 경로(기본)는 cv2.warpAffine/warpPerspective와 같고, cache_maps=True 경로는
+고정소수점 좌표표 remap 결과를 호출마다 같게 내는지 확인
+
+사용법 (02_ImageEditor_Code 폴더에서):
+    python -m pytest tests
+"""
+
+import cv2
+import numpy as np
+import pytest
+
+from image_processor import pipeline
+from image_processor.geometric_processing import apply_rotation, get_rotation_matrix
+from image_processor.warp import WarpEngine, build_maps
+
+WIDTH, HEIGHT = 640, 384
+
+
+def _image(channels, seed=0):
+    rng = np.random.default_rng(seed)
+    shape = (HEIGHT, WIDTH) if channels == 1 else (HEIGHT, WIDTH, channels)
+    return rng.integers(0, 256, shape, dtype=np.uint8)
+
+
+def _homography():
+    corners = np.float32([[0, 0], [WIDTH - 1, 0], [WIDTH - 1, HEIGHT - 1], [0, HEIGHT - 1]])
+    skewed = corners + np.float32([[0.05, 0.03], [-0.08, 0], [0, 0], [0.04, -0.06]]) * [WIDTH, HEIGHT]
+    return cv2.getPerspectiveTransform(corners, skewed.astype(np.float32))
+
+
+def _converted_maps(matrix, size, interpolation, perspective=False):
+    """OpenCV의 좌표표 변환(convertMaps)으로 만든 기준 고정소수점 좌표표"""
+    width, height = size
+    inverse = np.linalg.inv(np.vstack([matrix, (0, 0, 1)]) if not perspective else matrix)
+    xs, ys = np.meshgrid(np.arange(width, dtype=np.float64), np.arange(height, dtype=np.float64))
+    x = inverse[0, 0] * xs + inverse[0, 1] * ys + inverse[0, 2]
+    y = inverse[1, 0] * xs + inverse[1, 1] * ys + inverse[1, 2]
+    if perspective:
+        w = inverse[2, 0] * xs + inverse[2, 1] * ys + inverse[2, 2]
+        x, y = x / w, y / w
+    return cv2.convertMaps(x.astype(np.float32), y.astype(np.float32), cv2.CV_16SC2,
+                           nninterpolation=interpolation == cv2.INTER_NEAREST)
+
+
+def _remap(img, maps, interpolation):
+    return cv2.remap(img, maps[0], maps[1], interpolation,
+                     borderMode=cv2.BORDER_CONSTANT, borderValue=(0, 0, 0))
+
+
+@pytest.mark.parametrize('channels', [1, 3, 4])
+@pytest.mark.parametrize('interpolation', [cv2.INTER_NEAREST, cv2.INTER_LINEAR, cv2.INTER_CUBIC])
+def test_editor_path_matches_warp_affine(channels, interpolation):
+    """cache_maps 없이는 매번 cv2.warpAffine과 같고 좌표표를 만들지 않음"""
+    img = _image(channels)
+    matrix, size = get_rotation_matrix(HEIGHT, WIDTH, 30)
+    engine = WarpEngine()
+    direct = cv2.warpAffine(img, matrix, size, flags=interpolation)
+    for _ in range(3):
+        assert np.array_equal(engine.warp_affine(img, matrix, size, interpolation=interpolation), direct)
+    assert engine.memory_usage() == 0
+
+
+def test_editor_path_matches_warp_perspective():
+    img = _image(3)
+    homography = _homography()
+    engine = WarpEngine()
+    direct = cv2.warpPerspective(img, homography, (WIDTH, HEIGHT), flags=cv2.INTER_LINEAR)
+    assert np.array_equal(engine.warp_perspective(img, homography, (WIDTH, HEIGHT)), direct)
+    assert engine.memory_usage() == 0
+
+
+@pytest.mark.parametrize('interpolation', [cv2.INTER_NEAREST, cv2.INTER_LINEAR])
+@pytest.mark.parametrize('angle, scale', [(30, 1.0), (7.3, 0.8), (-45, 1.3)])
+def test_build_maps_matches_convert_maps(interpolation, angle, scale):
+    matrix = cv2.getRotationMatrix2D((WIDTH / 2, HEIGHT / 2), angle, scale)
+    img = _image(3)
+    expected = _remap(img, _converted_maps(matrix, (WIDTH, HEIGHT), interpolation), interpolation)
+    remapped = _remap(img, build_maps(matrix, (WIDTH, HEIGHT), interpolation), interpolation)
+    assert np.array_equal(remapped, expected)
+
+
+def test_build_maps_perspective_matches_convert_maps():
+    homography = _homography()
+    img = _image(3)
+    expected = _remap(img, _converted_maps(homography, (WIDTH, HEIGHT), cv2.INTER_LINEAR, True),
+                      cv2.INTER_LINEAR)
+    remapped = _remap(img, build_maps(homography, (WIDTH, HEIGHT)), cv2.INTER_LINEAR)
+    assert np.array_equal(remapped, expected)
+
+
+@pytest.mark.parametrize('channels', [1, 3])
+def test_cached_maps_are_deterministic(channels):
+    """cache_maps=True는 첫 호출부터 같은 좌표표로 처리하고, 제거 후 다시 만들어도 결과가 같음"""
+    img = _image(channels)
+    matrix, size = get_rotation_matrix(HEIGHT, WIDTH, 30)
+    engine = WarpEngine()
+    first = engine.warp_affine(img, matrix, size, cache_maps=True)
+    assert engine.is_cached(img, matrix, size)
+    assert np.array_equal(first, _remap(img, build_maps(matrix, size), cv2.INTER_LINEAR))
+    # 직접 변환과는 좌표 양자화(1/32 화소)만큼만 다름
+    direct = cv2.warpAffine(img, matrix, size, flags=cv2.INTER_LINEAR)
+    assert np.abs(first.astype(np.int16) - direct).max() <= 8
+    for _ in range(3):
+        assert np.array_equal(engine.warp_affine(img, matrix, size, cache_maps=True), first)
+    for key, _, _, _ in engine.memory_candidates():
+        engine.evict_memory(key)
+    assert engine.memory_usage() == 0
+    assert np.array_equal(engine.warp_affine(img, matrix, size, cache_maps=True), first)
+
+
+def test_cached_entries_are_bounded():
+    img = _image(1)
+    engine = WarpEngine(max_entries=2)
+    for angle in (10, 20, 30):
+        matrix, size = get_rotation_matrix(HEIGHT, WIDTH, angle)
+        engine.warp_affine(img, matrix, size, cache_maps=True)
+    assert len(engine.memory_candidates()) == 2
+    matrix, size = get_rotation_matrix(HEIGHT, WIDTH, 10)
+    assert not engine.is_cached(img, matrix, size)
+
+
+@pytest.mark.parametrize('tx, ty', [(40, 25), (-13, 7), (0, -500)])
+@pytest.mark.parametrize('cache_maps', [False, True])
+def test_integer_shift_matches_warp_affine(tx, ty, cache_maps):
+    img = _image(3)
+    matrix = np.float64([[1, 0, tx], [0, 1, ty]])
+    direct = cv2.warpAffine(img, matrix, (WIDTH, HEIGHT), flags=cv2.INTER_LINEAR)
+    engine = WarpEngine()
+    assert np.array_equal(engine.warp_affine(img, matrix, (WIDTH, HEIGHT), cache_maps=cache_maps), direct)
+    assert engine.memory_usage() == 0
+
+
+def test_fixed_geometry_stages_cache_rotation():
+    """편집기 단계는 직접 변환, fixed_geometry 단계(동영상)만 좌표표 remap"""
+    recipe = {'trackbar_values': {'rotation': 30}}
+    editor = pipeline.build_stages_from_recipe(recipe)
+    video = pipeline.build_stages_from_recipe(recipe, fixed_geometry=True)
+    assert 'cache_maps' not in editor[0].params
+    assert video[0].params['cache_maps'] is True
+    img = _image(3)
+    assert np.array_equal(pipeline.run_stages(img, editor), apply_rotation(img, 30))
+    assert np.array_equal(pipeline.run_stages(img, video), apply_rotation(img, 30, cache_maps=True))